@@ -0,0 +1,5 @@
+"""Performance benchmarks for RxPY.
+
+See :mod:`benchmarks.harness` for how benchmarks are written, and run
+``python -m benchmarks --help`` for usage.
+"""
@@ -0,0 +1,58 @@
+"""Command line entry point for the benchmark suite.
+
+Examples:
+    python -m benchmarks run -o base.json
+    python -m benchmarks run -b operators -o head.json
+    python -m benchmarks compare base.json head.json
+    python -m benchmarks imports
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks import bench_import, harness
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmarks")
+    run.add_argument("-b", "--bench", default="", help="only names containing this")
+    run.add_argument("-r", "--repeat", type=int, default=5)
+    run.add_argument("-o", "--output", help="write the results as JSON")
+
+    compare = commands.add_parser("compare", help="compare two result files")
+    compare.add_argument("base")
+    compare.add_argument("head")
+    compare.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=1.1,
+        help="slowdown ratio reported as a regression",
+    )
+
+    imports = commands.add_parser("imports", help="check the import time budget")
+    imports.add_argument("-r", "--repeat", type=int, default=5)
+
+    args = parser.parse_args()
+    if args.command == "imports":
+        return 0 if bench_import.check(args.repeat) else 1
+
+    if args.command == "run":
+        results = harness.run(args.bench, args.repeat)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+        return 0
+
+    ok = harness.compare(
+        harness.load(args.base), harness.load(args.head), args.threshold
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+"""Throughput of operators fed by several producer threads."""
+
+import threading
+
+import reactivex
+from reactivex.subject import Subject
+
+ELEMENTS = 100_000
+
+
+def time_merge_producers(producers: int) -> None:
+    subjects: list[Subject[int]] = [Subject() for _ in range(producers)]
+    reactivex.merge(*subjects).subscribe(lambda _: None)
+    count = ELEMENTS // producers
+
+    def produce(subject: Subject[int]) -> None:
+        for i in range(count):
+            subject.on_next(i)
+        subject.on_completed()
+
+    threads = [threading.Thread(target=produce, args=(s,)) for s in subjects]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+time_merge_producers.params = [1, 8, 16]
+time_merge_producers.param_names = ["producers"]
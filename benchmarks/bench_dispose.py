@@ -0,0 +1,98 @@
+"""Benchmarks for disposing large subscription trees.
+
+Every benchmark builds a tree of ``NODES`` disposables and disposes its
+root. Besides the elapsed time, the peak Python stack depth observed
+while disposing the leaves is tracked.
+"""
+
+import inspect
+from collections.abc import Callable
+
+from reactivex import abc
+from reactivex.disposable import (
+    CompositeDisposable,
+    Disposable,
+    SerialDisposable,
+    SingleAssignmentDisposable,
+)
+
+NODES = 100_000
+
+
+class DepthProbe:
+    """Records the deepest stack seen by the leaf disposables."""
+
+    def __init__(self) -> None:
+        self.base = self.depth()
+        self.peak = 0
+
+    @staticmethod
+    def depth() -> int:
+        frame = inspect.currentframe()
+        depth = 0
+        while frame is not None:
+            depth += 1
+            frame = frame.f_back
+        return depth
+
+    def leaf(self) -> Disposable:
+        def action() -> None:
+            self.peak = max(self.peak, self.depth() - self.base)
+
+        return Disposable(action)
+
+
+def chain(nodes: int, probe: DepthProbe) -> abc.DisposableBase:
+    """A single path alternating between the container disposables."""
+
+    node: abc.DisposableBase = probe.leaf()
+    for i in range(nodes // 3):
+        single = SingleAssignmentDisposable()
+        single.disposable = node
+        serial = SerialDisposable()
+        serial.disposable = single if i % 2 else CompositeDisposable(single)
+        node = serial
+    return node
+
+
+def wide(nodes: int, probe: DepthProbe) -> abc.DisposableBase:
+    """A single composite with all leaves as children."""
+
+    return CompositeDisposable([probe.leaf() for _ in range(nodes)])
+
+
+def bushy(nodes: int, probe: DepthProbe) -> abc.DisposableBase:
+    """A balanced binary tree of composites."""
+
+    level: list[abc.DisposableBase] = [probe.leaf() for _ in range(nodes // 2)]
+    while len(level) > 1:
+        pairs = zip(level[::2], level[1::2])
+        level = [CompositeDisposable(left, right) for left, right in pairs] + (
+            level[-1:] if len(level) % 2 else []
+        )
+    return level[0]
+
+
+TREES: dict[str, Callable[[int, DepthProbe], abc.DisposableBase]] = {
+    "chain": chain,
+    "wide": wide,
+    "bushy": bushy,
+}
+
+
+class Dispose:
+    params = list(TREES)
+    param_names = ["tree"]
+
+    def setup(self, tree: str) -> None:
+        self.probe = DepthProbe()
+        self.root = TREES[tree](NODES, self.probe)
+
+    def time_dispose(self, tree: str) -> None:
+        self.root.dispose()
+
+    def track_peak_stack_depth(self, tree: str) -> int:
+        self.root.dispose()
+        return self.probe.peak
+
+    track_peak_stack_depth.unit = "frames"  # type: ignore[attr-defined]
@@ -0,0 +1,122 @@
+"""Cost of importing the package in a fresh interpreter.
+
+Timings come from ``python -X importtime``, taking the best of several
+runs after a warm-up run has written the bytecode cache. The
+``imports`` command of the runner checks them against a budget::
+
+    python -m benchmarks imports
+"""
+
+import fnmatch
+import os
+import subprocess
+import sys
+import tempfile
+
+MODULES = ["reactivex", "reactivex.operators"]
+
+BUDGET_MS = {"reactivex": 80.0, "reactivex.operators": 120.0}
+"""Generous limits on the cumulative import time, to catch gross
+regressions such as an eager import of a heavy dependency."""
+
+FORBIDDEN = {
+    "reactivex": ["asyncio", "concurrent.futures", "reactivex.operators"],
+    "reactivex.operators": [
+        "asyncio",
+        "concurrent.futures",
+        "reactivex.operators._*",
+    ],
+}
+"""Modules that importing the package must not pull in, as shell-style
+patterns. Operator implementations are only imported when an operator
+is first used."""
+
+_CACHE = tempfile.mkdtemp(prefix="rx-bench-pycache-")
+
+
+def _import(module: str) -> list[str]:
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=_CACHE)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return result.stderr.splitlines()
+
+
+def _cumulative(lines: list[str], module: str) -> float:
+    """Returns the cumulative import time of a module in milliseconds."""
+
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1000
+    raise ValueError(f"{module} not found in the import time output")
+
+
+def _imported(lines: list[str]) -> set[str]:
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in lines
+        if line.startswith("import time:") and line.count("|") == 2
+    }
+
+
+def measure(module: str, repeat: int = 5) -> tuple[float, set[str]]:
+    """Measures the import of a module in fresh interpreters.
+
+    Returns:
+        The best cumulative import time in milliseconds, and the names
+        of all modules imported.
+    """
+
+    _import(module)
+    runs = [_import(module) for _ in range(repeat)]
+    best = min(_cumulative(lines, module) for lines in runs)
+    return best, _imported(runs[0])
+
+
+def check(repeat: int = 5) -> bool:
+    """Prints the import times and checks them against the budget.
+
+    Returns:
+        True if every module is within its budget and imports none of
+        its forbidden modules.
+    """
+
+    ok = True
+    for module in MODULES:
+        milliseconds, imported = measure(module, repeat)
+        budget = BUDGET_MS[module]
+        status = "ok" if milliseconds <= budget else "OVER BUDGET"
+        ok = ok and milliseconds <= budget
+        print(f"{module:<30} {milliseconds:8.1f} ms (budget {budget:.0f} ms) {status}")
+
+        for pattern in FORBIDDEN[module]:
+            for name in sorted(fnmatch.filter(imported, pattern)):
+                print(f"{module:<30} imports {name}")
+                ok = False
+    return ok
+
+
+def track_import_time(module: str) -> float:
+    return measure(module)[0]
+
+
+track_import_time.params = MODULES
+track_import_time.param_names = ["module"]
+track_import_time.unit = "ms"
+
+
+def track_imported_modules(module: str) -> int:
+    return len(measure(module, repeat=1)[1])
+
+
+track_imported_modules.params = MODULES
+track_imported_modules.param_names = ["module"]
+track_imported_modules.unit = "modules"
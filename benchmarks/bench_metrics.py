@@ -0,0 +1,29 @@
+"""Overhead of the pipeline metrics.
+
+The same three operator pipeline is assembled with and without
+instrumentation.
+"""
+
+from reactivex import metrics
+from reactivex import operators as ops
+
+from .common import drain, source
+
+
+def time_pipeline(instrumented: bool) -> None:
+    registry = metrics.MetricsRegistry()
+    if instrumented:
+        metrics.enable(registry=registry)
+    try:
+        xs = source().pipe(
+            ops.map(lambda x: x + 1),
+            ops.filter(lambda x: x % 2 == 0),
+            ops.scan(lambda acc, x: acc + x, 0),
+        )
+    finally:
+        metrics.disable()
+    drain(xs)
+
+
+time_pipeline.params = [False, True]
+time_pipeline.param_names = ["instrumented"]
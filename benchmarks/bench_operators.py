@@ -0,0 +1,94 @@
+"""Per-element throughput of the core operators.
+
+Every benchmark pushes ``N`` elements through a single operator.
+Time-based operators run in virtual time.
+"""
+
+import reactivex
+from reactivex import operators as ops
+
+from .common import N, drain, drain_timed, source
+
+
+def time_map() -> None:
+    drain(source().pipe(ops.map(lambda x: x + 1)))
+
+
+def time_filter() -> None:
+    drain(source().pipe(ops.filter(lambda x: x % 2 == 0)))
+
+
+def time_scan() -> None:
+    drain(source().pipe(ops.scan(lambda acc, x: acc + x, 0)))
+
+
+def time_flat_map() -> None:
+    drain(source(N // 10).pipe(ops.flat_map(lambda x: source(10))))
+
+
+def time_flat_map_scalar() -> None:
+    drain(source(N // 10).pipe(ops.flat_map(lambda x: reactivex.just(x))))
+
+
+def time_concat_map_scalar() -> None:
+    drain(source(N // 10).pipe(ops.concat_map(lambda x: reactivex.just(x))))
+
+
+def time_merge() -> None:
+    drain(reactivex.merge(*(source(N // 10) for _ in range(10))))
+
+
+def time_zip() -> None:
+    drain(reactivex.zip(source(), source()))
+
+
+def time_group_by() -> None:
+    drain(source().pipe(ops.group_by(lambda x: x % 100), ops.merge_all()))
+
+
+def time_buffer_with_count() -> None:
+    drain(source().pipe(ops.buffer_with_count(100)))
+
+
+def time_buffer_with_count_skip() -> None:
+    drain(source().pipe(ops.buffer_with_count(100, 10)))
+
+
+def time_window_with_count() -> None:
+    drain(source().pipe(ops.window_with_count(100), ops.merge_all()))
+
+
+def time_buffer_with_time() -> None:
+    drain_timed(lambda scheduler: ops.buffer_with_time(1.0, scheduler=scheduler))
+
+
+def time_buffer_with_time_shift() -> None:
+    drain_timed(lambda scheduler: ops.buffer_with_time(2.0, 1.0, scheduler))
+
+
+def time_buffer_with_time_or_count() -> None:
+    drain_timed(lambda scheduler: ops.buffer_with_time_or_count(1.0, 50, scheduler))
+
+
+def time_window_with_time() -> None:
+    drain_timed(
+        lambda scheduler: reactivex.compose(
+            ops.window_with_time(1.0, scheduler=scheduler), ops.merge_all()
+        )
+    )
+
+
+def time_distinct() -> None:
+    drain(source().pipe(ops.distinct(lambda x: x % 1000)))
+
+
+def time_take_last() -> None:
+    drain(source().pipe(ops.take_last(N // 2)))
+
+
+def time_skip_last() -> None:
+    drain(source().pipe(ops.skip_last(N // 2)))
+
+
+def time_sequence_equal() -> None:
+    drain(source().pipe(ops.sequence_equal(source())))
@@ -0,0 +1,61 @@
+"""Cost of building and subscribing to a pipeline once per request.
+
+Every request builds a 15 operator pipeline on a fresh single element
+source and subscribes to it, either with ``pipe`` or with a template
+made by :func:`reactivex.compile`.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import reactivex
+from reactivex import Observable
+from reactivex import operators as ops
+
+from .common import drain, source
+
+REQUESTS = 10_000
+
+
+def _operators() -> list[Callable[[Observable[Any]], Observable[Any]]]:
+    return [
+        ops.map(lambda x: x + 1),
+        ops.filter(lambda x: x >= 0),
+        ops.map(lambda x: x * 2),
+        ops.do_action(lambda x: None),
+        ops.default_if_empty(0),
+        ops.map(lambda x: x - 1),
+        ops.filter(lambda x: x != -1),
+        ops.distinct_until_changed(),
+        ops.scan(lambda acc, x: acc + x, 0),
+        ops.take(10),
+        ops.skip(0),
+        ops.map(str),
+        ops.start_with("start"),
+        ops.take_while(lambda x: True),
+        ops.to_list(),
+    ]
+
+
+def time_pipe_per_request() -> None:
+    for _ in range(REQUESTS):
+        drain(source(1).pipe(*_operators()))
+
+
+def time_compiled_per_request() -> None:
+    template = reactivex.compile(*_operators())
+    for _ in range(REQUESTS):
+        drain(template(source(1)))
+
+
+def time_assemble_pipe() -> None:
+    xs = source(1)
+    for _ in range(REQUESTS):
+        xs.pipe(*_operators())
+
+
+def time_assemble_compiled() -> None:
+    xs = source(1)
+    template = reactivex.compile(*_operators())
+    for _ in range(REQUESTS):
+        template(xs)
@@ -0,0 +1,99 @@
+"""Dispatch rate of the schedulers.
+
+Every benchmark schedules ``ACTIONS`` actions and waits until all of
+them have run.
+"""
+
+import asyncio
+import threading
+from typing import Any
+
+from reactivex import abc
+from reactivex.scheduler import (
+    CurrentThreadScheduler,
+    EventLoopScheduler,
+    ThreadPoolScheduler,
+    TimeoutScheduler,
+)
+from reactivex.scheduler.eventloop import AsyncIOScheduler
+
+ACTIONS = 10_000
+
+
+class Countdown:
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+
+    def action(self, scheduler: abc.SchedulerBase, state: Any = None) -> None:
+        with self.lock:
+            self.count -= 1
+            if not self.count:
+                self.done.set()
+
+
+def time_current_thread() -> None:
+    countdown = Countdown(ACTIONS)
+    scheduler = CurrentThreadScheduler()
+
+    def schedule_all(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+        for _ in range(ACTIONS):
+            scheduler.schedule(countdown.action)
+
+    scheduler.schedule(schedule_all)
+    countdown.done.wait()
+
+
+class EventLoop:
+    def setup(self) -> None:
+        self.scheduler = EventLoopScheduler()
+
+    def teardown(self) -> None:
+        self.scheduler.dispose()
+
+    def time_event_loop(self) -> None:
+        countdown = Countdown(ACTIONS)
+        for _ in range(ACTIONS):
+            self.scheduler.schedule(countdown.action)
+        countdown.done.wait()
+
+
+class ThreadPool:
+    def setup(self) -> None:
+        self.scheduler = ThreadPoolScheduler(4)
+
+    def teardown(self) -> None:
+        self.scheduler.executor.shutdown()
+
+    def time_thread_pool(self) -> None:
+        countdown = Countdown(ACTIONS)
+        for _ in range(ACTIONS):
+            self.scheduler.schedule(countdown.action)
+        countdown.done.wait()
+
+
+def time_timeout() -> None:
+    # Every action starts a thread, so fewer actions are scheduled
+    countdown = Countdown(ACTIONS // 10)
+    scheduler = TimeoutScheduler.singleton()
+    for _ in range(ACTIONS // 10):
+        scheduler.schedule(countdown.action)
+    countdown.done.wait()
+
+
+def time_asyncio() -> None:
+    loop = asyncio.new_event_loop()
+    countdown = Countdown(ACTIONS)
+
+    async def schedule_all() -> None:
+        scheduler = AsyncIOScheduler(loop)
+        for _ in range(ACTIONS):
+            scheduler.schedule(countdown.action)
+        while not countdown.done.is_set():
+            await asyncio.sleep(0)
+
+    try:
+        loop.run_until_complete(schedule_all())
+    finally:
+        loop.close()
@@ -0,0 +1,18 @@
+"""Subject fan-out to many subscribers."""
+
+from reactivex.subject import Subject
+
+ELEMENTS = 100_000
+
+
+def time_subject_fan_out(subscribers: int) -> None:
+    subject: Subject[int] = Subject()
+    for _ in range(subscribers):
+        subject.subscribe(lambda _: None)
+
+    for i in range(ELEMENTS // subscribers):
+        subject.on_next(i)
+
+
+time_subject_fan_out.params = [1, 10, 100, 1000]
+time_subject_fan_out.param_names = ["subscribers"]
@@ -0,0 +1,45 @@
+"""Cost of subscribing to and disposing operator chains."""
+
+import tracemalloc
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.subject import Subject
+
+SUBSCRIPTIONS = 10_000
+
+
+def _chain(length: int) -> reactivex.Observable[int]:
+    xs: reactivex.Observable[int] = Subject()
+    for _ in range(length):
+        xs = xs.pipe(ops.map(lambda x: x))
+    return xs
+
+
+def time_subscribe_dispose(length: int) -> None:
+    xs = _chain(length)
+    for _ in range(SUBSCRIPTIONS // length):
+        xs.subscribe().dispose()
+
+
+time_subscribe_dispose.params = [1, 10, 50]
+time_subscribe_dispose.param_names = ["chain_length"]
+
+
+def track_memory_per_subscription(length: int) -> float:
+    xs = _chain(length)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        subscriptions = [xs.subscribe() for _ in range(1000)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del subscriptions
+    return (after - before) / 1000
+
+
+track_memory_per_subscription.params = [1, 10]
+track_memory_per_subscription.param_names = ["chain_length"]
+track_memory_per_subscription.unit = "bytes"
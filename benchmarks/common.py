@@ -0,0 +1,68 @@
+from collections.abc import Callable
+from typing import Any
+
+import reactivex
+from reactivex import Observable, abc
+from reactivex.disposable import Disposable
+from reactivex.scheduler import HistoricalScheduler
+
+N = 100_000
+"""Number of elements pushed through operators by the throughput
+benchmarks."""
+
+
+def source(count: int = N) -> Observable[int]:
+    """A synchronous source emitting ``count`` integers.
+
+    Unlike ``reactivex.range`` it does not schedule every element, so the
+    measurements are dominated by the operators under test.
+    """
+
+    def subscribe(
+        observer: abc.ObserverBase[int], scheduler: abc.SchedulerBase | None = None
+    ) -> abc.DisposableBase:
+        for i in range(count):
+            observer.on_next(i)
+        observer.on_completed()
+        return Disposable()
+
+    return reactivex.create(subscribe)
+
+
+def drain(xs: Observable[Any]) -> None:
+    """Subscribes to ``xs`` and discards all elements."""
+
+    xs.subscribe(lambda _: None)
+
+
+def drain_timed(
+    operator: Callable[
+        [abc.SchedulerBase], Callable[[Observable[int]], Observable[Any]]
+    ],
+    per_tick: int = 100,
+) -> None:
+    """Pushes ``N`` elements through a time-based operator in virtual
+    time.
+
+    The source emits ``per_tick`` elements every virtual second. The
+    operator is created with the same virtual time scheduler, so its
+    timers fire without waiting on the wall clock.
+    """
+
+    scheduler = HistoricalScheduler()
+
+    def subscribe(
+        observer: abc.ObserverBase[int], _: abc.SchedulerBase | None = None
+    ) -> abc.DisposableBase:
+        def emit(scheduler: abc.SchedulerBase, start: Any = 0) -> None:
+            for i in range(start, start + per_tick):
+                observer.on_next(i)
+            if start + per_tick < N:
+                scheduler.schedule_relative(1.0, emit, start + per_tick)
+            else:
+                observer.on_completed()
+
+        return scheduler.schedule_relative(1.0, emit, 0)
+
+    drain(reactivex.create(subscribe).pipe(operator(scheduler)))
+    scheduler.start()
@@ -0,0 +1,192 @@
+"""Minimal benchmark runner using the asv conventions.
+
+Benchmarks live in ``benchmarks/bench_*.py`` modules. Functions, or
+methods of classes, named ``time_*`` are timed and functions named
+``track_*`` return a value to record, with an optional ``unit``
+attribute. A ``params`` attribute, with ``param_names``, runs the
+benchmark once for every combination of parameters. ``setup`` and
+``teardown`` functions of the module or class are called around every
+measurement with the same parameters.
+
+The same files can be run by asv, but this runner only needs the
+standard library and writes plain JSON that can be compared between
+commits.
+"""
+
+import gc
+import importlib
+import inspect
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+BENCHMARK_DIR = Path(__file__).parent
+
+
+@dataclass
+class Benchmark:
+    name: str
+    func: Callable[..., Any]
+    owner: Any
+    params: tuple[Any, ...]
+
+    @property
+    def kind(self) -> str:
+        return self.func.__name__.split("_", 1)[0]
+
+    def _call(self, name: str) -> None:
+        hook = getattr(self.owner, name, None)
+        if callable(hook):
+            hook(*self.params)
+
+    def measure(self, repeat: int) -> dict[str, Any]:
+        if self.kind == "track":
+            self._call("setup")
+            try:
+                value = self.func(*self.params)
+            finally:
+                self._call("teardown")
+            return {
+                "kind": "track",
+                "unit": getattr(self.func, "unit", "unit"),
+                "value": value,
+            }
+
+        samples: list[float] = []
+        for _ in range(repeat):
+            self._call("setup")
+            gc.collect()
+            try:
+                start = time.perf_counter()
+                self.func(*self.params)
+                samples.append(time.perf_counter() - start)
+            finally:
+                self._call("teardown")
+
+        return {
+            "kind": "time",
+            "unit": "seconds",
+            "value": min(samples),
+            "median": statistics.median(samples),
+            "samples": samples,
+        }
+
+
+def _param_sets(func: Callable[..., Any], owner: Any) -> list[tuple[Any, ...]]:
+    params = getattr(func, "params", None) or getattr(owner, "params", None)
+    if params is None:
+        return [()]
+    if not isinstance(params[0], (list, tuple)):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def _is_benchmark(name: str) -> bool:
+    return name.startswith(("time_", "track_"))
+
+
+def _candidates(module: ModuleType) -> Iterator[tuple[str, Any, Any]]:
+    for name, value in vars(module).items():
+        if getattr(value, "__module__", None) != module.__name__:
+            continue
+
+        if inspect.isfunction(value) and _is_benchmark(name):
+            yield name, value, module
+        elif inspect.isclass(value) and any(map(_is_benchmark, dir(value))):
+            instance = value()
+            for attr in filter(_is_benchmark, dir(value)):
+                yield f"{value.__name__}.{attr}", getattr(instance, attr), instance
+
+
+def discover(pattern: str = "") -> list[Benchmark]:
+    """Finds every benchmark whose full name contains ``pattern``."""
+
+    if str(BENCHMARK_DIR.parent) not in sys.path:
+        sys.path.insert(0, str(BENCHMARK_DIR.parent))
+
+    benchmarks: list[Benchmark] = []
+    for path in sorted(BENCHMARK_DIR.glob("bench_*.py")):
+        module = importlib.import_module(f"benchmarks.{path.stem}")
+        for name, func, owner in _candidates(module):
+            for params in _param_sets(func, owner):
+                full_name = f"{path.stem}.{name}"
+                if params:
+                    full_name += "(" + ", ".join(map(repr, params)) + ")"
+                if pattern in full_name:
+                    benchmarks.append(Benchmark(full_name, func, owner, params))
+    return benchmarks
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=BENCHMARK_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(pattern: str = "", repeat: int = 5) -> dict[str, Any]:
+    """Runs the benchmarks and returns the results as a dictionary."""
+
+    results: dict[str, Any] = {}
+    for benchmark in discover(pattern):
+        result = benchmark.measure(repeat)
+        results[benchmark.name] = result
+        print(f"{benchmark.name:<70} {result['value']:.6g} {result['unit']}")
+
+    return {
+        "meta": {
+            "commit": _commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(base: dict[str, Any], head: dict[str, Any], threshold: float) -> bool:
+    """Prints the change of every benchmark present in both results.
+
+    Returns:
+        True if no timing got slower by more than ``threshold``.
+    """
+
+    ok = True
+    for name, result in head["results"].items():
+        previous = base["results"].get(name)
+        if previous is None or not previous["value"] or result["value"] is None:
+            continue
+
+        ratio = result["value"] / previous["value"]
+        flag = ""
+        if result["kind"] == "time" and ratio > threshold:
+            flag = "  REGRESSION"
+            ok = False
+        print(
+            f"{name:<70} {previous['value']:.6g} -> {result['value']:.6g} "
+            f"{result['unit']} ({ratio:.2f}x){flag}"
+        )
+    return ok
+
+
+def load(path: str) -> dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
@@ -1,10 +1,14 @@
 # pylint: disable=too-many-lines,redefined-outer-name,redefined-builtin
 
+# Annotations are not evaluated, so that importing reactivex does not
+# spend time building hundreds of type expressions
+from __future__ import annotations
+
 from collections.abc import Callable, Iterable, Mapping
 from typing import (
     Any,
+    Literal,
     TypeVar,
-    Union,
     overload,
 )
 
@@ -14,7 +18,7 @@ from .internal.utils import alias
 from .notification import Notification
 from .observable import ConnectableObservable, GroupedObservable, Observable
 from .observer import Observer
-from .pipe import compose, pipe
+from .pipe import compile, compose, pipe
 from .subject import Subject
 
 _T = TypeVar("_T")
@@ -242,6 +246,10 @@ def concat(*sources: Observable[_T]) -> Observable[_T]:
         [     concat()     ]
         ---1--2--3----6--8-|
 
+    A source created by ``just``, ``empty``, ``throw`` or ``of`` without
+    a scheduler is emitted when its turn comes, without being
+    subscribed to. Only the step to the next source is scheduled.
+
     Examples:
         >>> res = reactivex.concat(xs, ys, zs)
 
@@ -288,9 +296,7 @@ def concat_with_iterable(sources: Iterable[Observable[_T]]) -> Observable[_T]:
 
 
 def defer(
-    factory: Callable[
-        [abc.SchedulerBase], Union[Observable[_T], "typing.AnyFuture[_T]"]
-    ],
+    factory: Callable[[abc.SchedulerBase], Observable[_T] | typing.AnyFuture[_T]],
 ) -> Observable[_T]:
     """Returns an observable sequence that invokes the specified
     factory function whenever a new observer subscribes.
@@ -497,7 +503,7 @@ def from_callback(
     return from_callback_(func, mapper)
 
 
-def from_future(future: "typing.AnyFuture[_T]") -> Observable[_T]:
+def from_future(future: typing.AnyFuture[_T]) -> Observable[_T]:
     """Converts a Future to an Observable sequence
 
     .. marble::
@@ -779,8 +785,8 @@ def hot(
 
 def if_then(
     condition: Callable[[], bool],
-    then_source: Union[Observable[_T], "typing.AnyFuture[_T]"],
-    else_source: Union[None, Observable[_T], "typing.AnyFuture[_T]"] = None,
+    then_source: Observable[_T] | typing.AnyFuture[_T],
+    else_source: None | Observable[_T] | typing.AnyFuture[_T] = None,
 ) -> Observable[_T]:
     """Determines whether an observable collection contains values.
 
@@ -917,11 +923,9 @@ def of(*args: _T) -> Observable[_T]:
 
 
 def on_error_resume_next(
-    *sources: Union[
-        Observable[_T],
-        "typing.AnyFuture[_T]",
-        Callable[[Exception | None], Observable[_T]],
-    ],
+    *sources: Observable[_T]
+    | typing.AnyFuture[_T]
+    | Callable[[Exception | None], Observable[_T]],
 ) -> Observable[_T]:
     """Continues an observable sequence that is terminated normally or
     by an exception with the next observable sequence.
@@ -1087,7 +1091,7 @@ def start(
     return start_(func, scheduler)
 
 
-def start_async(function_async: Callable[[], "typing.AnyFuture[_T]"]) -> Observable[_T]:
+def start_async(function_async: Callable[[], typing.AnyFuture[_T]]) -> Observable[_T]:
     """Invokes the asynchronous function, surfacing the result through
     an observable sequence.
 
@@ -1267,7 +1271,11 @@ def with_latest_from(*sources: Observable[Any]) -> Observable[tuple[Any, ...]]:
     return with_latest_from_(*sources)
 
 
-def zip(*args: Observable[Any]) -> Observable[tuple[Any, ...]]:
+def zip(
+    *args: Observable[Any],
+    max_backlog: int | None = None,
+    overflow: Literal["error", "drop_newest", "drop_oldest"] = "error",
+) -> Observable[tuple[Any, ...]]:
     """Merges the specified observable sequences into one observable
     sequence by creating a :class:`tuple` whenever all of the
     observable sequences have produced an element at a corresponding
@@ -1284,8 +1292,21 @@ def zip(*args: Observable[Any]) -> Observable[tuple[Any, ...]]:
     Example:
         >>> res = rx.zip(obs1, obs2)
 
+    Elements are queued per source until every source has produced an
+    element. If one source runs ahead of the others, ``max_backlog``
+    bounds the number of elements queued for it.
+
     Args:
         args: Observable sources to zip.
+        max_backlog: [Optional] Maximum number of elements queued for
+            each source. Unbounded by default.
+        overflow: [Optional] What to do when an element arrives and the
+            queue of its source is full. ``"error"`` terminates the
+            sequence with a :class:`QueueOverflowError
+            <reactivex.internal.exceptions.QueueOverflowError>`,
+            ``"drop_newest"`` drops the arriving element and
+            ``"drop_oldest"`` drops the oldest queued element of that
+            source.
 
     Returns:
         An observable sequence containing the result of combining
@@ -1293,7 +1314,7 @@ def zip(*args: Observable[Any]) -> Observable[tuple[Any, ...]]:
     """
     from .observable.zip import zip_
 
-    return zip_(*args)
+    return zip_(*args, max_backlog=max_backlog, overflow=overflow)
 
 
 __all__ = [
@@ -1304,6 +1325,7 @@ __all__ = [
     "catch_with_iterable",
     "create",
     "combine_latest",
+    "compile",
     "compose",
     "concat",
     "concat_with_iterable",
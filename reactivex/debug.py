@@ -0,0 +1,267 @@
+"""Assembly tracking for debugging and profiling pipelines.
+
+Once enabled, every operator applied in a pipe records the user's
+source location where it was assembled:
+
+* Errors emitted by the operator get the location attached, as an
+  exception note and through :func:`assembly_site`.
+* Elements pass through a small forwarding function named after the
+  operator, with the assembly location as its file and line. Profilers
+  such as cProfile and py-spy therefore report the time spent in each
+  stage under the ``pipe()`` call that assembled it, and
+  :func:`profile_stats` aggregates cProfile results by stage.
+
+Pipelines assembled while tracking is disabled are not touched.
+
+Examples:
+    >>> from reactivex import debug
+    >>> debug.enable()
+    >>> xs = source.pipe(ops.map(parse))
+"""
+
+import dis
+import inspect
+import os
+import pstats
+import sys
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import CellType, CodeType, FunctionType
+from typing import Any, TypeVar, cast
+
+import reactivex
+from reactivex import Observable, abc
+from reactivex.internal import assembly
+
+_T = TypeVar("_T")
+
+_PACKAGE_DIR = os.path.dirname(reactivex.__file__) + os.sep
+_ATTRIBUTE = "__rx_assembly_site__"
+
+
+@dataclass(frozen=True)
+class AssemblySite:
+    """Source location where an operator was applied.
+
+    Attributes:
+        operator: Name of the operator, e.g. ``"map"``.
+        stage: Position of the operator in its pipe.
+        filename: File of the ``pipe()`` call.
+        lineno: Line of the ``pipe()`` call.
+        function: Function containing the ``pipe()`` call.
+        line: Source code of the line, if available.
+    """
+
+    operator: str
+    stage: int
+    filename: str
+    lineno: int
+    function: str
+    line: str
+
+    @property
+    def tag(self) -> str:
+        """Name given to the stage in profiler output."""
+        return f"rx.{self.operator}[{self.stage}]"
+
+    def __str__(self) -> str:
+        text = (
+            f"{self.operator} (stage {self.stage}) assembled at "
+            f'File "{self.filename}", line {self.lineno}, in {self.function}'
+        )
+        if self.line:
+            text += f"\n    {self.line}"
+        return text
+
+
+def _capture(name: str, stage: int) -> AssemblySite | None:
+    frame = inspect.currentframe()
+    while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+        frame = frame.f_back
+    if frame is None:
+        return None
+
+    info = inspect.getframeinfo(frame, context=1)
+    line = info.code_context[0].strip() if info.code_context else ""
+    return AssemblySite(name, stage, info.filename, info.lineno, info.function, line)
+
+
+def _forwarder(observer: abc.ObserverBase[Any]) -> Callable[[Any], None]:
+    def forward(value: Any) -> None:
+        observer.on_next(value)
+
+    return forward
+
+
+_FORWARD = _forwarder(cast(abc.ObserverBase[Any], None)).__code__
+_FORWARD_OFFSET = (
+    max(line or 0 for _, line in dis.findlinestarts(_FORWARD)) - _FORWARD.co_firstlineno
+)
+
+_lock = threading.Lock()
+_codes: dict[AssemblySite, CodeType] = {}
+_sites: dict[tuple[str, int, str], AssemblySite] = {}
+
+
+def _code_for(site: AssemblySite) -> CodeType:
+    with _lock:
+        code = _codes.get(site)
+        if code is None:
+            changes: dict[str, Any] = {
+                "co_name": site.tag,
+                "co_filename": site.filename,
+                "co_firstlineno": max(site.lineno - _FORWARD_OFFSET, 1),
+            }
+            if sys.version_info >= (3, 11):
+                changes["co_qualname"] = site.tag
+            code = _codes[site] = _FORWARD.replace(**changes)
+            _sites[(code.co_filename, code.co_firstlineno, code.co_name)] = site
+        return code
+
+
+def _mark(error: Exception, site: AssemblySite | None) -> None:
+    try:
+        setattr(error, _ATTRIBUTE, site)
+    except AttributeError:
+        return
+
+    if site is not None and sys.version_info >= (3, 11):
+        error.add_note(f"Operator {site}")
+
+
+def _track_input(source: Observable[_T], site: AssemblySite) -> Observable[_T]:
+    code = _code_for(site)
+
+    def subscribe(
+        observer: abc.ObserverBase[_T], scheduler: abc.SchedulerBase | None = None
+    ) -> abc.DisposableBase:
+        forward = FunctionType(
+            code, _forwarder.__globals__, None, None, (CellType(observer),)
+        )
+
+        def on_error(error: Exception) -> None:
+            # Errors from upstream are not caused by this operator
+            if not hasattr(error, _ATTRIBUTE):
+                _mark(error, None)
+            observer.on_error(error)
+
+        return source.subscribe(
+            forward, on_error, observer.on_completed, scheduler=scheduler
+        )
+
+    return Observable(subscribe)
+
+
+def _track_output(source: Observable[_T], site: AssemblySite) -> Observable[_T]:
+    def subscribe(
+        observer: abc.ObserverBase[_T], scheduler: abc.SchedulerBase | None = None
+    ) -> abc.DisposableBase:
+        def on_error(error: Exception) -> None:
+            if not hasattr(error, _ATTRIBUTE):
+                _mark(error, site)
+            observer.on_error(error)
+
+        return source.subscribe(
+            observer.on_next, on_error, observer.on_completed, scheduler=scheduler
+        )
+
+    return Observable(subscribe)
+
+
+def _hook(name: str, stage: int, source: Any, apply: Callable[[Any], Any]) -> Any:
+    site = _capture(name, stage)
+    if site is None:
+        return apply(source)
+
+    if assembly.is_plain_observable(source):
+        source = _track_input(source, site)
+    result = apply(source)
+    if assembly.is_plain_observable(result):
+        result = _track_output(result, site)
+    return result
+
+
+def enable() -> None:
+    """Tracks the assembly of every pipeline assembled from now on."""
+
+    assembly.add_hook(_hook)
+
+
+def disable() -> None:
+    """Stops tracking newly assembled pipelines.
+
+    Pipelines that were already tracked keep their locations.
+    """
+
+    assembly.remove_hook(_hook)
+
+
+def assembly_site(error: BaseException) -> AssemblySite | None:
+    """Returns where the operator that emitted an error was assembled.
+
+    Args:
+        error: Error received by an observer.
+
+    Returns:
+        The site of the tracked operator the error originated in, or
+        None if it was raised upstream of all tracked operators.
+    """
+
+    return getattr(error, _ATTRIBUTE, None)
+
+
+@dataclass(frozen=True)
+class SiteStats:
+    """Profiler statistics of one tracked operator.
+
+    Attributes:
+        site: Where the operator was assembled.
+        calls: Number of elements the operator handled.
+        cumulative: Seconds spent handling the elements, including any
+            synchronous work downstream of the operator.
+    """
+
+    site: AssemblySite
+    calls: int
+    cumulative: float
+
+
+def profile_stats(stats: pstats.Stats) -> list[SiteStats]:
+    """Aggregates cProfile statistics by tracked operator.
+
+    Examples:
+        >>> profiler = cProfile.Profile()
+        >>> profiler.runcall(xs.run)
+        >>> for entry in debug.profile_stats(pstats.Stats(profiler)):
+        ...     print(entry.cumulative, entry.site)
+
+    Args:
+        stats: Statistics of a profile of tracked pipelines.
+
+    Returns:
+        The statistics of every tracked operator seen by the profiler,
+        slowest first.
+    """
+
+    raw = cast(dict[tuple[str, int, str], tuple[Any, ...]], getattr(stats, "stats"))
+    with _lock:
+        sites = dict(_sites)
+
+    result: list[SiteStats] = []
+    for key, (_, calls, _, cumulative, _) in raw.items():
+        site = sites.get(key)
+        if site is not None:
+            result.append(SiteStats(site, calls, cumulative))
+    result.sort(key=lambda entry: entry.cumulative, reverse=True)
+    return result
+
+
+__all__ = [
+    "AssemblySite",
+    "SiteStats",
+    "assembly_site",
+    "disable",
+    "enable",
+    "profile_stats",
+]
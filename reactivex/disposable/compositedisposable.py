@@ -1,23 +1,73 @@
 from threading import RLock
-from typing import Any
+from typing import Any, cast
 
 from reactivex import abc
+from reactivex.internal import dispose_all
 
 
 class CompositeDisposable(abc.DisposableBase):
     """Represents a group of disposable resources that are disposed
-    together"""
+    together.
+
+    Disposables are disposed in the order they were added. They are
+    tracked by identity, so add, remove and contains take constant time
+    and disposables do not need to be hashable.
+
+    The ``disposable`` attribute returns a copy of the disposables in
+    the group. Assigning a list to it replaces them, but the returned
+    list must not be mutated to change the group. Use :meth:`add` and
+    :meth:`remove` for that.
+    """
 
     def __init__(self, *args: Any):
+        items: list[abc.DisposableBase]
         if args and isinstance(args[0], list):
-            self.disposable: list[abc.DisposableBase] = args[0]
+            items = cast(list[abc.DisposableBase], args[0])
         else:
-            self.disposable = list(args)
+            items = list(args)
+
+        # Maps an insertion sequence number to each disposable, in
+        # insertion order, and the id of each disposable to its sequence
+        # numbers, so that remove and contains are O(1).
+        self._items: dict[int, abc.DisposableBase] = {}
+        self._index: dict[int, list[int]] = {}
+        self._seq = 0
+        for item in items:
+            self._insert(item)
 
         self.is_disposed = False
         self.lock = RLock()
         super().__init__()
 
+    def _insert(self, item: abc.DisposableBase) -> None:
+        seq = self._seq
+        self._seq += 1
+        self._items[seq] = item
+        seqs = self._index.get(id(item))
+        if seqs is None:
+            self._index[id(item)] = [seq]
+        else:
+            seqs.append(seq)
+
+    def _take_all(self) -> list[abc.DisposableBase]:
+        current = list(self._items.values())
+        self._items = {}
+        self._index = {}
+        return current
+
+    @property
+    def disposable(self) -> list[abc.DisposableBase]:
+        """A copy of the disposables in the group, in insertion order."""
+        return self.to_list()
+
+    @disposable.setter
+    def disposable(self, items: list[abc.DisposableBase]) -> None:
+        with self.lock:
+            self._items = {}
+            self._index = {}
+            for item in items:
+                self._insert(item)
+
     def add(self, item: abc.DisposableBase) -> None:
         """Adds a disposable to the CompositeDisposable or disposes the
         disposable if the CompositeDisposable is disposed
@@ -30,7 +80,7 @@ class CompositeDisposable(abc.DisposableBase):
             if self.is_disposed:
                 should_dispose = True
             else:
-                self.disposable.append(item)
+                self._insert(item)
 
         if should_dispose:
             item.dispose()
@@ -44,8 +94,11 @@ class CompositeDisposable(abc.DisposableBase):
 
         should_dispose = False
         with self.lock:
-            if item in self.disposable:
-                self.disposable.remove(item)
+            seqs = self._index.get(id(item))
+            if seqs is not None:
+                del self._items[seqs.pop(0)]
+                if not seqs:
+                    del self._index[id(item)]
                 should_dispose = True
 
         if should_dispose:
@@ -55,18 +108,23 @@ class CompositeDisposable(abc.DisposableBase):
 
     def dispose(self) -> None:
         """Disposes all disposable in the group and removes them from
-        the group."""
+        the group.
+
+        Disposal is iterative. When this is called while another
+        container on the same thread is disposing its children, the
+        disposables of this group are queued and disposed by that outer
+        call before it returns, not before this call returns. If a
+        disposable raises, the others are still disposed and the first
+        exception is raised afterwards."""
 
         if self.is_disposed:
             return
 
         with self.lock:
             self.is_disposed = True
-            current_disposable = self.disposable
-            self.disposable = []
+            current_disposable = self._take_all()
 
-        for disp in current_disposable:
-            disp.dispose()
+        dispose_all(*current_disposable)
 
     def clear(self) -> None:
         """Removes and disposes all disposable from the
@@ -74,11 +132,9 @@ class CompositeDisposable(abc.DisposableBase):
         CompositeDisposable."""
 
         with self.lock:
-            current_disposable = self.disposable
-            self.disposable = []
+            current_disposable = self._take_all()
 
-        for disposable in current_disposable:
-            disposable.dispose()
+        dispose_all(*current_disposable)
 
     def contains(self, item: abc.DisposableBase) -> bool:
         """Determines whether the CompositeDisposable contains a specific
@@ -90,14 +146,14 @@ class CompositeDisposable(abc.DisposableBase):
         Returns:
             True if the disposable was found; otherwise, False"""
 
-        return item in self.disposable
+        return id(item) in self._index
 
     def to_list(self) -> list[abc.DisposableBase]:
-        return self.disposable[:]
+        return list(self._items.values())
 
     def __len__(self) -> int:
-        return len(self.disposable)
+        return len(self._items)
 
     @property
     def length(self) -> int:
-        return len(self.disposable)
+        return len(self._items)
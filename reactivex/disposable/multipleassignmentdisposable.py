@@ -1,6 +1,7 @@
 from threading import RLock
 
 from reactivex.abc import DisposableBase
+from reactivex.internal import dispose_all
 
 
 class MultipleAssignmentDisposable(DisposableBase):
@@ -45,4 +46,4 @@ class MultipleAssignmentDisposable(DisposableBase):
                 self.current = None
 
         if old is not None:
-            old.dispose()
+            dispose_all(old)
@@ -1,6 +1,7 @@
 from threading import RLock
 
 from reactivex.abc import DisposableBase
+from reactivex.internal import dispose_all
 
 from .disposable import Disposable
 
@@ -52,7 +53,7 @@ class RefCountDisposable(DisposableBase):
                     underlying_disposable = self.underlying_disposable
 
         if underlying_disposable is not None:
-            underlying_disposable.dispose()
+            dispose_all(underlying_disposable)
 
     def release(self) -> None:
         if self.is_disposed:
@@ -66,7 +67,7 @@ class RefCountDisposable(DisposableBase):
                 should_dispose = True
 
         if should_dispose:
-            self.underlying_disposable.dispose()
+            dispose_all(self.underlying_disposable)
 
     @property
     def disposable(self) -> DisposableBase:
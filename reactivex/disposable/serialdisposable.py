@@ -1,6 +1,7 @@
 from threading import RLock
 
 from reactivex import abc
+from reactivex.internal import dispose_all
 
 
 class SerialDisposable(abc.DisposableBase):
@@ -34,7 +35,7 @@ class SerialDisposable(abc.DisposableBase):
                 self.current = value
 
         if old is not None:
-            old.dispose()
+            dispose_all(old)
 
         if should_dispose:
             value.dispose()
@@ -54,4 +55,4 @@ class SerialDisposable(abc.DisposableBase):
                 self.current = None
 
         if old is not None:
-            old.dispose()
+            dispose_all(old)
@@ -1,6 +1,7 @@
 from threading import RLock
 
 from reactivex.abc import DisposableBase
+from reactivex.internal import dispose_all
 
 
 class SingleAssignmentDisposable(DisposableBase):
@@ -49,4 +50,4 @@ class SingleAssignmentDisposable(DisposableBase):
                 self.current = None
 
         if old is not None:
-            old.dispose()
+            dispose_all(old)
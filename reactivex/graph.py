@@ -0,0 +1,468 @@
+"""Introspectable model of pipelines.
+
+An observable is a closure, so it does not know how it was built. Once
+enabled, every operator applied in a pipe records a :class:`Node` with
+its kind, its parameters and the nodes of the observables it
+subscribes to. :func:`explain` renders the resulting graph with the
+per-stage costs measured by :mod:`reactivex.metrics`.
+
+Templates made by :func:`reactivex.compile` can be optimized by
+:func:`rewrite`. Rewrite passes only touch operators of the library
+whose parameters are known, and replace them with operators emitting
+the same elements, e.g. ``take(10), take(5)`` with ``take(5)``.
+
+Pipelines assembled while recording is disabled are not touched.
+
+Examples:
+    >>> from reactivex import graph
+    >>> graph.enable()
+    >>> with metrics.instrument():
+    ...     xs = source.pipe(ops.map(parse), ops.filter(valid))
+    >>> xs.explain()
+    >>> template = graph.rewrite(reactivex.compile(ops.skip(1), ops.skip(2)))
+"""
+
+import inspect
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from reactivex import Observable
+from reactivex import operators as ops
+from reactivex.internal import assembly
+from reactivex.internal.curry import uncurry
+from reactivex.observable import ScalarObservable
+from reactivex.operators._filter import filter_
+from reactivex.operators._map import map_
+from reactivex.operators._skip import skip_
+from reactivex.operators._slice import slice_
+from reactivex.operators._take import take_
+from reactivex.pipe import Template
+
+if TYPE_CHECKING:
+    from reactivex.metrics import MetricsRegistry, OperatorMetrics
+
+_A = TypeVar("_A")
+_B = TypeVar("_B")
+
+_ATTRIBUTE = "__rx_node__"
+
+
+@dataclass(frozen=True, eq=False)
+class Node:
+    """An operator applied in a pipeline, or a source.
+
+    Attributes:
+        kind: Name of the operator, e.g. ``"map"``, or the class name
+            of a source, e.g. ``"Subject"``.
+        params: Arguments of the operator by parameter name, or None
+            if they are not known.
+        sources: Nodes of the observables the operator subscribes to,
+            the piped source first.
+        stage: Position of the operator in its pipe, None for sources.
+        operator: The operator, None for sources.
+    """
+
+    kind: str
+    params: Mapping[str, Any] | None = None
+    sources: tuple["Node", ...] = ()
+    stage: int | None = None
+    operator: Callable[[Any], Any] | None = None
+
+    def __str__(self) -> str:
+        if self.params is None:
+            return self.kind
+
+        params = ", ".join(f"{k}={_format(v)}" for k, v in self.params.items())
+        return f"{self.kind}({params})"
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, Observable):
+        return node_of(cast(Observable[Any], value)).kind
+    if isinstance(value, (tuple, list)):
+        items = [_format(item) for item in cast(Iterable[Any], value)]
+        if isinstance(value, list):
+            return f"[{', '.join(items)}]"
+        return f"({items[0]},)" if len(items) == 1 else f"({', '.join(items)})"
+    if inspect.isfunction(value) or inspect.isbuiltin(value):
+        return value.__qualname__
+
+    text = repr(value)
+    return text if len(text) <= 40 else text[:37] + "..."
+
+
+_signatures: dict[Callable[..., Any], inspect.Signature] = {}
+
+
+def describe(
+    operator: Callable[[Any], Any],
+    stage: int | None = None,
+    sources: Iterable[Node] = (),
+) -> Node:
+    """Returns the node of an operator.
+
+    The parameters are known for the operators of the library that are
+    made by currying a function with their arguments, which is most of
+    them.
+
+    Args:
+        operator: The operator.
+        stage: [Optional] Position of the operator in its pipe.
+        sources: [Optional] Nodes of the observables the operator
+            subscribes to.
+
+    Returns:
+        The node.
+    """
+
+    kind = assembly.operator_name(operator)
+    curried = uncurry(operator)
+    if curried is None:
+        return Node(kind, None, tuple(sources), stage, operator)
+
+    fun, args, kwargs = curried
+    signature = _signatures.get(fun)
+    if signature is None:
+        signature = _signatures[fun] = inspect.signature(fun)
+    try:
+        bound = signature.bind(None, *args, **kwargs)
+    except TypeError:
+        return Node(kind, None, tuple(sources), stage, operator)
+
+    bound.apply_defaults()
+    params = dict(list(bound.arguments.items())[1:])
+    return Node(kind, params, tuple(sources), stage, operator)
+
+
+def _attach(source: Observable[Any], node: Node) -> None:
+    try:
+        setattr(source, _ATTRIBUTE, node)
+    except AttributeError:
+        pass
+
+
+def node_of(source: Observable[Any]) -> Node:
+    """Returns the node of an observable.
+
+    Observables that were not made by an operator applied while
+    recording are sources, named after their class. Scalar observables
+    are named like the observables created with a scheduler.
+    """
+
+    node = cast(Node | None, getattr(source, _ATTRIBUTE, None))
+    if node is None:
+        if isinstance(source, ScalarObservable):
+            node = Node(Observable.__name__)
+        else:
+            node = Node(type(source).__name__)
+        _attach(source, node)
+    return node
+
+
+def _observables(values: Iterable[Any]) -> Iterator[Observable[Any]]:
+    for value in values:
+        if isinstance(value, Observable):
+            yield cast(Observable[Any], value)
+        elif isinstance(value, (tuple, list)):
+            for item in cast(Iterable[Any], value):
+                if isinstance(item, Observable):
+                    yield cast(Observable[Any], item)
+
+
+def _hook(name: str, stage: int, source: Any, apply: Callable[[Any], Any]) -> Any:
+    result: Any = apply(source)
+    if not isinstance(result, Observable):
+        return result
+
+    operator = cast(Callable[[Any], Any], getattr(apply, "operator"))
+    node = describe(operator, stage)
+    sources: list[Node] = []
+    if isinstance(source, Observable):
+        sources.append(node_of(cast(Observable[Any], source)))
+    if node.params is not None:
+        sources.extend(node_of(xs) for xs in _observables(node.params.values()))
+
+    observable = cast(Observable[Any], result)
+    _attach(observable, Node(node.kind, node.params, tuple(sources), stage, operator))
+    return observable
+
+
+def enable() -> None:
+    """Records the graph of every pipeline assembled from now on."""
+
+    assembly.add_hook(_hook, outermost=True)
+
+
+def disable() -> None:
+    """Stops recording the graph of newly assembled pipelines.
+
+    Pipelines that were already recorded keep their nodes.
+    """
+
+    assembly.remove_hook(_hook)
+
+
+def _cost(node: Node, metrics: Mapping[tuple[int, str], "OperatorMetrics"]) -> str:
+    if node.stage is None:
+        return ""
+    stage = metrics.get((node.stage, node.kind))
+    if stage is None or not stage.elements_in:
+        return ""
+
+    per_element = stage.on_next.sum / stage.elements_in * 1e6
+    return (
+        f"{per_element:.1f} us/element, "
+        f"{stage.elements_in} in, {stage.elements_out} out"
+    )
+
+
+def explain(
+    source: Observable[Any],
+    registry: "MetricsRegistry | None" = None,
+    label: str | None = None,
+) -> str:
+    """Renders the graph of a pipeline.
+
+    The graph is drawn from the given observable back to its sources.
+    Nodes reached more than once are drawn once and referred to by
+    number. Operators instrumented by :mod:`reactivex.metrics` show
+    the estimated time they spend per element, excluding the next
+    stage of their pipe, and their element counts. Pipelines
+    instrumented with the same label share their metrics, so the costs
+    are those of all of them.
+
+    Examples:
+        >>> print(graph.explain(xs))
+        #0 filter(predicate=valid)  [0.4 us/element, 100 in, 98 out]
+        └── #1 map(mapper=parse)  [2.1 us/element, 100 in, 100 out]
+            └── #2 Subject
+
+    Args:
+        source: The observable to explain.
+        registry: [Optional] Registry to take the costs from. Defaults
+            to the default registry of :mod:`reactivex.metrics`.
+        label: [Optional] Label the pipeline was instrumented with.
+
+    Returns:
+        The graph as text.
+    """
+
+    if registry is None:
+        from reactivex import metrics as metrics_
+
+        registry = metrics_.registry
+
+    metrics = {
+        (entry.stage, entry.operator): entry
+        for entry in registry.operators
+        if entry.label == label
+    }
+
+    lines: list[str] = []
+    numbers: dict[Node, int] = {}
+    stack: list[tuple[Node, str, str]] = [(node_of(source), "", "")]
+    while stack:
+        node, prefix, indent = stack.pop()
+        if node in numbers:
+            lines.append(f"{prefix}#{numbers[node]} (see above)")
+            continue
+
+        number = numbers[node] = len(numbers)
+        cost = _cost(node, metrics)
+        lines.append(f"{prefix}#{number} {node}" + (f"  [{cost}]" if cost else ""))
+
+        last = len(node.sources) - 1
+        for index, upstream in reversed(list(enumerate(node.sources))):
+            branch, extension = ("└── ", "    ") if index == last else ("├── ", "│   ")
+            stack.append((upstream, indent + branch, indent + extension))
+
+    return "\n".join(lines)
+
+
+Pass = Callable[[list[Node]], list[Node]]
+"""A rewrite pass.
+
+Takes the nodes of the operators of a template, in order, and returns
+the nodes to replace them with. A pass must only replace operators
+whose kind and parameters it knows, with fewer operators that emit the
+same elements.
+"""
+
+
+def _is(node: Node, operator: Callable[..., Any]) -> bool:
+    """Tests whether a node is made by the given curried operator
+    function of the library."""
+
+    if node.params is None or node.operator is None:
+        return False
+    curried = uncurry(node.operator)
+    return curried is not None and curried[0] is getattr(operator, "__wrapped__")
+
+
+def _fold_runs(
+    nodes: list[Node],
+    accepts: Callable[[Node], bool],
+    fold: Callable[[list[Node]], list[Node]],
+) -> list[Node]:
+    """Replaces every run of accepted nodes with its fold, if the fold
+    is shorter."""
+
+    result: list[Node] = []
+    run: list[Node] = []
+    for node in [*nodes, None]:
+        if node is not None and accepts(node):
+            run.append(node)
+            continue
+
+        if run:
+            folded = fold(run)
+            result.extend(folded if len(folded) < len(run) else run)
+            run = []
+        if node is not None:
+            result.append(node)
+    return result
+
+
+def _mappers(mappers: list[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    def mapper(value: Any) -> Any:
+        for fun in mappers:
+            value = fun(value)
+        return value
+
+    return mapper
+
+
+def collapse_maps(nodes: list[Node]) -> list[Node]:
+    """Replaces adjacent ``map`` operators with one, and removes
+    ``map`` operators without a mapper."""
+
+    def fold(run: list[Node]) -> list[Node]:
+        mappers = [n.params["mapper"] for n in run if n.params and n.params["mapper"]]
+        if not mappers:
+            return []
+        if len(mappers) == 1:
+            return [describe(ops.map(mappers[0]))]
+        return [describe(ops.map(_mappers(mappers)))]
+
+    return _fold_runs(nodes, lambda node: _is(node, map_), fold)
+
+
+def _predicates(predicates: list[Callable[[Any], bool]]) -> Callable[[Any], bool]:
+    def predicate(value: Any) -> bool:
+        for fun in predicates:
+            if not fun(value):
+                return False
+        return True
+
+    return predicate
+
+
+def collapse_filters(nodes: list[Node]) -> list[Node]:
+    """Replaces adjacent ``filter`` operators with one."""
+
+    def fold(run: list[Node]) -> list[Node]:
+        predicates = [n.params["predicate"] for n in run if n.params is not None]
+        return [describe(ops.filter(_predicates(predicates)))]
+
+    return _fold_runs(nodes, lambda node: _is(node, filter_), fold)
+
+
+def _is_index(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def _window(node: Node) -> tuple[int, int | None] | None:
+    """Returns the indices ``[start, stop)`` of the elements an
+    operator keeps, or None if it is not a window."""
+
+    params = node.params or {}
+    if _is(node, take_) and _is_index(params["count"]):
+        return 0, params["count"]
+    if _is(node, skip_) and _is_index(params["count"]):
+        return params["count"], None
+    if _is(node, slice_) and params["step"] in (None, 1):
+        start, stop = params["start"] or 0, params["stop"]
+        if _is_index(start) and (stop is None or _is_index(stop)):
+            return start, stop
+    return None
+
+
+def merge_windows(nodes: list[Node]) -> list[Node]:
+    """Replaces adjacent ``take``, ``skip`` and ``slice`` operators with
+    a single one.
+
+    A run containing a window of no elements, e.g. ``take(0)``, becomes
+    ``take(0)``, which completes on subscribe without waiting for the
+    source like the other windows do.
+    """
+
+    def fold(run: list[Node]) -> list[Node]:
+        windows = [cast(tuple[int, int | None], _window(node)) for node in run]
+        if any(last == 0 for _, last in windows):
+            return [describe(ops.take(0))]
+
+        start, stop = 0, None
+        for first, last in windows:
+            if last is not None:
+                stop = start + last if stop is None else min(stop, start + last)
+            start += first
+
+        if stop is None:
+            return [describe(ops.skip(start))] if start else []
+        if not start:
+            return [describe(ops.take(stop))]
+        return [describe(ops.slice(start, stop))]
+
+    return _fold_runs(nodes, lambda node: _window(node) is not None, fold)
+
+
+DEFAULT_PASSES: tuple[Pass, ...] = (collapse_maps, collapse_filters, merge_windows)
+
+
+def rewrite(
+    template: Template[_A, _B], passes: Sequence[Pass] = DEFAULT_PASSES
+) -> Template[_A, _B]:
+    """Optimizes a template with rewrite passes.
+
+    The passes are run in order, repeatedly, as long as they make the
+    pipeline shorter.
+
+    Examples:
+        >>> template = reactivex.compile(ops.skip(1), ops.take(10), ops.take(5))
+        >>> graph.rewrite(template)
+        Template(slice)
+
+    Args:
+        template: Template to rewrite.
+        passes: [Optional] Rewrite passes to run.
+
+    Returns:
+        A new template emitting the same elements.
+    """
+
+    nodes = [describe(operator) for operator in template.operators]
+    while True:
+        length = len(nodes)
+        for rewrite_pass in passes:
+            nodes = rewrite_pass(nodes)
+        if len(nodes) >= length:
+            break
+
+    return Template(cast(Callable[[Any], Any], node.operator) for node in nodes)
+
+
+__all__ = [
+    "DEFAULT_PASSES",
+    "Node",
+    "Pass",
+    "collapse_filters",
+    "collapse_maps",
+    "describe",
+    "disable",
+    "enable",
+    "explain",
+    "merge_windows",
+    "node_of",
+    "rewrite",
+]
@@ -2,9 +2,11 @@ from .basic import default_comparer, default_error, noop
 from .concurrency import default_thread_factory, synchronized
 from .constants import DELTA_ZERO, UTC_ZERO
 from .curry import curry_flip
+from .disposal import dispose_all
 from .exceptions import (
     ArgumentOutOfRangeException,
     DisposedException,
+    QueueOverflowError,
     SequenceContainsNoElementsError,
 )
 from .priorityqueue import PriorityQueue
@@ -18,10 +20,12 @@ __all__ = [
     "DisposedException",
     "default_comparer",
     "default_error",
+    "dispose_all",
     "infinite",
     "is_future",
     "noop",
     "NotSet",
+    "QueueOverflowError",
     "SequenceContainsNoElementsError",
     "concurrency",
     "DELTA_ZERO",
@@ -0,0 +1,151 @@
+import threading
+from collections.abc import Callable, Iterable
+from typing import Any, Protocol
+
+_local = threading.local()
+
+
+class AssemblyHook(Protocol):
+    """Intercepts the application of an operator in a pipe."""
+
+    def __call__(
+        self,
+        name: str,
+        stage: int,
+        source: Any,
+        apply: Callable[[Any], Any],
+    ) -> Any:
+        """Applies an operator to a source.
+
+        Args:
+            name: Name of the operator, e.g. ``"map"``.
+            stage: Position of the operator in the pipe.
+            source: Value the operator is applied to.
+            apply: Applies the operator, and any further hooks, to the
+                given source and returns the result. Its ``operator``
+                attribute is the operator being applied.
+
+        Returns:
+            The result of the operator, possibly wrapped.
+        """
+        ...
+
+
+hooks: list[AssemblyHook] = []
+"""Installed hooks. :func:`reactivex.compose` only looks at the hooks
+when the list is non-empty, so assembly and the resulting pipelines
+are unchanged when no hook is installed."""
+
+
+def add_hook(hook: AssemblyHook, outermost: bool = False) -> None:
+    """Installs a hook.
+
+    Args:
+        hook: The hook to install.
+        outermost: [Optional] Install the hook outside of the hooks
+            installed before, so that it sees the sources and results
+            of the operators as the user does.
+    """
+
+    if hook in hooks:
+        return
+    if outermost:
+        hooks.insert(0, hook)
+    else:
+        hooks.append(hook)
+
+
+def remove_hook(hook: AssemblyHook) -> None:
+    if hook in hooks:
+        hooks.remove(hook)
+
+
+def operator_name(operator: Callable[[Any], Any]) -> str:
+    name = getattr(operator, "__name__", None) or type(operator).__name__
+    return name.strip("_") or name
+
+
+def is_plain_observable(value: Any) -> bool:
+    """Tests whether a hook can wrap the value in a new observable.
+
+    Connectable observables are excluded, as wrapping them would hide
+    their connect method.
+    """
+
+    from reactivex import ConnectableObservable, Observable
+
+    return isinstance(value, Observable) and not isinstance(
+        value, ConnectableObservable
+    )
+
+
+class _Apply:
+    __slots__ = ("installed", "operator", "stage")
+
+    def __init__(
+        self,
+        installed: tuple[AssemblyHook, ...],
+        operator: Callable[[Any], Any],
+        stage: int,
+    ) -> None:
+        self.installed = installed
+        self.operator = operator
+        self.stage = stage
+
+    def __call__(self, source: Any) -> Any:
+        return _apply(self.installed, self.operator, self.stage, source)
+
+
+def _apply(
+    installed: tuple[AssemblyHook, ...],
+    operator: Callable[[Any], Any],
+    stage: int,
+    source: Any,
+) -> Any:
+    if not installed:
+        return operator(source)
+
+    apply = _Apply(installed[1:], operator, stage)
+    return installed[0](operator_name(operator), stage, source, apply)
+
+
+def assemble(operators: Iterable[Callable[[Any], Any]], source: Any) -> Any:
+    """Applies the operators left to right through the installed hooks.
+
+    Only the outermost pipe on a thread is passed through the hooks.
+    Pipes that the operators use internally while being applied are
+    applied directly, so every hook sees the operators as written by
+    the user.
+
+    Args:
+        operators: Operators to apply.
+        source: Value to apply the first operator to.
+
+    Returns:
+        The result of the last operator.
+    """
+
+    if getattr(_local, "assembling", False):
+        for operator in operators:
+            source = operator(source)
+        return source
+
+    installed = tuple(hooks)
+    _local.assembling = True
+    try:
+        for stage, operator in enumerate(operators):
+            source = _apply(installed, operator, stage, source)
+        return source
+    finally:
+        _local.assembling = False
+
+
+__all__ = [
+    "AssemblyHook",
+    "add_hook",
+    "assemble",
+    "hooks",
+    "is_plain_observable",
+    "operator_name",
+    "remove_hook",
+]
@@ -0,0 +1,156 @@
+import sys
+import threading
+import weakref
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from reactivex import abc
+
+AlertHook = Callable[["BufferGauge"], None]
+
+enabled: bool = False
+"""Whether operators subscribed from now on register their buffers.
+Operators check this once per subscription, so buffers are neither
+registered nor checked while disabled."""
+
+threshold: int | None = None
+"""Element count at which the alert hooks are called."""
+
+hooks: list[AlertHook] = []
+
+_lock = threading.Lock()
+_gauges: "weakref.WeakSet[BufferGauge]" = weakref.WeakSet()
+
+
+class BufferGauge(abc.DisposableBase):
+    """Reports the size of the internal buffer of one operator
+    subscription. Disposing the gauge unregisters it.
+
+    Attributes:
+        operator: Name of the operator, e.g. ``"zip"``.
+        peak: Largest element count seen when the buffer grew.
+        alerted: Whether the buffer is above the threshold since the
+            alert hooks were last called for it.
+    """
+
+    __slots__ = ("operator", "peak", "alerted", "_count", "_items", "__weakref__")
+
+    def __init__(
+        self,
+        operator: str,
+        count: Callable[[], int],
+        items: Callable[[], Iterable[Any]] | None = None,
+    ) -> None:
+        self.operator = operator
+        self.peak = 0
+        self.alerted = False
+        self._count = count
+        self._items = items
+
+    @property
+    def count(self) -> int:
+        """Number of elements currently buffered."""
+        return self._count()
+
+    def nbytes(self) -> int | None:
+        """Returns the approximate size of the buffered elements.
+
+        The size is the sum of the shallow sizes of the elements, so
+        objects they refer to are not included. This iterates the whole
+        buffer, so it is only computed on request.
+
+        Returns:
+            The size in bytes, or None if the operator does not expose
+            its elements.
+        """
+
+        if self._items is None:
+            return None
+
+        # The buffer may be changed by another thread while it is copied
+        for _ in range(3):
+            try:
+                items = list(self._items())
+            except RuntimeError:
+                continue
+            return sum(sys.getsizeof(item) for item in items)
+        return None
+
+    def check(self) -> None:
+        """Called by the operator after its buffer grew."""
+
+        count = self._count()
+        if count > self.peak:
+            self.peak = count
+
+        limit = threshold
+        if limit is None:
+            return
+        if count < limit:
+            self.alerted = False
+        elif not self.alerted:
+            self.alerted = True
+            for hook in list(hooks):
+                hook(self)
+
+    def dispose(self) -> None:
+        """Unregisters the gauge when the subscription ends."""
+
+        with _lock:
+            _gauges.discard(self)
+
+    def snapshot(self, nbytes: bool = False) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "operator": self.operator,
+            "count": self.count,
+            "peak": self.peak,
+            "alerted": self.alerted,
+        }
+        if nbytes:
+            result["nbytes"] = self.nbytes()
+        return result
+
+
+def track(
+    operator: str,
+    count: Callable[[], int],
+    items: Callable[[], Iterable[Any]] | None = None,
+) -> BufferGauge | None:
+    """Registers the buffer of a new operator subscription.
+
+    Args:
+        operator: Name of the operator.
+        count: Returns the number of buffered elements.
+        items: [Optional] Returns the buffered elements.
+
+    Returns:
+        The gauge, which the operator checks after its buffer grew and
+        disposes with the subscription, or None if buffers are not
+        tracked.
+    """
+
+    if not enabled:
+        return None
+
+    gauge = BufferGauge(operator, count, items)
+    with _lock:
+        _gauges.add(gauge)
+    return gauge
+
+
+def gauges() -> list[BufferGauge]:
+    """Returns the gauges of the live subscriptions."""
+
+    with _lock:
+        return list(_gauges)
+
+
+__all__ = [
+    "AlertHook",
+    "BufferGauge",
+    "enabled",
+    "gauges",
+    "hooks",
+    "threshold",
+    "track",
+]
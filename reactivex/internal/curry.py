@@ -7,7 +7,7 @@ needed for RxPY operators.
 
 import functools
 from collections.abc import Callable
-from typing import Concatenate, TypeVar
+from typing import Any, Concatenate, TypeVar
 
 from typing_extensions import ParamSpec
 
@@ -46,14 +46,54 @@ def curry_flip(
         >>> result = take(5)(source)
     """
 
+    name = fun.__name__
+
     @functools.wraps(fun)
     def _wrap_args(*args: _P.args, **kwargs: _P.kwargs) -> Callable[[_A], _B]:
         def _wrap_curried(curry_arg: _A) -> _B:
             return fun(curry_arg, *args, **kwargs)
 
+        # Name the operator after the curried function for introspection
+        _wrap_curried.__name__ = name
         return _wrap_curried
 
     return _wrap_args
 
 
-__all__ = ["curry_flip"]
+def _identity(source: Any) -> Any:
+    return source
+
+
+_CURRIED = curry_flip(_identity)().__code__
+
+
+def uncurry(
+    operator: Callable[..., Any],
+) -> tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]] | None:
+    """Returns the function and arguments an operator was curried from.
+
+    Example:
+        >>> uncurry(take(5))
+        (take_, (5,), {})
+
+    Args:
+        operator: An operator.
+
+    Returns:
+        The function, positional and keyword arguments, or None if the
+        operator was not made by :func:`curry_flip`.
+    """
+
+    if getattr(operator, "__code__", None) is not _CURRIED:
+        return None
+
+    closure = operator.__closure__ or ()
+    cells = dict(zip(_CURRIED.co_freevars, closure))
+    return (
+        cells["fun"].cell_contents,
+        cells["args"].cell_contents,
+        cells["kwargs"].cell_contents,
+    )
+
+
+__all__ = ["curry_flip", "uncurry"]
@@ -0,0 +1,51 @@
+import threading
+
+from reactivex import abc
+
+_local = threading.local()
+
+
+def dispose_all(*disposables: abc.DisposableBase) -> None:
+    """Disposes the given disposables in order, without recursion.
+
+    Container disposables call this instead of disposing their children
+    directly. The outermost call on a thread runs a loop over an
+    explicit work stack. Nested calls made while that loop runs only
+    push their children onto the stack and return at once. The loop
+    disposes those children before the outermost call returns. Disposing
+    a deep subscription tree therefore uses constant stack depth.
+    Children are pushed in reverse, so the tree is still disposed depth
+    first and in order.
+
+    If a disposable raises, the remaining disposables are still
+    disposed, and the first exception is raised once the stack is
+    empty.
+
+    Args:
+        disposables: Disposables to dispose.
+    """
+
+    stack: list[abc.DisposableBase] | None = getattr(_local, "stack", None)
+    if stack is not None:
+        stack.extend(reversed(disposables))
+        return
+
+    stack = list(disposables)
+    stack.reverse()
+    _local.stack = stack
+    error: Exception | None = None
+    try:
+        while stack:
+            try:
+                stack.pop().dispose()
+            except Exception as e:  # pylint: disable=broad-except
+                if error is None:
+                    error = e
+    finally:
+        _local.stack = None
+
+    if error is not None:
+        raise error
+
+
+__all__ = ["dispose_all"]
@@ -29,3 +29,8 @@ class CompletedException(Exception):
 class WouldBlockException(Exception):
     def __init__(self, msg: str | None = None):
         super().__init__(msg or "Would block")
+
+
+class QueueOverflowError(Exception):
+    def __init__(self, msg: str | None = None):
+        super().__init__(msg or "Queue overflow")
@@ -0,0 +1,76 @@
+import threading
+from typing import Any
+
+from reactivex import abc
+
+
+class _Current(threading.local):
+    stamp: float | None = None
+
+
+current = _Current()
+"""Ingress stamp of the element being emitted on the current thread."""
+
+enabled: bool = False
+"""Set once a ``stamp_latency`` operator is applied. Operators that
+hand elements over to another thread or a later point in time decide
+when they are subscribed whether to carry stamps at all, so until then
+they keep no stamps alongside their elements."""
+
+active: int = 0
+"""Number of live subscriptions that stamp elements. Operators that
+hand elements over to another thread or a later point in time only
+carry the stamps while this is non-zero."""
+
+_lock = threading.Lock()
+
+
+def enable() -> None:
+    global enabled
+    enabled = True
+
+
+def activate() -> None:
+    global active
+    with _lock:
+        active += 1
+
+
+def deactivate() -> None:
+    global active
+    with _lock:
+        active -= 1
+
+
+def capture() -> float | None:
+    """Returns the stamp to carry with an element that is emitted
+    later, or None if no element is being stamped."""
+
+    return current.stamp if active else None
+
+
+def emit(observer: abc.ObserverBase[Any], value: Any, stamp: float | None) -> None:
+    """Emits a value with the given stamp restored as the current one."""
+
+    previous = current.stamp
+    if stamp is None and previous is None:
+        observer.on_next(value)
+        return
+
+    current.stamp = stamp
+    try:
+        observer.on_next(value)
+    finally:
+        current.stamp = previous
+
+
+__all__ = [
+    "activate",
+    "active",
+    "capture",
+    "current",
+    "deactivate",
+    "emit",
+    "enable",
+    "enabled",
+]
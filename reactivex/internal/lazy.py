@@ -0,0 +1,51 @@
+import importlib
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_attributes(
+    package: str,
+    attributes: Mapping[str, str],
+    submodules: tuple[str, ...] = (),
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Creates the module ``__getattr__`` and ``__dir__`` functions of a
+    package that imports its attributes on first use (PEP 562).
+
+    Examples:
+        >>> __getattr__, __dir__ = lazy_attributes(
+        ...     __name__, {"AsyncIOScheduler": ".asyncioscheduler"}
+        ... )
+
+    Args:
+        package: Name of the package.
+        attributes: Maps every attribute to the module, relative to the
+            package, that defines it.
+        submodules: [Optional] Subpackages that are imported when
+            accessed as attributes.
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions for the package.
+    """
+
+    module = importlib.import_module(package)
+    names = sorted({*attributes, *submodules})
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            value = getattr(importlib.import_module(attributes[name], package), name)
+        elif name in submodules:
+            value = importlib.import_module(f".{name}", package)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        # Later lookups find the attribute without calling __getattr__
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(module), *names})
+
+    return __getattr__, __dir__
+
+
+__all__ = ["lazy_attributes"]
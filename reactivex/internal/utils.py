@@ -1,5 +1,4 @@
-import asyncio
-import concurrent.futures
+import sys
 from collections.abc import Callable, Iterable
 from functools import update_wrapper
 from types import FunctionType
@@ -43,7 +42,13 @@ def is_future(value: Any) -> TypeIs[AnyFuture[Any]]:
     Returns:
         True if the value is a future, False otherwise.
     """
-    return asyncio.isfuture(value) or isinstance(value, concurrent.futures.Future)
+    # Same test as asyncio.isfuture, without importing asyncio
+    if hasattr(value.__class__, "_asyncio_future_blocking"):
+        return value._asyncio_future_blocking is not None
+
+    # No instance can exist unless concurrent.futures was imported
+    futures = sys.modules.get("concurrent.futures")
+    return futures is not None and isinstance(value, futures.Future)
 
 
 def infinite() -> Iterable[int]:
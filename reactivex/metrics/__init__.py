@@ -0,0 +1,67 @@
+"""Opt-in metrics for pipelines.
+
+Once enabled, every operator applied in a pipe records the elements it
+receives and emits, its errors and completions, its live subscriptions
+and a histogram of the time spent handling each element. Pipelines
+assembled while the metrics are disabled are not touched at all.
+
+Schedulers record their queue depth, lag and utilization once enabled
+with :meth:`Scheduler.enable_stats <reactivex.scheduler.Scheduler.enable_stats>`,
+and the internal buffers of stateful operators are reported by
+:mod:`reactivex.metrics.buffers`.
+
+Examples:
+    >>> from reactivex import metrics
+    >>> with metrics.instrument("orders"):
+    ...     orders = source.pipe(ops.map(parse), ops.filter(valid))
+    >>> metrics.snapshot()
+    >>> metrics.to_prometheus()
+"""
+
+from typing import Any
+
+from . import buffers
+from .buffers import BufferGauge
+from .histogram import DEFAULT_BUCKETS, Histogram
+from .instrumentation import disable, enable, instrument
+from .registry import ElementCounter, MetricsRegistry, OperatorMetrics, registry
+from .schedulerstats import SchedulerStats, Ticket
+
+
+def snapshot() -> dict[str, Any]:
+    """Returns the metrics of the default registry as plain data."""
+
+    return registry.snapshot()
+
+
+def to_prometheus() -> str:
+    """Returns the metrics of the default registry in the Prometheus
+    text format."""
+
+    return registry.to_prometheus()
+
+
+def reset() -> None:
+    """Forgets the metrics collected in the default registry."""
+
+    registry.reset()
+
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "BufferGauge",
+    "ElementCounter",
+    "Histogram",
+    "MetricsRegistry",
+    "OperatorMetrics",
+    "SchedulerStats",
+    "Ticket",
+    "buffers",
+    "disable",
+    "enable",
+    "instrument",
+    "registry",
+    "reset",
+    "snapshot",
+    "to_prometheus",
+]
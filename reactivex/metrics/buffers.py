@@ -0,0 +1,128 @@
+"""Sizes of the internal buffers of stateful operators.
+
+Once enabled, subscriptions to ``zip``, ``delay``, ``group_by_until``,
+``join``, ``group_join``, ``replay``, ``take_last``, ``to_list``,
+``distinct`` and ``observe_on`` register a gauge reporting how many
+elements they hold. Alert hooks are called when a buffer grows to the
+threshold, once for every crossing. Subscriptions made while disabled
+are not tracked and do no extra work.
+
+Gauges are unregistered when their subscription is disposed, or, for
+the subject shared by ``replay``, when it is garbage collected.
+
+Examples:
+    >>> from reactivex.metrics import buffers
+    >>> buffers.enable(threshold=10_000, on_alert=lambda g: log.warning(g))
+    >>> buffers.snapshot(nbytes=True)
+"""
+
+from collections import defaultdict
+from typing import Any
+
+from reactivex.internal import buffers as _buffers
+from reactivex.internal.buffers import AlertHook, BufferGauge
+
+from .prometheus import PrometheusWriter, format_labels
+
+
+def enable(threshold: int | None = None, on_alert: AlertHook | None = None) -> None:
+    """Tracks the buffers of the subscriptions made from now on.
+
+    Args:
+        threshold: [Optional] Element count at which to call the alert
+            hooks. Replaces any threshold given before.
+        on_alert: [Optional] Alert hook to add. It is called with the
+            gauge of the buffer, on the thread that grew the buffer.
+    """
+
+    if threshold is not None:
+        _buffers.threshold = threshold
+    if on_alert is not None:
+        add_alert_hook(on_alert)
+    _buffers.enabled = True
+
+
+def disable() -> None:
+    """Stops tracking the buffers of new subscriptions, and removes the
+    threshold and alert hooks.
+
+    Subscriptions that were already tracked keep their gauges until
+    they end.
+    """
+
+    _buffers.enabled = False
+    _buffers.threshold = None
+    _buffers.hooks.clear()
+
+
+def add_alert_hook(hook: AlertHook) -> None:
+    if hook not in _buffers.hooks:
+        _buffers.hooks.append(hook)
+
+
+def remove_alert_hook(hook: AlertHook) -> None:
+    if hook in _buffers.hooks:
+        _buffers.hooks.remove(hook)
+
+
+def gauges() -> list[BufferGauge]:
+    """Returns the gauges of the live tracked subscriptions."""
+
+    return _buffers.gauges()
+
+
+def snapshot(nbytes: bool = False) -> list[dict[str, Any]]:
+    """Returns the buffers of the live tracked subscriptions as plain
+    data, largest first.
+
+    Args:
+        nbytes: [Optional] Also return the approximate size of the
+            buffered elements in bytes. This iterates every buffer.
+
+    Returns:
+        A dictionary for every gauge.
+    """
+
+    result = [gauge.snapshot(nbytes) for gauge in gauges()]
+    result.sort(key=lambda entry: entry["count"], reverse=True)
+    return result
+
+
+def to_prometheus() -> str:
+    """Returns the buffers aggregated by operator in the Prometheus text
+    format."""
+
+    count: dict[str, int] = defaultdict(int)
+    peak: dict[str, int] = defaultdict(int)
+    subscriptions: dict[str, int] = defaultdict(int)
+    for gauge in gauges():
+        operator = gauge.operator
+        count[operator] += gauge.count
+        peak[operator] = max(peak[operator], gauge.peak)
+        subscriptions[operator] += 1
+
+    writer = PrometheusWriter()
+    families = [
+        ("rx_buffer_elements", count, "Elements buffered by the operator."),
+        ("rx_buffer_peak_elements", peak, "Largest buffer of a subscription."),
+        ("rx_buffer_subscriptions", subscriptions, "Tracked live subscriptions."),
+    ]
+    for name, values, help in families:
+        writer.family(name, "gauge", help)
+        for operator, value in sorted(values.items()):
+            writer.sample(name, format_labels(operator=operator), value)
+
+    return writer.text()
+
+
+__all__ = [
+    "AlertHook",
+    "BufferGauge",
+    "add_alert_hook",
+    "disable",
+    "enable",
+    "gauges",
+    "remove_alert_hook",
+    "snapshot",
+    "to_prometheus",
+]
@@ -0,0 +1,93 @@
+import threading
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any
+
+DEFAULT_BUCKETS: tuple[float, ...] = tuple(
+    m * 10.0**e for e in range(-6, 1) for m in (1.0, 2.5, 5.0)
+) + (10.0,)
+"""Upper bounds, in seconds, from one microsecond to ten seconds."""
+
+
+class Histogram:
+    """Thread-safe histogram of durations with fixed buckets.
+
+    Observing a value costs a binary search over the bucket bounds and
+    a few increments. Quantiles are estimated from the buckets, and are
+    therefore exact to within one bucket, and never exceed the largest
+    observed value.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds: tuple[float, ...] = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Estimates the given quantile.
+
+        Args:
+            q: Quantile between 0 and 1, e.g. ``0.99``.
+
+        Returns:
+            The upper bound of the bucket containing the quantile, or
+            0.0 if nothing was observed.
+        """
+
+        with self.lock:
+            if not self.count:
+                return 0.0
+
+            rank = q * self.count
+            cumulative = 0
+            for bound, count in zip(self.bounds, self.counts):
+                cumulative += count
+                if cumulative >= rank:
+                    return min(bound, self.max)
+            return self.max
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """Returns the cumulative count for every upper bound, ending
+        with infinity."""
+
+        with self.lock:
+            counts = list(self.counts)
+
+        cumulative = 0
+        result: list[tuple[float, int]] = []
+        for bound, count in zip((*self.bounds, float("inf")), counts):
+            cumulative += count
+            result.append((bound, cumulative))
+        return result
+
+    def reset(self) -> None:
+        with self.lock:
+            self.counts = [0] * (len(self.bounds) + 1)
+            self.count = 0
+            self.sum = 0.0
+            self.max = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+__all__ = ["DEFAULT_BUCKETS", "Histogram"]
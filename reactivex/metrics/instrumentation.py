@@ -0,0 +1,190 @@
+import threading
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, NamedTuple, TypeVar
+
+from reactivex import Observable, abc
+from reactivex.disposable import CompositeDisposable, Disposable
+from reactivex.internal import assembly
+
+from .registry import MetricsRegistry, OperatorMetrics, registry
+
+_T = TypeVar("_T")
+
+
+class _Scope(NamedTuple):
+    label: str | None
+    registry: MetricsRegistry
+
+
+_lock = threading.Lock()
+_global: _Scope | None = None
+_scopes = 0
+_scope: ContextVar[_Scope | None] = ContextVar("reactivex_metrics", default=None)
+
+
+class _Timing(threading.local):
+    nested = 0.0
+    """Time spent in metered stages called by the running stage."""
+
+
+_timing = _Timing()
+
+
+def _meter_input(source: Observable[_T], metrics: OperatorMetrics) -> Observable[_T]:
+    observe = metrics.on_next.observe
+
+    def subscribe(
+        observer: abc.ObserverBase[_T], scheduler: abc.SchedulerBase | None = None
+    ) -> abc.DisposableBase:
+        def on_next(value: _T) -> None:
+            # Downstream stages run within this call, so their time is
+            # deducted, and this stage reports its own time to the stage
+            # that called it.
+            outer = _timing.nested
+            _timing.nested = 0.0
+            start = perf_counter()
+            try:
+                observer.on_next(value)
+            finally:
+                elapsed = perf_counter() - start
+                observe(elapsed - _timing.nested)
+                _timing.nested = outer + elapsed
+
+        return source.subscribe(
+            on_next, observer.on_error, observer.on_completed, scheduler=scheduler
+        )
+
+    return Observable(subscribe)
+
+
+def _meter_output(source: Observable[_T], metrics: OperatorMetrics) -> Observable[_T]:
+    def subscribe(
+        observer: abc.ObserverBase[_T], scheduler: abc.SchedulerBase | None = None
+    ) -> abc.DisposableBase:
+        counter = metrics.subscribe()
+
+        def on_next(value: _T) -> None:
+            counter.value += 1
+            observer.on_next(value)
+
+        def on_error(error: Exception) -> None:
+            with metrics.lock:
+                metrics.errors += 1
+            metrics.unsubscribe(counter)
+            observer.on_error(error)
+
+        def on_completed() -> None:
+            with metrics.lock:
+                metrics.completions += 1
+            metrics.unsubscribe(counter)
+            observer.on_completed()
+
+        subscription = source.subscribe(
+            on_next, on_error, on_completed, scheduler=scheduler
+        )
+        return CompositeDisposable(
+            subscription, Disposable(lambda: metrics.unsubscribe(counter))
+        )
+
+    return Observable(subscribe)
+
+
+def _hook(name: str, stage: int, source: Any, apply: Callable[[Any], Any]) -> Any:
+    scope = _scope.get() or _global
+    if scope is None:
+        return apply(source)
+
+    metrics = scope.registry.operator(name, stage, scope.label)
+    if assembly.is_plain_observable(source):
+        source = _meter_input(source, metrics)
+    result = apply(source)
+    if assembly.is_plain_observable(result):
+        result = _meter_output(result, metrics)
+    return result
+
+
+def _update_hook() -> None:
+    if _global is not None or _scopes:
+        assembly.add_hook(_hook)
+    else:
+        assembly.remove_hook(_hook)
+
+
+def enable(label: str | None = None, registry: MetricsRegistry = registry) -> None:
+    """Instruments every pipeline assembled from now on.
+
+    Pipelines assembled while the instrumentation is disabled run
+    exactly as without this module, as operators are only wrapped when
+    they are applied in a pipe.
+
+    Examples:
+        >>> metrics.enable()
+        >>> xs = source.pipe(ops.map(f), ops.filter(g))
+        >>> print(metrics.to_prometheus())
+
+    Args:
+        label: [Optional] Label to tag the metrics with.
+        registry: [Optional] Registry to record the metrics in.
+    """
+
+    global _global
+
+    with _lock:
+        _global = _Scope(label, registry)
+        _update_hook()
+
+
+def disable() -> None:
+    """Stops instrumenting newly assembled pipelines.
+
+    Pipelines that were already instrumented keep recording metrics.
+    """
+
+    global _global
+
+    with _lock:
+        _global = None
+        _update_hook()
+
+
+@contextmanager
+def instrument(
+    label: str | None = None, registry: MetricsRegistry = registry
+) -> Generator[MetricsRegistry, None, None]:
+    """Instruments the pipelines assembled within the context.
+
+    Only pipelines assembled by the current thread or task within the
+    ``with`` block are instrumented. They keep recording metrics after
+    the block exits.
+
+    Examples:
+        >>> with metrics.instrument("orders"):
+        ...     orders = source.pipe(ops.map(parse), ops.filter(valid))
+
+    Args:
+        label: [Optional] Label to tag the metrics with.
+        registry: [Optional] Registry to record the metrics in.
+
+    Returns:
+        A context manager giving the registry.
+    """
+
+    global _scopes
+
+    with _lock:
+        _scopes += 1
+        _update_hook()
+    token = _scope.set(_Scope(label, registry))
+    try:
+        yield registry
+    finally:
+        _scope.reset(token)
+        with _lock:
+            _scopes -= 1
+            _update_hook()
+
+
+__all__ = ["disable", "enable", "instrument"]
@@ -0,0 +1,37 @@
+from .histogram import Histogram
+
+
+def _escape(value: object) -> str:
+    text = "" if value is None else str(value)
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(**labels: object) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+class PrometheusWriter:
+    """Writes metrics in the Prometheus text exposition format."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def family(self, name: str, kind: str, help: str) -> None:
+        self.lines.append(f"# HELP {name} {help}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, labels: str, value: object) -> None:
+        self.lines.append(f"{name}{{{labels}}} {value}")
+
+    def histogram(self, name: str, labels: str, histogram: Histogram) -> None:
+        for bound, count in histogram.buckets():
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            self.sample(f"{name}_bucket", f'{labels},le="{le}"', count)
+        self.sample(f"{name}_sum", labels, histogram.sum)
+        self.sample(f"{name}_count", labels, histogram.count)
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+__all__ = ["PrometheusWriter", "format_labels"]
@@ -0,0 +1,266 @@
+import threading
+from typing import Any
+
+from .histogram import Histogram
+from .prometheus import PrometheusWriter, format_labels
+from .schedulerstats import SchedulerStats
+
+
+class ElementCounter:
+    """Counts the elements of a single subscription.
+
+    Observers are never called concurrently for one subscription, so
+    the counter is incremented without locking.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+
+class OperatorMetrics:
+    """Metrics of one operator stage of an instrumented pipeline.
+
+    Attributes:
+        operator: Name of the operator, e.g. ``"map"``.
+        stage: Position of the operator in its pipe.
+        label: Label given when enabling the instrumentation.
+        errors: Errors emitted by the operator.
+        completions: Completions emitted by the operator.
+        subscriptions: Live subscriptions to the operator.
+        on_next: Durations of the operator handling an element. The
+            time spent in instrumented stages downstream of it is
+            excluded, but other synchronous work downstream, such as
+            the final observer, is included.
+    """
+
+    def __init__(self, operator: str, stage: int, label: str | None) -> None:
+        self.operator = operator
+        self.stage = stage
+        self.label = label
+        self.errors = 0
+        self.completions = 0
+        self.subscriptions = 0
+        self.on_next = Histogram()
+        self.lock = threading.Lock()
+        self._counters: set[ElementCounter] = set()
+        self._retired = 0
+
+    @property
+    def elements_in(self) -> int:
+        """Elements received from the source."""
+        return self.on_next.count
+
+    @property
+    def elements_out(self) -> int:
+        """Elements emitted by the operator."""
+        with self.lock:
+            return self._retired + sum(c.value for c in self._counters)
+
+    def subscribe(self) -> ElementCounter:
+        """Registers a new subscription and returns its counter."""
+
+        counter = ElementCounter()
+        with self.lock:
+            self.subscriptions += 1
+            self._counters.add(counter)
+        return counter
+
+    def unsubscribe(self, counter: ElementCounter) -> None:
+        """Unregisters a subscription, keeping its count."""
+
+        with self.lock:
+            if counter in self._counters:
+                self._counters.remove(counter)
+                self._retired += counter.value
+                self.subscriptions -= 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "operator": self.operator,
+            "stage": self.stage,
+            "label": self.label,
+            "elements_in": self.elements_in,
+            "elements_out": self.elements_out,
+            "errors": self.errors,
+            "completions": self.completions,
+            "subscriptions": self.subscriptions,
+            "on_next_seconds": self.on_next.snapshot(),
+        }
+
+
+class MetricsRegistry:
+    """Collects the metrics of instrumented pipelines.
+
+    Operator metrics are keyed by label, stage and operator name, so
+    pipelines assembled repeatedly with the same label share their
+    metrics. Latency histograms and scheduler statistics are keyed by
+    label.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self._operators: dict[tuple[str | None, int, str], OperatorMetrics] = {}
+        self._latency: dict[str | None, Histogram] = {}
+        self._schedulers: dict[str, SchedulerStats] = {}
+
+    def operator(self, name: str, stage: int, label: str | None) -> OperatorMetrics:
+        """Returns the metrics of an operator stage, creating them if
+        needed."""
+
+        key = (label, stage, name)
+        with self.lock:
+            metrics = self._operators.get(key)
+            if metrics is None:
+                metrics = self._operators[key] = OperatorMetrics(name, stage, label)
+            return metrics
+
+    def latency(self, label: str | None = None) -> Histogram:
+        """Returns the end-to-end latency histogram with the given
+        label, creating it if needed."""
+
+        with self.lock:
+            histogram = self._latency.get(label)
+            if histogram is None:
+                histogram = self._latency[label] = Histogram()
+            return histogram
+
+    def add_scheduler(self, label: str, stats: SchedulerStats) -> None:
+        """Adds the statistics of a scheduler, replacing any with the
+        same label."""
+
+        with self.lock:
+            self._schedulers[label] = stats
+
+    @property
+    def operators(self) -> list[OperatorMetrics]:
+        with self.lock:
+            return list(self._operators.values())
+
+    @property
+    def latencies(self) -> list[tuple[str | None, Histogram]]:
+        with self.lock:
+            return list(self._latency.items())
+
+    @property
+    def schedulers(self) -> list[tuple[str, SchedulerStats]]:
+        with self.lock:
+            return list(self._schedulers.items())
+
+    def reset(self) -> None:
+        """Forgets all collected metrics."""
+
+        with self.lock:
+            self._operators.clear()
+            self._latency.clear()
+            self._schedulers.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns the current metrics as plain data.
+
+        Returns:
+            A dictionary with an ``"operators"`` list holding a
+            dictionary for every operator stage, a ``"latency"`` list
+            holding a dictionary for every latency histogram, and a
+            ``"schedulers"`` list holding a dictionary for every
+            scheduler.
+        """
+
+        return {
+            "operators": [metrics.snapshot() for metrics in self.operators],
+            "latency": [
+                {"label": label, **histogram.snapshot()}
+                for label, histogram in self.latencies
+            ],
+            "schedulers": [
+                {"label": label, **stats.snapshot()} for label, stats in self.schedulers
+            ],
+        }
+
+    def to_prometheus(self) -> str:
+        """Returns the current metrics in the Prometheus text format."""
+
+        writer = PrometheusWriter()
+        operators = [
+            (
+                metrics,
+                format_labels(
+                    operator=metrics.operator,
+                    stage=metrics.stage,
+                    label=metrics.label,
+                ),
+            )
+            for metrics in self.operators
+        ]
+
+        counters = [
+            ("elements_in", "Elements received by the operator."),
+            ("elements_out", "Elements emitted by the operator."),
+            ("errors", "Errors emitted by the operator."),
+            ("completions", "Completions emitted by the operator."),
+        ]
+        for attr, help in counters:
+            name = f"rx_operator_{attr}_total"
+            writer.family(name, "counter", help)
+            for metrics, labels in operators:
+                writer.sample(name, labels, getattr(metrics, attr))
+
+        name = "rx_operator_subscriptions"
+        writer.family(name, "gauge", "Live subscriptions to the operator.")
+        for metrics, labels in operators:
+            writer.sample(name, labels, metrics.subscriptions)
+
+        name = "rx_operator_on_next_seconds"
+        writer.family(name, "histogram", "Time spent handling an element.")
+        for metrics, labels in operators:
+            writer.histogram(name, labels, metrics.on_next)
+
+        name = "rx_latency_seconds"
+        writer.family(name, "histogram", "Time from ingress stamp to measurement.")
+        for label, histogram in self.latencies:
+            writer.histogram(name, format_labels(label=label), histogram)
+
+        schedulers = [
+            (stats, format_labels(label=label)) for label, stats in self.schedulers
+        ]
+        scheduler_counters = [
+            ("scheduled", "Items scheduled."),
+            ("executed", "Items run."),
+            ("discarded", "Cancelled items removed from the queue."),
+        ]
+        for attr, help in scheduler_counters:
+            name = f"rx_scheduler_{attr}_total"
+            writer.family(name, "counter", help)
+            for stats, labels in schedulers:
+                writer.sample(name, labels, getattr(stats, attr))
+
+        name = "rx_scheduler_busy_seconds_total"
+        writer.family(name, "counter", "Time spent running items.")
+        for stats, labels in schedulers:
+            writer.sample(name, labels, stats.busy)
+
+        scheduler_gauges = [
+            ("queued", "Items that have neither run nor been discarded."),
+            ("ready", "Items due immediately that have not run yet."),
+            ("cancelled", "Cancelled items that are still queued."),
+        ]
+        for attr, help in scheduler_gauges:
+            name = f"rx_scheduler_{attr}"
+            writer.family(name, "gauge", help)
+            for stats, labels in schedulers:
+                writer.sample(name, labels, getattr(stats, attr))
+
+        name = "rx_scheduler_lag_seconds"
+        writer.family(name, "histogram", "Time from due time to running an item.")
+        for stats, labels in schedulers:
+            writer.histogram(name, labels, stats.lag)
+
+        return writer.text()
+
+
+registry = MetricsRegistry()
+"""The default registry."""
+
+
+__all__ = ["ElementCounter", "MetricsRegistry", "OperatorMetrics", "registry"]
@@ -0,0 +1,163 @@
+import threading
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from .histogram import Histogram
+
+_QUEUED = 0
+_CANCELLED = 1
+_DONE = 2
+
+
+class Ticket:
+    """Tracks one scheduled item for :class:`SchedulerStats`."""
+
+    __slots__ = ("stats", "ready", "state")
+
+    def __init__(self, stats: "SchedulerStats", ready: bool) -> None:
+        self.stats = stats
+        self.ready = ready
+        self.state = _QUEUED
+
+    def cancel(self) -> None:
+        """Marks the item as cancelled while it may still be queued."""
+
+        stats = self.stats
+        with stats.lock:
+            if self.state == _QUEUED:
+                self.state = _CANCELLED
+                stats.cancelled += 1
+
+    def discard(self) -> None:
+        """Records that a cancelled item was removed from the queue."""
+
+        stats = self.stats
+        with stats.lock:
+            if self.state == _DONE:
+                return
+            if self.state == _CANCELLED:
+                stats.cancelled -= 1
+            self.state = _DONE
+            stats.discarded += 1
+            if self.ready:
+                stats.ready -= 1
+
+    def run(self, invoke: Callable[[], Any], lag: float) -> None:
+        """Runs the item and records its lag and running time.
+
+        Args:
+            invoke: Runs the item.
+            lag: Seconds between the due time and now.
+        """
+
+        stats = self.stats
+        stats.lag.observe(max(lag, 0.0))
+        with stats.lock:
+            # An item discarded by another thread while it was being
+            # dequeued has already been counted
+            counted = self.state == _DONE
+            if not counted:
+                if self.state == _CANCELLED:
+                    stats.cancelled -= 1
+                if self.ready:
+                    stats.ready -= 1
+                self.state = _DONE
+
+        start = perf_counter()
+        try:
+            invoke()
+        finally:
+            elapsed = perf_counter() - start
+            with stats.lock:
+                if not counted:
+                    stats.executed += 1
+                stats.busy += elapsed
+
+
+class SchedulerStats:
+    """Queue depth, lag and utilization of a scheduler.
+
+    Counters are updated as items are scheduled, cancelled and run, so
+    reading them is cheap at any time.
+
+    Attributes:
+        scheduled: Items scheduled in total.
+        executed: Items run in total.
+        discarded: Cancelled items removed from the queue in total.
+        ready: Items scheduled to run immediately that have not run yet.
+        cancelled: Cancelled items that are still queued.
+        busy: Seconds spent running items. For schedulers that run
+            items on several threads this is summed over the threads.
+        lag: Seconds between the due time of every item and when it
+            actually started running.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.scheduled = 0
+        self.executed = 0
+        self.discarded = 0
+        self.ready = 0
+        self.cancelled = 0
+        self.busy = 0.0
+        self.lag = Histogram()
+        self.started = perf_counter()
+
+    def ticket(self, ready: bool) -> Ticket:
+        """Registers a newly scheduled item.
+
+        Args:
+            ready: Whether the item is due immediately.
+
+        Returns:
+            The ticket to report the fate of the item with.
+        """
+
+        with self.lock:
+            self.scheduled += 1
+            if ready:
+                self.ready += 1
+        return Ticket(self, ready)
+
+    @property
+    def queued(self) -> int:
+        """Items scheduled that have neither run nor been discarded."""
+        return self.scheduled - self.executed - self.discarded
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the statistics were enabled."""
+        return perf_counter() - self.started
+
+    @property
+    def idle(self) -> float:
+        """Seconds not spent running items, for a single threaded
+        scheduler."""
+        return max(self.elapsed - self.busy, 0.0)
+
+    @property
+    def utilization(self) -> float:
+        """Busy time divided by elapsed time. This is the average number
+        of threads running items, so 1.0 means a single threaded
+        scheduler is saturated."""
+
+        elapsed = self.elapsed
+        return self.busy / elapsed if elapsed else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "scheduled": self.scheduled,
+            "executed": self.executed,
+            "discarded": self.discarded,
+            "queued": self.queued,
+            "ready": self.ready,
+            "cancelled": self.cancelled,
+            "busy_seconds": self.busy,
+            "idle_seconds": self.idle,
+            "utilization": self.utilization,
+            "lag_seconds": self.lag.snapshot(),
+        }
+
+
+__all__ = ["SchedulerStats", "Ticket"]
@@ -1,5 +1,11 @@
 from .connectableobservable import ConnectableObservable
 from .groupedobservable import GroupedObservable
 from .observable import Observable
+from .scalarobservable import ScalarObservable
 
-__all__ = ["Observable", "ConnectableObservable", "GroupedObservable"]
+__all__ = [
+    "Observable",
+    "ConnectableObservable",
+    "GroupedObservable",
+    "ScalarObservable",
+]
@@ -36,24 +36,31 @@ def combine_latest_(*sources: Observable[Any]) -> Observable[tuple[Any, ...]]:
         n = len(sources)
         lock = RLock()
         has_value = [False] * n
-        has_value_all = False
         is_done = [False] * n
         values: list[Any] = [None] * n
+        # Counters instead of scanning the flags on every element
+        missing = n
+        done_count = 0
 
         def _next(i: int) -> None:
-            nonlocal has_value_all
+            nonlocal missing
 
-            has_value[i] = True
-            has_value_all = has_value_all or all(has_value)
+            if not has_value[i]:
+                has_value[i] = True
+                missing -= 1
 
-            if has_value_all:
+            if not missing:
                 observer.on_next(tuple(values))
-            elif all(done for j, done in enumerate(is_done) if j != i):
+            elif done_count - is_done[i] == n - 1:
                 observer.on_completed()
 
         def done(i: int) -> None:
-            is_done[i] = True
-            if all(is_done):
+            nonlocal done_count
+
+            if not is_done[i]:
+                is_done[i] = True
+                done_count += 1
+            if done_count == n:
                 observer.on_completed()
 
         subscriptions = [SingleAssignmentDisposable() for _ in range(n)]
@@ -10,6 +10,8 @@ from reactivex.disposable import (
 )
 from reactivex.scheduler import CurrentThreadScheduler
 
+from .scalarobservable import ScalarObservable
+
 _T = TypeVar("_T")
 
 
@@ -40,6 +42,14 @@ def concat_with_iterable_(sources: Iterable[Observable[_T]]) -> Observable[_T]:
             except Exception as ex:  # pylint: disable=broad-except
                 observer.on_error(ex)
             else:
+                # Constant sequences are emitted inline without
+                # subscribing. The next source is still scheduled, so
+                # that endless sources such as repeat() can be disposed.
+                if scheduler_ is None and isinstance(current, ScalarObservable):
+                    if current.emit(observer):
+                        on_completed()
+                    return
+
                 d = SingleAssignmentDisposable()
                 subscription.disposable = d
                 d.disposable = current.subscribe(
@@ -1,6 +1,7 @@
 from typing import Any
 
 from reactivex import Observable, abc
+from reactivex.observable import ScalarObservable
 from reactivex.scheduler import ImmediateScheduler
 
 
@@ -15,6 +16,8 @@ def empty_(scheduler: abc.SchedulerBase | None = None) -> Observable[Any]:
 
         return _scheduler.schedule(action)
 
+    if scheduler is None:
+        return ScalarObservable(subscribe, ())
     return Observable(subscribe)
 
 
@@ -3,6 +3,8 @@ from typing import Any, TypeVar
 
 from reactivex import Observable, abc
 from reactivex.disposable import CompositeDisposable, Disposable
+from reactivex.observable import ScalarObservable
+from reactivex.observable.scalarobservable import MAX_VALUES
 from reactivex.scheduler import CurrentThreadScheduler
 
 _T = TypeVar("_T")
@@ -51,6 +53,13 @@ def from_iterable_(
         disp = Disposable(dispose)
         return CompositeDisposable(_scheduler.schedule(action), disp)
 
+    # Tuples cannot change, so short ones are constant sequences
+    if (
+        scheduler is None
+        and isinstance(iterable, tuple)
+        and len(iterable) <= MAX_VALUES
+    ):
+        return ScalarObservable(subscribe, iterable)
     return Observable(subscribe)
 
 
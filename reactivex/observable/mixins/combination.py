@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+from collections.abc import Callable, Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, cast
 
 if TYPE_CHECKING:
     from asyncio import Future
@@ -100,7 +100,12 @@ class CombinationMixin(Generic[_T]):
 
         return self._as_observable().pipe(ops.concat(*sources))
 
-    def zip(self, *sources: Observable[Any]) -> Observable[Any]:
+    def zip(
+        self,
+        *sources: Observable[Any],
+        max_backlog: int | None = None,
+        overflow: Literal["error", "drop_newest", "drop_oldest"] = "error",
+    ) -> Observable[Any]:
         """Zip with other observables.
 
         Merges the specified observable sequences into one observable sequence
@@ -117,6 +122,8 @@ class CombinationMixin(Generic[_T]):
 
         Args:
             *sources: Observable sequences to zip with the source.
+            max_backlog: Maximum number of elements queued for each source.
+            overflow: What to do when the queue of a source is full.
 
         Returns:
             An observable sequence containing the result of combining elements
@@ -129,7 +136,9 @@ class CombinationMixin(Generic[_T]):
         """
         from reactivex import operators as ops
 
-        return self._as_observable().pipe(ops.zip(*sources))
+        return self._as_observable().pipe(
+            ops.zip(*sources, max_backlog=max_backlog, overflow=overflow)
+        )
 
     def combine_latest(self, *sources: Observable[Any]) -> Observable[Any]:
         """Combine latest values from observables.
@@ -162,6 +171,44 @@ class CombinationMixin(Generic[_T]):
 
         return self._as_observable().pipe(ops.combine_latest(*sources))
 
+    def combine_latest_keyed(
+        self, emit: Literal["snapshot", "delta"] = "snapshot"
+    ) -> Observable[Mapping[Any, Any]]:
+        """Combine latest values of a dynamic set of keyed observables.
+
+        The source must emit ``(key, observable)`` tuples to add a key and
+        ``(key, None)`` tuples to remove it.
+
+        Examples:
+            Fluent style:
+            >>> result = sensors.combine_latest_keyed(emit="delta")
+
+            Equivalent pipe style:
+            >>> from reactivex import operators as ops
+            >>> result = sensors.pipe(ops.combine_latest_keyed(emit="delta"))
+
+        Args:
+            emit: ``"snapshot"`` to emit all latest values, ``"delta"`` to
+                emit only the changed keys.
+
+        Returns:
+            An observable sequence of mappings from key to latest value.
+
+        See Also:
+            - :func:`combine_latest_keyed <reactivex.operators.combine_latest_keyed>`
+            - :meth:`combine_latest`
+        """
+        # Cast is safe: combine_latest_keyed is meant to be called on an
+        # Observable of (key, Observable) tuples, like merge_all on nested
+        # observables.
+        from reactivex import operators as ops
+
+        op: Callable[[Observable[Any]], Observable[Mapping[Any, Any]]] = cast(
+            "Callable[[Observable[Any]], Observable[Mapping[Any, Any]]]",
+            ops.combine_latest_keyed(emit),
+        )
+        return self._as_observable().pipe(op)
+
     def with_latest_from(self, *sources: Observable[Any]) -> Observable[Any]:
         """Combine with latest values from other observables.
 
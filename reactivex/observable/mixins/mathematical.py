@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, overload
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, cast, overload
 
-from reactivex import typing
+from reactivex import abc, typing
 
 if TYPE_CHECKING:
     from reactivex.observable import Observable
 
 _T = TypeVar("_T", covariant=True)
 _TKey = TypeVar("_TKey")
+_A = TypeVar("_A")
 
 
 class MathematicalMixin(Generic[_T]):
@@ -275,3 +277,94 @@ class MathematicalMixin(Generic[_T]):
         from reactivex import operators as ops
 
         return self._as_observable().pipe(ops.max_by(key_mapper, comparer))
+
+    def aggregate_by_key(
+        self,
+        key_mapper: typing.Mapper[_T, _TKey],
+        seed: _A,
+        accumulator: typing.Accumulator[_A, _T],
+        emit: Literal["on_complete", "every_update", "on_interval"] = "on_complete",
+        interval: typing.RelativeTime | None = None,
+        scheduler: abc.SchedulerBase | None = None,
+    ) -> Observable[Any]:
+        """Aggregate elements per key in a single dictionary.
+
+        Fused alternative to grouping followed by a reduce of every group.
+        No observable is created per key.
+
+        Examples:
+            Fluent style:
+            >>> result = source.aggregate_by_key(
+            ...     lambda x: x.id, 0, lambda acc, x: acc + 1
+            ... )
+
+            Equivalent pipe style:
+            >>> from reactivex import operators as ops
+            >>> result = source.pipe(
+            ...     ops.aggregate_by_key(lambda x: x.id, 0, lambda acc, x: acc + 1)
+            ... )
+
+        Args:
+            key_mapper: A function to extract the key for each element.
+            seed: Initial accumulator value for every new key.
+            accumulator: An accumulator function invoked with the current
+                state of the element's key and the element.
+            emit: ``"on_complete"`` emits the final dictionary,
+                ``"every_update"`` emits ``(key, state)`` tuples and
+                ``"on_interval"`` emits the updated keys every ``interval``.
+            interval: Period used with ``emit="on_interval"``.
+            scheduler: Optional scheduler to use for the interval.
+
+        Returns:
+            An observable sequence of keyed aggregates.
+
+        See Also:
+            - :func:`aggregate_by_key <reactivex.operators.aggregate_by_key>`
+            - :meth:`group_by`
+        """
+        from reactivex import operators as ops
+
+        return self._as_observable().pipe(
+            ops.aggregate_by_key(
+                key_mapper, seed, accumulator, emit, interval, scheduler
+            )
+        )
+
+    def rolling(
+        self,
+        agg: Literal["sum", "mean", "min", "max", "var"] | Callable[[Any, Any], Any],
+        count: int | None = None,
+        timespan: typing.RelativeTime | None = None,
+        scheduler: abc.SchedulerBase | None = None,
+    ) -> Observable[Any]:
+        """Compute an aggregate over a sliding window.
+
+        Emits, for every element, the aggregate of the last ``count``
+        elements or of the elements received within ``timespan``. Each
+        element costs amortized O(1) regardless of the window size.
+
+        Examples:
+            Fluent style:
+            >>> result = source.rolling("mean", count=10)
+
+            Equivalent pipe style:
+            >>> from reactivex import operators as ops
+            >>> result = source.pipe(ops.rolling("mean", count=10))
+
+        Args:
+            agg: ``"sum"``, ``"mean"``, ``"min"``, ``"max"``, ``"var"`` or an
+                associative function combining two elements.
+            count: Number of most recent elements in the window.
+            timespan: Maximum age of the elements in the window.
+            scheduler: Optional scheduler to use for timing.
+
+        Returns:
+            An observable sequence with one aggregate per element.
+
+        See Also:
+            - :func:`rolling <reactivex.operators.rolling>`
+            - :meth:`sum`
+        """
+        from reactivex import operators as ops
+
+        return self._as_observable().pipe(ops.rolling(agg, count, timespan, scheduler))
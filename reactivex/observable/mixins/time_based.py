@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, cast
 
 from reactivex import abc, typing
 
@@ -207,3 +207,155 @@ class TimeBasedMixin(Generic[_T]):
         from reactivex import operators as ops
 
         return self._as_observable().pipe(ops.throttle_with_timeout(duetime, scheduler))
+
+    def debounce_by_key(
+        self,
+        key_mapper: typing.Mapper[_T, Any],
+        duetime: typing.RelativeTime,
+        max_keys: int | None = None,
+        scheduler: abc.SchedulerBase | None = None,
+    ) -> Observable[_T]:
+        """Debounce the sequence separately for each key.
+
+        Emits a value once no other value with the same key has been
+        received for duetime. All keys share a single timer.
+
+        Examples:
+            Fluent style:
+            >>> result = source.debounce_by_key(lambda x: x.device_id, 0.5)
+
+            Equivalent pipe style:
+            >>> from reactivex import operators as ops
+            >>> result = source.pipe(ops.debounce_by_key(lambda x: x.device_id, 0.5))
+
+        Args:
+            key_mapper: A function to extract the key for each element.
+            duetime: Duration of the debounce period for each key.
+            max_keys: Maximum number of keys with a pending value.
+            scheduler: Scheduler to use for timing debounce.
+
+        Returns:
+            The debounced sequence.
+
+        See Also:
+            - :func:`debounce_by_key <reactivex.operators.debounce_by_key>`
+            - :meth:`debounce`
+        """
+        from reactivex import operators as ops
+
+        return self._as_observable().pipe(
+            ops.debounce_by_key(key_mapper, duetime, max_keys, scheduler)
+        )
+
+    def throttle_first_by_key(
+        self,
+        key_mapper: typing.Mapper[_T, Any],
+        window_duration: typing.RelativeTime,
+        max_keys: int | None = None,
+        scheduler: abc.SchedulerBase | None = None,
+    ) -> Observable[_T]:
+        """Emit only the first item of each key in each time window.
+
+        Examples:
+            Fluent style:
+            >>> result = source.throttle_first_by_key(lambda x: x.user_id, 1.0)
+
+            Equivalent pipe style:
+            >>> from reactivex import operators as ops
+            >>> result = source.pipe(
+            ...     ops.throttle_first_by_key(lambda x: x.user_id, 1.0)
+            ... )
+
+        Args:
+            key_mapper: A function to extract the key for each element.
+            window_duration: Duration of the window opened for a key by an
+                emitted item.
+            max_keys: Maximum number of open windows.
+            scheduler: Scheduler to use for timing.
+
+        Returns:
+            An observable that performs the throttle operation.
+
+        See Also:
+            - :func:`throttle_first_by_key <reactivex.operators.throttle_first_by_key>`
+            - :meth:`throttle_first`
+        """
+        from reactivex import operators as ops
+
+        return self._as_observable().pipe(
+            ops.throttle_first_by_key(key_mapper, window_duration, max_keys, scheduler)
+        )
+
+    def sample_by_key(
+        self,
+        key_mapper: typing.Mapper[_T, Any],
+        interval: typing.RelativeTime,
+        max_keys: int | None = None,
+        scheduler: abc.SchedulerBase | None = None,
+    ) -> Observable[_T]:
+        """Sample the latest value of every key at each interval.
+
+        Examples:
+            Fluent style:
+            >>> result = source.sample_by_key(lambda x: x.sensor_id, 1.0)
+
+            Equivalent pipe style:
+            >>> from reactivex import operators as ops
+            >>> result = source.pipe(ops.sample_by_key(lambda x: x.sensor_id, 1.0))
+
+        Args:
+            key_mapper: A function to extract the key for each element.
+            interval: Time interval at which to sample.
+            max_keys: Maximum number of keys with a pending value.
+            scheduler: Scheduler to use for the interval.
+
+        Returns:
+            Sampled observable sequence.
+
+        See Also:
+            - :func:`sample_by_key <reactivex.operators.sample_by_key>`
+            - :meth:`sample`
+        """
+        from reactivex import operators as ops
+
+        return self._as_observable().pipe(
+            ops.sample_by_key(key_mapper, interval, max_keys, scheduler)
+        )
+
+    def rate_limit(
+        self,
+        rate: float,
+        burst: int = 1,
+        max_queue: int | None = None,
+        overflow: Literal["error", "drop_newest", "drop_oldest"] = "error",
+        scheduler: abc.SchedulerBase | None = None,
+    ) -> Observable[_T]:
+        """Limit the rate of elements using a token bucket.
+
+        Examples:
+            Fluent style:
+            >>> result = source.rate_limit(100.0, burst=10)
+
+            Equivalent pipe style:
+            >>> from reactivex import operators as ops
+            >>> result = source.pipe(ops.rate_limit(100.0, burst=10))
+
+        Args:
+            rate: Number of elements per second.
+            burst: Maximum number of elements forwarded back to back.
+            max_queue: Maximum number of queued elements.
+            overflow: What to do when the queue is full.
+            scheduler: Scheduler to use for timing.
+
+        Returns:
+            The rate limited observable sequence.
+
+        See Also:
+            - :func:`rate_limit <reactivex.operators.rate_limit>`
+            - :meth:`throttle_first`
+        """
+        from reactivex import operators as ops
+
+        return self._as_observable().pipe(
+            ops.rate_limit(rate, burst, max_queue, overflow, scheduler)
+        )
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 from reactivex import abc, typing
 
 if TYPE_CHECKING:
+    from reactivex.metrics import Histogram
     from reactivex.observable import Observable
 
 
@@ -315,6 +316,64 @@ class UtilityMixin(Generic[_T]):
 
         return self._as_observable().pipe(ops.time_interval(scheduler))
 
+    def stamp_latency(self) -> Observable[_T]:
+        """Stamp elements with their ingress time.
+
+        The stamp is kept on the side and carried to
+        :meth:`measure_latency`, also across ``observe_on``, ``delay``,
+        ``merge`` and time based buffers.
+
+        Examples:
+            Fluent style:
+            >>> result = source.stamp_latency().observe_on(pool).measure_latency()
+
+            Equivalent pipe style:
+            >>> from reactivex import operators as ops
+            >>> result = source.pipe(ops.stamp_latency())
+
+        Returns:
+            The source sequence with its elements stamped.
+
+        See Also:
+            - :func:`stamp_latency <reactivex.operators.stamp_latency>`
+            - :meth:`measure_latency`
+        """
+        from reactivex import operators as ops
+
+        return self._as_observable().pipe(ops.stamp_latency())
+
+    def measure_latency(
+        self, histogram: Histogram | None = None, label: str | None = None
+    ) -> Observable[_T]:
+        """Measure the latency of stamped elements.
+
+        Records the time since every element was stamped by
+        :meth:`stamp_latency` in a latency histogram.
+
+        Examples:
+            Fluent style:
+            >>> result = source.measure_latency(label="orders")
+
+            Equivalent pipe style:
+            >>> from reactivex import operators as ops
+            >>> result = source.pipe(ops.measure_latency(label="orders"))
+
+        Args:
+            histogram: Histogram to record the latencies in.
+            label: Label of the latency histogram in the default metrics
+                registry, used if no histogram is given.
+
+        Returns:
+            The source sequence, unchanged.
+
+        See Also:
+            - :func:`measure_latency <reactivex.operators.measure_latency>`
+            - :meth:`stamp_latency`
+        """
+        from reactivex import operators as ops
+
+        return self._as_observable().pipe(ops.measure_latency(histogram, label))
+
     def delay_subscription(
         self,
         duetime: typing.AbsoluteOrRelativeTime,
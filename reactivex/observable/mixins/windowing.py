@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, cast, overload
 
 from reactivex import typing
 
 if TYPE_CHECKING:
     from reactivex.observable import Observable
+    from reactivex.operators import BufferView
 
 
 _T = TypeVar("_T", covariant=True)
@@ -72,6 +73,10 @@ class WindowingMixin(Generic[_T]):
         key_mapper: typing.Mapper[_T, Any],
         element_mapper: typing.Mapper[_T, Any] | None = None,
         subject_mapper: Callable[[], Any] | None = None,
+        max_groups: int | None = None,
+        idle_timeout: typing.RelativeTime | None = None,
+        counters: Any | None = None,
+        scheduler: Any = None,
     ) -> Observable[Any]:
         """Group elements by key.
 
@@ -97,6 +102,14 @@ class WindowingMixin(Generic[_T]):
                 element in an observable group.
             subject_mapper: A function that returns a subject to use for
                 each group.
+            max_groups: Maximum number of open groups. The least recently
+                used group is completed when the limit is exceeded.
+            idle_timeout: Time after which a group without elements is
+                completed.
+            counters: A ``GroupByCounters`` instance updated with the
+                number of active and evicted groups.
+            scheduler: Scheduler to run the ``idle_timeout`` timer on. If
+                not specified, defaults to timeout scheduler.
 
         Returns:
             A sequence of observable groups, each of which corresponds to
@@ -110,7 +123,15 @@ class WindowingMixin(Generic[_T]):
         from reactivex import operators as ops
 
         return self._as_observable().pipe(
-            ops.group_by(key_mapper, element_mapper, subject_mapper)
+            ops.group_by(
+                key_mapper,
+                element_mapper,
+                subject_mapper,
+                max_groups=max_groups,
+                idle_timeout=idle_timeout,
+                counters=counters,
+                scheduler=scheduler,
+            )
         )
 
     def partition(self, predicate: typing.Predicate[_T]) -> list[Observable[_T]]:
@@ -212,9 +233,19 @@ class WindowingMixin(Generic[_T]):
 
         return ops.partition_indexed(predicate_indexed)(self._as_observable())
 
+    @overload
     def buffer_with_count(
-        self, count: int, skip: int | None = None
-    ) -> Observable[list[_T]]:
+        self, count: int, skip: int | None = None, view: Literal[False] = False
+    ) -> Observable[list[_T]]: ...
+
+    @overload
+    def buffer_with_count(
+        self, count: int, skip: int | None = None, *, view: Literal[True]
+    ) -> Observable[BufferView[_T]]: ...
+
+    def buffer_with_count(
+        self, count: int, skip: int | None = None, view: bool = False
+    ) -> Observable[Any]:
         """Buffer elements by count.
 
         Projects each element of an observable sequence into zero or more buffers
@@ -233,6 +264,8 @@ class WindowingMixin(Generic[_T]):
             count: Length of each buffer.
             skip: Number of elements to skip between creation of consecutive
                 buffers. If not specified, defaults to count.
+            view: If True, emit read-only views over a shared storage
+                instead of lists.
 
         Returns:
             An observable sequence of buffers.
@@ -244,6 +277,10 @@ class WindowingMixin(Generic[_T]):
         """
         from reactivex import operators as ops
 
+        if view:
+            return self._as_observable().pipe(
+                ops.buffer_with_count(count, skip, view=True)
+            )
         return self._as_observable().pipe(ops.buffer_with_count(count, skip))
 
     def buffer_with_time(
@@ -1,15 +1,13 @@
 # By design, pylint: disable=C0302
 from __future__ import annotations
 
-import asyncio
 import threading
 from collections.abc import Callable, Generator
-from typing import Any, TypeVar, cast, overload
+from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
 
 from reactivex import abc
 from reactivex.disposable import Disposable
 from reactivex.scheduler import CurrentThreadScheduler
-from reactivex.scheduler.eventloop import AsyncIOScheduler
 
 from ..observer import AutoDetachObserver
 from .mixins import (
@@ -26,6 +24,11 @@ from .mixins import (
     WindowingMixin,
 )
 
+if TYPE_CHECKING:
+    import asyncio
+
+    from reactivex.metrics import MetricsRegistry
+
 _A = TypeVar("_A")
 _B = TypeVar("_B")
 _C = TypeVar("_C")
@@ -267,6 +270,28 @@ class Observable(
 
         return pipe_(self, *operators)
 
+    def explain(
+        self, registry: MetricsRegistry | None = None, label: str | None = None
+    ) -> None:
+        """Prints the graph of the pipeline with the estimated cost of
+        every stage.
+
+        Only pipelines assembled after :func:`reactivex.graph.enable`
+        are recorded. See :func:`reactivex.graph.explain`.
+
+        Examples:
+            >>> graph.enable()
+            >>> source.pipe(ops.map(parse)).explain()
+
+        Args:
+            registry: [Optional] Metrics registry to take the costs
+                from.
+            label: [Optional] Label the pipeline was instrumented with.
+        """
+        from ..graph import explain
+
+        print(explain(self, registry, label))
+
     def run(self, scheduler: abc.SchedulerBase | None = None) -> _T_out:
         """Run source synchronously.
 
@@ -295,7 +320,10 @@ class Observable(
         Returns:
             The last item of the observable sequence.
         """
+        import asyncio
+
         from ..operators._tofuture import to_future_
+        from ..scheduler.eventloop import AsyncIOScheduler
 
         try:
             loop = asyncio.get_running_loop()
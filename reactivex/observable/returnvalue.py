@@ -2,6 +2,7 @@ from collections.abc import Callable
 from typing import Any, TypeVar
 
 from reactivex import Observable, abc
+from reactivex.observable import ScalarObservable
 from reactivex.scheduler import CurrentThreadScheduler
 
 _T = TypeVar("_T")
@@ -37,6 +38,8 @@ def return_value_(
 
         return _scheduler.schedule(action)
 
+    if scheduler is None:
+        return ScalarObservable(subscribe, (value,))
     return Observable(subscribe)
 
 
@@ -0,0 +1,77 @@
+from typing import TypeVar
+
+from reactivex import abc
+
+from .observable import Observable
+
+_T = TypeVar("_T")
+
+MAX_VALUES = 16
+"""Longest sequence of values that is made a scalar observable. Longer
+sequences are always subscribed to, so that consumers do not emit them
+while holding their locks."""
+
+
+class ScalarObservable(Observable[_T]):
+    """Observable sequence whose notifications are constants known when
+    it is created.
+
+    :func:`reactivex.return_value`, :func:`reactivex.empty`,
+    :func:`reactivex.throw` and :func:`reactivex.of` with a few values
+    return scalar observables when no scheduler is given. Operators that
+    subscribe to many inner sequences, such as ``merge_all``, ``concat``
+    and ``zip``, emit the notifications of a scalar observable inline
+    instead of subscribing to it, which saves the subscription, the
+    scheduled action and its disposables. The
+    notifications are then emitted on the thread of the operator, as if
+    the scalar observable were subscribed with the immediate scheduler.
+    This only happens when the operator itself is subscribed without a
+    scheduler. ``switch_latest`` always subscribes, since emitting
+    inline would not let a later inner sequence replace an earlier
+    one. A scheduler given to ``subscribe`` is passed on to the
+    scalar observable as to any other inner sequence, so its
+    notifications are emitted on that scheduler.
+
+    Subscribing to a scalar observable behaves like the observable
+    returned by the same function with a scheduler.
+
+    Attributes:
+        values: The elements of the sequence.
+        error: The error terminating the sequence, or None if it
+            completes.
+    """
+
+    def __init__(
+        self,
+        subscribe: abc.Subscription[_T],
+        values: tuple[_T, ...],
+        error: Exception | None = None,
+    ) -> None:
+        super().__init__(subscribe)
+        self.values = values
+        self.error = error
+
+    def emit(self, observer: abc.ObserverBase[_T]) -> bool:
+        """Sends the elements, and the error if any, to an observer.
+
+        The completion is not sent, as consumers emitting the sequence
+        inline decide themselves when their output completes.
+
+        Args:
+            observer: Observer to send the notifications to.
+
+        Returns:
+            True if the sequence completes, False if it terminates with
+            an error.
+        """
+
+        for value in self.values:
+            observer.on_next(value)
+
+        if self.error is not None:
+            observer.on_error(self.error)
+            return False
+        return True
+
+
+__all__ = ["MAX_VALUES", "ScalarObservable"]
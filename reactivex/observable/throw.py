@@ -1,6 +1,7 @@
 from typing import Any
 
 from reactivex import Observable, abc
+from reactivex.observable import ScalarObservable
 from reactivex.scheduler import ImmediateScheduler
 
 
@@ -19,6 +20,8 @@ def throw_(
 
         return _scheduler.schedule(action)
 
+    if scheduler is None:
+        return ScalarObservable(subscribe, (), exception_)
     return Observable(subscribe)
 
 
@@ -1,12 +1,29 @@
+from collections import deque
+from itertools import chain
 from threading import RLock
-from typing import Any
+from typing import Any, Literal
 
 from reactivex import Observable, abc, from_future
-from reactivex.disposable import CompositeDisposable, SingleAssignmentDisposable
-from reactivex.internal import is_future, synchronized
-
-
-def zip_(*args: Observable[Any]) -> Observable[tuple[Any, ...]]:
+from reactivex.disposable import (
+    CompositeDisposable,
+    Disposable,
+    SingleAssignmentDisposable,
+)
+from reactivex.internal import (
+    ArgumentOutOfRangeException,
+    QueueOverflowError,
+    buffers,
+    is_future,
+    synchronized,
+)
+from reactivex.observable import ScalarObservable
+
+
+def zip_(
+    *args: Observable[Any],
+    max_backlog: int | None = None,
+    overflow: Literal["error", "drop_newest", "drop_oldest"] = "error",
+) -> Observable[tuple[Any, ...]]:
     """Merges the specified observable sequences into one observable
     sequence by creating a tuple whenever all of the
     observable sequences have produced an element at a corresponding
@@ -14,51 +31,82 @@ def zip_(*args: Observable[Any]) -> Observable[tuple[Any, ...]]:
 
     Example:
         >>> res = zip(obs1, obs2)
+        >>> res = zip(obs1, obs2, max_backlog=1000, overflow="drop_oldest")
 
     Args:
         args: Observable sources to zip.
+        max_backlog: Optional maximum number of elements queued for
+            each source.
+        overflow: What to do when an element arrives and the queue of
+            its source is full.
 
     Returns:
         An observable sequence containing the result of combining
         elements of the sources as tuple.
     """
 
+    if max_backlog is not None and max_backlog < 1:
+        raise ArgumentOutOfRangeException()
+
+    if overflow not in ("error", "drop_newest", "drop_oldest"):
+        raise ValueError(f"Invalid overflow policy: {overflow!r}")
+
     sources = list(args)
 
     def subscribe(
         observer: abc.ObserverBase[Any], scheduler: abc.SchedulerBase | None = None
     ) -> CompositeDisposable:
         n = len(sources)
-        queues: list[list[Any]] = [[] for _ in range(n)]
+        queues: list[deque[Any]] = [deque() for _ in range(n)]
         lock = RLock()
         is_completed = [False] * n
+        non_empty = 0
+        gauge = buffers.track(
+            "zip",
+            lambda: sum(len(queue) for queue in queues),
+            lambda: chain.from_iterable(queues),
+        )
 
         @synchronized(lock)
-        def next_(i: int) -> None:
-            if all(len(q) for q in queues):
-                try:
-                    queued_values = [x.pop(0) for x in queues]
-                    res = tuple(queued_values)
-                except Exception as ex:  # pylint: disable=broad-except
-                    observer.on_error(ex)
-                    return
-
-                observer.on_next(res)
+        def next_(i: int, x: Any) -> None:
+            nonlocal non_empty
 
-                # after sending the zipped values, complete the observer if at least one
-                # upstream observable is completed and its queue has length zero
-                if any(
-                    (
-                        done
-                        for queue, done in zip(queues, is_completed)
-                        if len(queue) == 0
-                    )
-                ):
-                    observer.on_completed()
+            queue = queues[i]
+            if max_backlog is not None and len(queue) >= max_backlog:
+                if overflow == "error":
+                    observer.on_error(QueueOverflowError())
+                    return
+                if overflow == "drop_newest":
+                    return
+                queue.popleft()
+            elif not queue:
+                non_empty += 1
+
+            queue.append(x)
+            if non_empty < n:
+                if gauge is not None:
+                    gauge.check()
+                return
+
+            values: list[Any] = []
+            exhausted = False
+            for queue, done in zip(queues, is_completed):
+                values.append(queue.popleft())
+                if not queue:
+                    non_empty -= 1
+                    exhausted = exhausted or done
+
+            observer.on_next(tuple(values))
+
+            # after sending the zipped values, complete the observer if at least one
+            # upstream observable is completed and its queue has length zero
+            if exhausted:
+                observer.on_completed()
 
+        @synchronized(lock)
         def completed(i: int) -> None:
             is_completed[i] = True
-            if len(queues[i]) == 0:
+            if not queues[i]:
                 observer.on_completed()
 
         subscriptions: list[abc.DisposableBase | None] = [None] * n
@@ -68,11 +116,21 @@ def zip_(*args: Observable[Any]) -> Observable[tuple[Any, ...]]:
             if is_future(source):
                 source = from_future(source)
 
+            # Constant sequences are queued inline without subscribing
+            if scheduler is None and isinstance(source, ScalarObservable):
+                for value in source.values:
+                    next_(i, value)
+                if source.error is not None:
+                    observer.on_error(source.error)
+                else:
+                    completed(i)
+                subscriptions[i] = Disposable()
+                return
+
             sad = SingleAssignmentDisposable()
 
             def on_next(x: Any) -> None:
-                queues[i].append(x)
-                next_(i)
+                next_(i, x)
 
             sad.disposable = source.subscribe(
                 on_next, observer.on_error, lambda: completed(i), scheduler=scheduler
@@ -81,6 +139,8 @@ def zip_(*args: Observable[Any]) -> Observable[tuple[Any, ...]]:
 
         for idx in range(n):
             func(idx)
+        if gauge is not None:
+            subscriptions.append(gauge)
         return CompositeDisposable(subscriptions)
 
     return Observable(subscribe)
@@ -2,5 +2,12 @@ from .autodetachobserver import AutoDetachObserver
 from .observeonobserver import ObserveOnObserver
 from .observer import Observer
 from .scheduledobserver import ScheduledObserver
+from .serializedobserver import SerializedObserver
 
-__all__ = ["AutoDetachObserver", "ObserveOnObserver", "Observer", "ScheduledObserver"]
+__all__ = [
+    "AutoDetachObserver",
+    "ObserveOnObserver",
+    "Observer",
+    "ScheduledObserver",
+    "SerializedObserver",
+]
@@ -1,13 +1,21 @@
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
 from .scheduledobserver import ScheduledObserver
 
+if TYPE_CHECKING:
+    from reactivex.internal.buffers import BufferGauge
+
 _T = TypeVar("_T")
 
 
 class ObserveOnObserver(ScheduledObserver[_T]):
+    gauge: "BufferGauge | None" = None
+    """Set by observe_on when buffers are tracked."""
+
     def _on_next_core(self, value: _T) -> None:
         super()._on_next_core(value)
+        if self.gauge is not None:
+            self.gauge.check()
         self.ensure_active()
 
     def _on_error_core(self, error: Exception) -> None:
@@ -3,6 +3,7 @@ from typing import Any, TypeVar
 
 from reactivex import abc, typing
 from reactivex.disposable import SerialDisposable
+from reactivex.internal import latency
 
 from .observer import Observer
 
@@ -28,8 +29,16 @@ class ScheduledObserver(Observer[_T_in]):
         # http://effbot.org/pyfaq/what-kinds-of-global-value-mutation-are-thread-safe.htm
 
     def _on_next_core(self, value: Any) -> None:
-        def action() -> None:
-            self.observer.on_next(value)
+        if latency.active:
+            stamp = latency.current.stamp
+
+            def action() -> None:
+                latency.emit(self.observer, value, stamp)
+
+        else:
+
+            def action() -> None:
+                self.observer.on_next(value)
 
         self.queue.append(action)
 
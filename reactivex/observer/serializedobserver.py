@@ -0,0 +1,107 @@
+import threading
+from collections import deque
+from typing import Any, TypeVar
+
+from reactivex import abc
+from reactivex.internal import latency
+
+_T_in = TypeVar("_T_in", contravariant=True)
+
+
+class _Stop:
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception | None) -> None:
+        self.error = error
+
+
+class _Stamped:
+    __slots__ = ("value", "stamp")
+
+    def __init__(self, value: Any, stamp: float | None) -> None:
+        self.value = value
+        self.stamp = stamp
+
+
+class SerializedObserver(abc.ObserverBase[_T_in]):
+    """Serializes notifications from concurrent producers.
+
+    Implements the emitter loop: every notification is appended to a
+    queue, and the thread that manages to take the emitter lock without
+    blocking drains it. Threads arriving while another thread is
+    emitting just enqueue and return, so producers never wait for each
+    other or for the downstream observer. The observer is never called
+    with the lock held by another thread, and re-entrant calls from the
+    observer are queued instead of deadlocking.
+    """
+
+    def __init__(self, observer: abc.ObserverBase[_T_in]) -> None:
+        self.observer = observer
+        self.queue: deque[Any] = deque()
+        self.emitter = threading.Lock()
+        self.is_stopped = False
+        self.is_done = False
+
+    def on_next(self, value: _T_in) -> None:
+        if self.is_stopped:
+            return
+
+        # Fast path for an uncontended observer, skipping the queue
+        if not self.queue and self.emitter.acquire(blocking=False):
+            try:
+                if not self.is_done:
+                    self.observer.on_next(value)
+            finally:
+                self.emitter.release()
+
+            if self.queue:
+                self._drain()
+            return
+
+        if latency.active:
+            self.queue.append(_Stamped(value, latency.current.stamp))
+        else:
+            self.queue.append(value)
+        self._drain()
+
+    def on_error(self, error: Exception) -> None:
+        if self.is_stopped:
+            return
+        self.is_stopped = True
+
+        self.queue.append(_Stop(error))
+        self._drain()
+
+    def on_completed(self) -> None:
+        if self.is_stopped:
+            return
+        self.is_stopped = True
+
+        self.queue.append(_Stop(None))
+        self._drain()
+
+    def _drain(self) -> None:
+        queue = self.queue
+        observer = self.observer
+
+        # Re-check the queue after releasing the lock, as another thread
+        # may have enqueued while failing to take it.
+        while queue and self.emitter.acquire(blocking=False):
+            try:
+                while queue:
+                    item = queue.popleft()
+                    if self.is_done:
+                        queue.clear()
+                    elif item.__class__ is _Stamped:
+                        latency.emit(observer, item.value, item.stamp)
+                    elif item.__class__ is _Stop:
+                        self.is_done = True
+                        queue.clear()
+                        if item.error is None:
+                            observer.on_completed()
+                        else:
+                            observer.on_error(item.error)
+                    else:
+                        observer.on_next(item)
+            finally:
+                self.emitter.release()
@@ -1,13 +1,15 @@
 # pylint: disable=too-many-lines,redefined-builtin,import-outside-toplevel
 
+# Annotations are not evaluated, so that importing the operators does
+# not spend time building thousands of type expressions
+from __future__ import annotations
 
-import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
+    Literal,
     TypeVar,
-    Union,
     cast,
     overload,
 )
@@ -23,6 +25,7 @@ from reactivex import (
     compose,
     typing,
 )
+from reactivex.internal.lazy import lazy_attributes
 from reactivex.internal.utils import NotSet
 from reactivex.subject import Subject
 from reactivex.typing import (
@@ -34,6 +37,24 @@ from reactivex.typing import (
     PredicateIndexed,
 )
 
+if TYPE_CHECKING:
+    import asyncio
+
+    from ._buffer import BufferView
+    from ._combinelatestkeyed import REMOVED
+    from ._groupby import GroupByCounters
+
+# Classes defined next to their operator are imported on first use,
+# like the operators themselves
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "BufferView": "._buffer",
+        "GroupByCounters": "._groupby",
+        "REMOVED": "._combinelatestkeyed",
+    },
+)
+
 _T = TypeVar("_T")
 _T1 = TypeVar("_T1")
 _T2 = TypeVar("_T2")
@@ -46,6 +67,86 @@ _TLeft = TypeVar("_TLeft")
 _Ts = TypeVarTuple("_Ts")
 
 
+@overload
+def aggregate_by_key(
+    key_mapper: Mapper[_T, _TKey],
+    seed: _TState,
+    accumulator: Accumulator[_TState, _T],
+    emit: Literal["every_update"],
+    interval: typing.RelativeTime | None = None,
+    scheduler: abc.SchedulerBase | None = None,
+) -> Callable[[Observable[_T]], Observable[tuple[_TKey, _TState]]]: ...
+
+
+@overload
+def aggregate_by_key(
+    key_mapper: Mapper[_T, _TKey],
+    seed: _TState,
+    accumulator: Accumulator[_TState, _T],
+    emit: Literal["on_complete", "on_interval"] = "on_complete",
+    interval: typing.RelativeTime | None = None,
+    scheduler: abc.SchedulerBase | None = None,
+) -> Callable[[Observable[_T]], Observable[dict[_TKey, _TState]]]: ...
+
+
+def aggregate_by_key(
+    key_mapper: Mapper[_T, _TKey],
+    seed: _TState,
+    accumulator: Accumulator[_TState, _T],
+    emit: Literal["on_complete", "every_update", "on_interval"] = "on_complete",
+    interval: typing.RelativeTime | None = None,
+    scheduler: abc.SchedulerBase | None = None,
+) -> Callable[[Observable[_T]], Observable[Any]]:
+    """Aggregates the elements of an observable sequence per key.
+
+    Fused alternative to ``group_by`` followed by a ``reduce`` or
+    ``scan`` of every group. The state of all keys is kept in a single
+    dictionary, so no observable is created per key.
+
+    .. marble::
+        :alt: aggregate_by_key
+
+        --a1--b2--a3--b4--|
+        [ aggregate_by_key ]
+        ------------------{a:4, b:6}|
+
+    Examples:
+        >>> op = aggregate_by_key(lambda x: x.id, 0, lambda acc, x: acc + 1)
+        >>> op = aggregate_by_key(
+            lambda x: x.id, 0, lambda acc, x: acc + x.value, emit="every_update"
+        )
+        >>> op = aggregate_by_key(
+            lambda x: x.id, 0, lambda acc, x: acc + 1, "on_interval", 1.0
+        )
+
+    Args:
+        key_mapper: A function to extract the key for each element.
+        seed: Initial accumulator value for every new key. The same
+            object is used for all keys, so the accumulator should
+            return a new value rather than mutate it.
+        accumulator: An accumulator function invoked with the current
+            state of the element's key and the element.
+        emit: [Optional] When to emit results. ``"on_complete"``
+            (default) emits the final dictionary of all keys when the
+            source completes. ``"every_update"`` emits a
+            ``(key, state)`` tuple for every element.
+            ``"on_interval"`` emits, every ``interval``, a dictionary
+            holding only the keys updated since the previous emission.
+        interval: [Optional] Period used with ``emit="on_interval"``.
+        scheduler: [Optional] Scheduler used with
+            ``emit="on_interval"``.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence of keyed aggregates.
+    """
+    from ._aggregatebykey import aggregate_by_key_
+
+    return aggregate_by_key_(
+        key_mapper, seed, accumulator, emit, interval, scheduler=scheduler
+    )
+
+
 def all(predicate: Predicate[_T]) -> Callable[[Observable[_T]], Observable[bool]]:
     """Determines whether all elements of an observable sequence satisfy
     a condition.
@@ -75,7 +176,7 @@ def all(predicate: Predicate[_T]) -> Callable[[Observable[_T]], Observable[bool]
 
 
 def amb(
-    right_source: Union[Observable[_T], "typing.AnyFuture[_T]"],
+    right_source: Observable[_T] | typing.AnyFuture[_T],
 ) -> Callable[[Observable[_T]], Observable[_T]]:
     """Propagates the observable sequence that reacts first.
 
@@ -247,9 +348,21 @@ def buffer_toggle(
     return buffer_toggle_(openings, closing_mapper)
 
 
+@overload
 def buffer_with_count(
-    count: int, skip: int | None = None
-) -> Callable[[Observable[_T]], Observable[list[_T]]]:
+    count: int, skip: int | None = None, view: Literal[False] = False
+) -> Callable[[Observable[_T]], Observable[list[_T]]]: ...
+
+
+@overload
+def buffer_with_count(
+    count: int, skip: int | None = None, *, view: Literal[True]
+) -> Callable[[Observable[_T]], Observable[BufferView[_T]]]: ...
+
+
+def buffer_with_count(
+    count: int, skip: int | None = None, view: bool = False
+) -> Callable[[Observable[_T]], Observable[Sequence[_T]]]:
     """Projects each element of an observable sequence into zero or more
     buffers which are produced based on element count information.
 
@@ -263,12 +376,18 @@ def buffer_with_count(
     Examples:
         >>> res = buffer_with_count(10)(xs)
         >>> res = buffer_with_count(10, 1)(xs)
+        >>> res = buffer_with_count(1000, 1, view=True)(xs)
 
     Args:
         count: Length of each buffer.
         skip: [Optional] Number of elements to skip between
             creation of consecutive buffers. If not provided, defaults to
             the count.
+        view: [Optional] If True, buffers are emitted as read-only
+            :class:`BufferView` sequences over a single shared storage
+            instead of lists. Overlapping buffers then share their
+            elements, avoiding a copy of ``count`` elements for every
+            emitted buffer. Call ``copy()`` on a view to get a list.
 
     Returns:
         A function that takes an observable source and returns an
@@ -276,7 +395,7 @@ def buffer_with_count(
     """
     from ._buffer import buffer_with_count_
 
-    return buffer_with_count_(count, skip)
+    return buffer_with_count_(count, skip, view)
 
 
 def buffer_with_time(
@@ -421,6 +540,46 @@ def combine_latest(
     return combine_latest_(*others)
 
 
+def combine_latest_keyed(
+    emit: Literal["snapshot", "delta"] = "snapshot",
+) -> Callable[
+    [Observable[tuple[_TKey, Observable[Any] | None]]],
+    Observable[Mapping[_TKey, Any]],
+]:
+    """Combines the latest values of a changing set of keyed
+    observable sequences.
+
+    The source emits ``(key, observable)`` tuples to add or replace a
+    key and ``(key, None)`` tuples to remove it. Like
+    :func:`combine_latest`, nothing is emitted until every current key
+    has produced a value. The result completes when the source and all
+    current inner sequences have completed.
+
+    Examples:
+        >>> res = combine_latest_keyed()
+        >>> res = combine_latest_keyed(emit="delta")
+
+    Args:
+        emit: [Optional] ``"snapshot"`` (default) emits a read-only
+            mapping of the latest value of every key on each update.
+            Snapshots share their entries with the previous snapshot,
+            so they are cheap to keep, and their keys are in no
+            particular order. ``"delta"`` emits a
+            dictionary with only the keys changed since the previous
+            emission, where removed keys map to :data:`REMOVED`. An
+            update costs O(1) in delta mode and O(log N) in snapshot
+            mode, where N is the number of keys.
+
+    Returns:
+        An operator function that takes an observable sequence of
+        additions and removals and returns an observable sequence of
+        mappings.
+    """
+    from ._combinelatestkeyed import combine_latest_keyed_
+
+    return combine_latest_keyed_(emit)
+
+
 def concat(*sources: Observable[_T]) -> Callable[[Observable[_T]], Observable[_T]]:
     """Concatenates all the observable sequences.
 
@@ -578,6 +737,42 @@ def debounce(
     return debounce_(duetime, scheduler)
 
 
+def debounce_by_key(
+    key_mapper: Mapper[_T, _TKey],
+    duetime: typing.RelativeTime,
+    max_keys: int | None = None,
+    scheduler: abc.SchedulerBase | None = None,
+) -> Callable[[Observable[_T]], Observable[_T]]:
+    """Debounces the values of an observable sequence separately for
+    each key.
+
+    A value is emitted once no other value with the same key has been
+    received for duetime. This replaces ``group_by`` followed by a
+    ``debounce`` of every group: pending values are kept in a single
+    dictionary and a single timer drives the deadlines of all keys.
+    Pending values are emitted when the source completes.
+
+    Example:
+        >>> res = debounce_by_key(lambda x: x.device_id, 5.0)
+
+    Args:
+        key_mapper: A function to extract the key for each element.
+        duetime: Duration to wait after the last value of a key before
+            emitting it.
+        max_keys: [Optional] Maximum number of keys with a pending
+            value. When exceeded, the pending value of the least
+            recently updated key is emitted right away.
+        scheduler: [Optional] Scheduler to debounce values on.
+
+    Returns:
+        An operator function that takes the source observable and
+        returns the debounced observable sequence.
+    """
+    from ._bykey import debounce_by_key_
+
+    return debounce_by_key_(key_mapper, duetime, max_keys, scheduler)
+
+
 throttle_with_timeout = debounce
 
 
@@ -1269,13 +1464,13 @@ def flat_map(
 
 @overload
 def flat_map(
-    mapper: "typing.AnyFuture[_T2] | None" = None,
+    mapper: typing.AnyFuture[_T2] | None = None,
 ) -> Callable[[Observable[Any]], Observable[_T2]]: ...
 
 
 @overload
 def flat_map(
-    mapper: Mapper[_T1, "typing.AnyFuture[_T2]"] | None = None,
+    mapper: Mapper[_T1, typing.AnyFuture[_T2]] | None = None,
 ) -> Callable[[Observable[_T1]], Observable[_T2]]: ...
 
 
@@ -1308,6 +1503,11 @@ def flat_map(
     Example:
         >>> flat_map(Observable.of(1, 2, 3))
 
+    Inner sequences created by ``just``, ``empty``, ``throw`` or ``of``
+    without a scheduler are emitted as soon as they are projected, so
+    within one trampoline run their values can come before the values
+    of inner sequences projected earlier.
+
     Args:
         mapper: A transform function to apply to each element or an
             observable sequence to project each element from the source
@@ -1393,7 +1593,7 @@ def flat_map_indexed(
 
 
 def flat_map_latest(
-    mapper: Mapper[_T1, Union[Observable[_T2], "typing.AnyFuture[_T2]"]],
+    mapper: Mapper[_T1, Observable[_T2] | typing.AnyFuture[_T2]],
 ) -> Callable[[Observable[_T1]], Observable[_T2]]:
     """Projects each element of an observable sequence into a new
     sequence of observable sequences by incorporating the element's
@@ -1453,6 +1653,10 @@ def group_by(
     key_mapper: Mapper[_T, _TKey],
     element_mapper: Mapper[_T, _TValue] | None = None,
     subject_mapper: Callable[[], Subject[_TValue]] | None = None,
+    max_groups: int | None = None,
+    idle_timeout: typing.RelativeTime | None = None,
+    counters: GroupByCounters | None = None,
+    scheduler: abc.SchedulerBase | None = None,
 ) -> Callable[[Observable[_T]], Observable[GroupedObservable[_TKey, _TValue]]]:
     """Groups the elements of an observable sequence according to a
     specified key mapper function and comparer and selects the
@@ -1471,6 +1675,7 @@ def group_by(
         >>> group_by(lambda x: x.id)
         >>> group_by(lambda x: x.id, lambda x: x.name)
         >>> group_by(lambda x: x.id, lambda x: x.name, lambda: ReplaySubject())
+        >>> group_by(lambda x: x.id, max_groups=10_000, idle_timeout=60.0)
 
     Keyword arguments:
         key_mapper: A function to extract the key for each element.
@@ -1478,6 +1683,15 @@ def group_by(
             element to an element in an observable group.
         subject_mapper: A function that returns a subject used to initiate
             a grouped observable. Default mapper returns a Subject object.
+        max_groups: [Optional] Maximum number of open groups. When a
+            new key would exceed the limit, the least recently used
+            group is completed.
+        idle_timeout: [Optional] Relative time after which a group
+            that has not received any element is completed. All groups
+            share a single timer.
+        counters: [Optional] A :class:`GroupByCounters` instance that
+            is updated with the number of active and evicted groups.
+        scheduler: [Optional] Scheduler used for ``idle_timeout``.
 
     Returns:
         An operator function that takes an observable source and
@@ -1487,7 +1701,15 @@ def group_by(
     """
     from ._groupby import group_by_
 
-    return group_by_(key_mapper, element_mapper, subject_mapper)
+    return group_by_(
+        key_mapper,
+        element_mapper,
+        subject_mapper,
+        max_groups=max_groups,
+        idle_timeout=idle_timeout,
+        counters=counters,
+        scheduler=scheduler,
+    )
 
 
 def group_by_until(
@@ -1893,6 +2115,39 @@ def max_by(
     return max_by_(key_mapper, comparer)
 
 
+if TYPE_CHECKING:
+    from reactivex.metrics import Histogram
+
+
+def measure_latency(
+    histogram: Histogram | None = None, label: str | None = None
+) -> Callable[[Observable[_T]], Observable[_T]]:
+    """Measures the end-to-end latency of stamped elements.
+
+    Records the time since every element was stamped by
+    :func:`stamp_latency` in a latency histogram, and passes the
+    element on unchanged. Elements that were not stamped are passed on
+    without being recorded.
+
+    Examples:
+        >>> source.pipe(stamp_latency(), observe_on(pool), measure_latency())
+        >>> res = measure_latency(label="orders")
+
+    Args:
+        histogram: [Optional] :class:`Histogram
+            <reactivex.metrics.Histogram>` to record the latencies in.
+        label: [Optional] Label of the latency histogram in the
+            default metrics registry, used if no histogram is given.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns the source sequence, unchanged.
+    """
+    from ._latency import measure_latency_
+
+    return measure_latency_(histogram, label)
+
+
 def merge(
     *sources: Observable[Any], max_concurrent: int | None = None
 ) -> Callable[[Observable[Any]], Observable[Any]]:
@@ -1929,7 +2184,7 @@ def merge(
 
 
 def merge_all() -> Callable[
-    [Observable[Union[Observable[_T], "typing.AnyFuture[_T]"]]], Observable[_T]
+    [Observable[Observable[_T] | typing.AnyFuture[_T]]], Observable[_T]
 ]:
     """The merge_all operator.
 
@@ -1944,6 +2199,11 @@ def merge_all() -> Callable[
         [   merge_all()    ]
         -a-1-b-2-c-3-d-4-|
 
+    Constant inner sequences, from ``just``, ``empty``, ``throw`` or
+    ``of`` without a scheduler, are emitted right away instead of being
+    scheduled on the trampoline. Their values may therefore come before
+    the scheduled values of inner sequences that arrived earlier.
+
     Returns:
         A partially applied operator function that takes an observable
         source and returns the observable sequence that merges the
@@ -2355,6 +2615,47 @@ def publish_value(
     return publish_value_(initial_value, mapper)
 
 
+def rate_limit(
+    rate: float,
+    burst: int = 1,
+    max_queue: int | None = None,
+    overflow: Literal["error", "drop_newest", "drop_oldest"] = "error",
+    scheduler: abc.SchedulerBase | None = None,
+) -> Callable[[Observable[_T]], Observable[_T]]:
+    """Limits the rate of an observable sequence using a token bucket.
+
+    Up to ``burst`` elements are forwarded immediately, after which
+    elements are spaced out to ``rate`` elements per second. Elements
+    that cannot be forwarded yet are queued. Completion is forwarded
+    once the queue is empty, errors are forwarded immediately.
+
+    Examples:
+        >>> res = rate_limit(100.0)
+        >>> res = rate_limit(100.0, burst=10, max_queue=1000, overflow="drop_oldest")
+
+    Args:
+        rate: Number of elements per second.
+        burst: [Optional] Maximum number of elements forwarded back to
+            back. Defaults to 1.
+        max_queue: [Optional] Maximum number of queued elements. The
+            queue is unbounded by default.
+        overflow: [Optional] What to do when an element arrives and the
+            queue is full. ``"error"`` terminates the sequence with a
+            :class:`QueueOverflowError
+            <reactivex.internal.exceptions.QueueOverflowError>`,
+            ``"drop_newest"`` drops the arriving element and
+            ``"drop_oldest"`` drops the oldest queued element.
+        scheduler: [Optional] Scheduler to use for timing.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns the rate limited observable sequence.
+    """
+    from ._ratelimit import rate_limit_
+
+    return rate_limit_(rate, burst, max_queue, overflow, scheduler)
+
+
 @overload
 def reduce(
     accumulator: Accumulator[_TState, _T],
@@ -2537,6 +2838,52 @@ def retry(
     return retry_(retry_count)
 
 
+def rolling(
+    agg: Literal["sum", "mean", "min", "max", "var"] | Callable[[_T, _T], _T],
+    count: int | None = None,
+    timespan: typing.RelativeTime | None = None,
+    scheduler: abc.SchedulerBase | None = None,
+) -> Callable[[Observable[_T]], Observable[Any]]:
+    """Computes an aggregate over a sliding window.
+
+    For every source element, emits the aggregate of the window ending
+    with that element. The window holds either the last ``count``
+    elements or the elements received within the last ``timespan``.
+    Aggregates are maintained incrementally, so each element costs
+    amortized O(1) regardless of the window size.
+
+    .. marble::
+        :alt: rolling
+
+        --1--2--3--4--5-|
+        [rolling("sum", 3)]
+        --1--3--6--9--12|
+
+    Examples:
+        >>> op = rolling("sum", count=3)
+        >>> op = rolling("max", timespan=5.0)
+        >>> op = rolling(lambda a, b: a | b, count=100)
+
+    Args:
+        agg: The aggregate to compute. One of ``"sum"``, ``"mean"``,
+            ``"min"``, ``"max"`` or ``"var"`` (population variance), or
+            an associative function combining two elements.
+        count: [Optional] Number of most recent elements in the window.
+        timespan: [Optional] Elements older than this relative time are
+            evicted from the window. Exactly one of ``count`` and
+            ``timespan`` must be given.
+        scheduler: [Optional] Scheduler used to timestamp elements when
+            ``timespan`` is given.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence with one aggregate per element.
+    """
+    from ._rolling import rolling_
+
+    return rolling_(agg, count, timespan, scheduler=scheduler)
+
+
 def sample(
     sampler: typing.RelativeTime | Observable[Any],
     scheduler: abc.SchedulerBase | None = None,
@@ -2569,6 +2916,39 @@ def sample(
     return sample_(sampler, scheduler)
 
 
+def sample_by_key(
+    key_mapper: Mapper[_T, _TKey],
+    interval: typing.RelativeTime,
+    max_keys: int | None = None,
+    scheduler: abc.SchedulerBase | None = None,
+) -> Callable[[Observable[_T]], Observable[_T]]:
+    """Samples the latest value of every key at each interval.
+
+    At each tick, the latest value of every key updated since the
+    previous tick is emitted. Latest values are kept in a single
+    dictionary and all keys share one interval timer. Pending values
+    are emitted when the source completes.
+
+    Example:
+        >>> res = sample_by_key(lambda x: x.sensor_id, 1.0)
+
+    Args:
+        key_mapper: A function to extract the key for each element.
+        interval: Time interval at which to sample.
+        max_keys: [Optional] Maximum number of keys with a pending
+            value. When exceeded, the pending value of the least
+            recently updated key is emitted right away.
+        scheduler: [Optional] Scheduler to use for the interval.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns a sampled observable sequence.
+    """
+    from ._bykey import sample_by_key_
+
+    return sample_by_key_(key_mapper, interval, max_keys, scheduler)
+
+
 @overload
 def scan(
     accumulator: Accumulator[_T, _T],
@@ -2846,7 +3226,7 @@ def skip_last_with_time(
 
 
 def skip_until(
-    other: Union[Observable[Any], "typing.AnyFuture[Any]"],
+    other: Observable[Any] | typing.AnyFuture[Any],
 ) -> Callable[[Observable[_T]], Observable[_T]]:
     """Returns the values from the source observable sequence only
     after the other observable sequence produces a value.
@@ -3090,6 +3470,29 @@ def some(
     return some_(predicate)
 
 
+def stamp_latency() -> Callable[[Observable[_T]], Observable[_T]]:
+    """Stamps every element with its ingress time.
+
+    The stamp is kept on the side instead of being attached to the
+    element, so mappers downstream see the original values. It follows
+    the element, and whatever is derived from it, to
+    :func:`measure_latency`. ``observe_on``, ``delay``, ``merge``,
+    ``buffer_with_time`` and ``buffer_with_time_or_count`` carry the
+    stamp across threads and time. A buffer carries the stamp of its
+    oldest element.
+
+    Examples:
+        >>> source.pipe(stamp_latency(), observe_on(pool), measure_latency())
+
+    Returns:
+        An operator function that takes an observable source and
+        returns the source sequence with its elements stamped.
+    """
+    from ._latency import stamp_latency_
+
+    return stamp_latency_()
+
+
 @overload
 def starmap() -> Callable[[Observable[_T]], Observable[_T]]: ...
 
@@ -3275,7 +3678,7 @@ def sum(
 
 
 def switch_latest() -> Callable[
-    [Observable[Union[Observable[_T], "typing.AnyFuture[_T]"]]], Observable[_T]
+    [Observable[Observable[_T] | typing.AnyFuture[_T]]], Observable[_T]
 ]:
     """The switch_latest operator.
 
@@ -3516,7 +3919,7 @@ def take_last_with_time(
 
 
 def take_until(
-    other: Union[Observable[Any], "typing.AnyFuture[Any]"],
+    other: Observable[Any] | typing.AnyFuture[Any],
 ) -> Callable[[Observable[_T]], Observable[_T]]:
     """Returns the values from the source observable sequence until the
     other observable sequence produces a value.
@@ -3744,6 +4147,39 @@ def throttle_first(
     return throttle_first_(window_duration, scheduler)
 
 
+def throttle_first_by_key(
+    key_mapper: Mapper[_T, _TKey],
+    window_duration: typing.RelativeTime,
+    max_keys: int | None = None,
+    scheduler: abc.SchedulerBase | None = None,
+) -> Callable[[Observable[_T]], Observable[_T]]:
+    """Emits the first value of each key, then ignores values with the
+    same key for a time window of the specified duration.
+
+    No timer is scheduled. The start of every open window is kept in a
+    single dictionary, and expired windows are dropped when values
+    arrive.
+
+    Example:
+        >>> res = throttle_first_by_key(lambda x: x.user_id, 1.0)
+
+    Args:
+        key_mapper: A function to extract the key for each element.
+        window_duration: time to wait before emitting another item
+            with the same key after emitting an item.
+        max_keys: [Optional] Maximum number of open windows. When
+            exceeded, the oldest window is closed early.
+        scheduler: [Optional] Scheduler used to read the time.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable that performs the throttle operation.
+    """
+    from ._bykey import throttle_first_by_key_
+
+    return throttle_first_by_key_(key_mapper, window_duration, max_keys, scheduler)
+
+
 def throttle_with_mapper(
     throttle_duration_mapper: Callable[[Any], Observable[Any]],
 ) -> Callable[[Observable[_T]], Observable[_T]]:
@@ -3775,7 +4211,7 @@ if TYPE_CHECKING:
 
 def timestamp(
     scheduler: abc.SchedulerBase | None = None,
-) -> Callable[[Observable[_T]], Observable["Timestamp[_T]"]]:
+) -> Callable[[Observable[_T]], Observable[Timestamp[_T]]]:
     """The timestamp operator.
 
     Records the timestamp for each value in an observable sequence.
@@ -3798,7 +4234,7 @@ def timestamp(
 
 def timeout(
     duetime: typing.AbsoluteOrRelativeTime,
-    other: Union[Observable[_T], "typing.AnyFuture[_T]"] | None = None,
+    other: Observable[_T] | typing.AnyFuture[_T] | None = None,
     scheduler: abc.SchedulerBase | None = None,
 ) -> Callable[[Observable[_T]], Observable[_T]]:
     """Returns the source observable sequence or the other observable
@@ -3880,7 +4316,7 @@ if TYPE_CHECKING:
 
 def time_interval(
     scheduler: abc.SchedulerBase | None = None,
-) -> Callable[[Observable[_T]], Observable["TimeInterval[_T]"]]:
+) -> Callable[[Observable[_T]], Observable[TimeInterval[_T]]]:
     """Records the time interval between consecutive values in an
     observable sequence.
 
@@ -3927,8 +4363,8 @@ def to_dict(
 
 
 def to_future(
-    future_ctor: Callable[[], "asyncio.Future[_T]"] | None = None,
-) -> Callable[[Observable[_T]], "asyncio.Future[_T]"]:
+    future_ctor: Callable[[], asyncio.Future[_T]] | None = None,
+) -> Callable[[Observable[_T]], asyncio.Future[_T]]:
     """Converts an existing observable sequence to a Future.
 
     Example:
@@ -4210,7 +4646,11 @@ def with_latest_from(
     return with_latest_from_(*sources)
 
 
-def zip(*args: Observable[Any]) -> Callable[[Observable[Any]], Observable[Any]]:
+def zip(
+    *args: Observable[Any],
+    max_backlog: int | None = None,
+    overflow: Literal["error", "drop_newest", "drop_oldest"] = "error",
+) -> Callable[[Observable[Any]], Observable[Any]]:
     """Merges the specified observable sequences into one observable
     sequence by creating a tuple whenever all of the
     observable sequences have produced an element at a corresponding
@@ -4227,9 +4667,19 @@ def zip(*args: Observable[Any]) -> Callable[[Observable[Any]], Observable[Any]]:
 
     Example:
         >>> res = zip(obs1, obs2)
+        >>> res = zip(obs1, obs2, max_backlog=1000, overflow="drop_oldest")
 
     Args:
         args: Observable sources to zip.
+        max_backlog: [Optional] Maximum number of elements queued for
+            each source. Unbounded by default.
+        overflow: [Optional] What to do when an element arrives and the
+            queue of its source is full. ``"error"`` terminates the
+            sequence with a :class:`QueueOverflowError
+            <reactivex.internal.exceptions.QueueOverflowError>`,
+            ``"drop_newest"`` drops the arriving element and
+            ``"drop_oldest"`` drops the oldest queued element of that
+            source.
 
     Returns:
         An operator function that takes an observable source and
@@ -4238,7 +4688,7 @@ def zip(*args: Observable[Any]) -> Callable[[Observable[Any]], Observable[Any]]:
     """
     from ._zip import zip_
 
-    return zip_(*args)
+    return zip_(*args, max_backlog=max_backlog, overflow=overflow)
 
 
 def zip_with_iterable(
@@ -4275,6 +4725,7 @@ def zip_with_iterable(
 zip_with_list = zip_with_iterable
 
 __all__ = [
+    "aggregate_by_key",
     "all",
     "amb",
     "as_observable",
@@ -4283,14 +4734,17 @@ __all__ = [
     "buffer_when",
     "buffer_toggle",
     "buffer_with_count",
+    "BufferView",
     "buffer_with_time",
     "buffer_with_time_or_count",
     "catch",
     "combine_latest",
+    "combine_latest_keyed",
     "concat",
     "contains",
     "count",
     "debounce",
+    "debounce_by_key",
     "throttle_with_timeout",
     "default_if_empty",
     "delay_subscription",
@@ -4318,6 +4772,7 @@ __all__ = [
     "flat_map_latest",
     "fork_join",
     "group_by",
+    "GroupByCounters",
     "group_by_until",
     "group_join",
     "ignore_elements",
@@ -4330,6 +4785,7 @@ __all__ = [
     "materialize",
     "max",
     "max_by",
+    "measure_latency",
     "merge",
     "merge_all",
     "min",
@@ -4344,12 +4800,16 @@ __all__ = [
     "pluck_attr",
     "publish",
     "publish_value",
+    "rate_limit",
     "reduce",
     "ref_count",
+    "REMOVED",
     "repeat",
     "replay",
     "retry",
+    "rolling",
     "sample",
+    "sample_by_key",
     "scan",
     "sequence_equal",
     "share",
@@ -4366,6 +4826,7 @@ __all__ = [
     "skip_with_time",
     "slice",
     "some",
+    "stamp_latency",
     "starmap",
     "starmap_indexed",
     "start_with",
@@ -4383,6 +4844,7 @@ __all__ = [
     "take_with_time",
     "tap",
     "throttle_first",
+    "throttle_first_by_key",
     "throttle_with_mapper",
     "timestamp",
     "timeout",
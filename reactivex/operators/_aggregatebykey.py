@@ -0,0 +1,148 @@
+from threading import RLock
+from typing import Any, Literal, TypeVar
+
+import reactivex
+from reactivex import Observable, abc, typing
+from reactivex.disposable import CompositeDisposable
+from reactivex.internal import curry_flip
+from reactivex.typing import Accumulator, Mapper
+
+_T = TypeVar("_T")
+_TKey = TypeVar("_TKey")
+_TState = TypeVar("_TState")
+
+EmitMode = Literal["on_complete", "every_update", "on_interval"]
+
+
+@curry_flip
+def aggregate_by_key_(
+    source: Observable[_T],
+    key_mapper: Mapper[_T, _TKey],
+    seed: _TState,
+    accumulator: Accumulator[_TState, _T],
+    emit: EmitMode = "on_complete",
+    interval: typing.RelativeTime | None = None,
+    scheduler: abc.SchedulerBase | None = None,
+) -> Observable[Any]:
+    """Applies an accumulator function per key over an observable
+    sequence, keeping the state of every key in a single dictionary.
+
+    Examples:
+        >>> res = source.pipe(aggregate_by_key(lambda x: x.id, 0, lambda a, x: a + 1))
+        >>> res = aggregate_by_key(
+            lambda x: x.id, 0, lambda acc, x: acc + x.value, emit="every_update"
+        )(source)
+
+    Args:
+        source: Source observable to aggregate.
+        key_mapper: A function to extract the key for each element.
+        seed: Initial accumulator value for every new key. The same
+            object is used for all keys, so it should not be mutated
+            by the accumulator.
+        accumulator: An accumulator function invoked with the current
+            state of the element's key and the element.
+        emit: When to emit. ``"on_complete"`` emits the final
+            dictionary when the source completes. ``"every_update"``
+            emits a ``(key, state)`` tuple for every element.
+            ``"on_interval"`` emits a dictionary with the keys updated
+            since the previous emission every ``interval``.
+        interval: Period used with ``emit="on_interval"``.
+        scheduler: Scheduler used with ``emit="on_interval"``.
+
+    Returns:
+        An observable sequence of keyed aggregates.
+    """
+
+    if emit not in ("on_complete", "every_update", "on_interval"):
+        raise ValueError(f"Invalid emit mode: {emit!r}")
+
+    if emit == "on_interval" and interval is None:
+        raise ValueError("interval is required when emit is 'on_interval'")
+
+    def subscribe(
+        observer: abc.ObserverBase[Any],
+        scheduler_: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        state: dict[_TKey, _TState] = {}
+        changed: dict[_TKey, _TState] = {}
+        is_stopped = False
+
+        def on_next(x: _T) -> None:
+            try:
+                key = key_mapper(x)
+                accumulation = accumulator(state.get(key, seed), x)
+            except Exception as ex:  # pylint: disable=broad-except
+                on_error(ex)
+                return
+
+            state[key] = accumulation
+            if emit == "every_update":
+                observer.on_next((key, accumulation))
+            elif emit == "on_interval":
+                changed[key] = accumulation
+
+        def flush() -> None:
+            if changed:
+                delta = changed.copy()
+                changed.clear()
+                observer.on_next(delta)
+
+        def on_error(error: Exception) -> None:
+            nonlocal is_stopped
+            is_stopped = True
+            observer.on_error(error)
+
+        def on_completed() -> None:
+            nonlocal is_stopped
+            is_stopped = True
+            if emit == "on_complete":
+                observer.on_next(state)
+            elif emit == "on_interval":
+                flush()
+            observer.on_completed()
+
+        if emit != "on_interval":
+            return source.subscribe(
+                on_next, on_error, on_completed, scheduler=scheduler_
+            )
+
+        # Ticks and source notifications arrive on different threads, so
+        # every emission is serialized, and ticks stop with the output
+        lock = RLock()
+
+        def on_tick(_: Any = None) -> None:
+            with lock:
+                if not is_stopped:
+                    flush()
+
+        def on_next_synchronized(x: _T) -> None:
+            with lock:
+                if not is_stopped:
+                    on_next(x)
+
+        def on_error_synchronized(error: Exception) -> None:
+            with lock:
+                if not is_stopped:
+                    on_error(error)
+
+        def on_completed_synchronized() -> None:
+            with lock:
+                if not is_stopped:
+                    on_completed()
+
+        assert interval is not None
+        ticks = reactivex.interval(interval, scheduler=scheduler or scheduler_)
+        return CompositeDisposable(
+            ticks.subscribe(on_tick, on_error_synchronized, scheduler=scheduler_),
+            source.subscribe(
+                on_next_synchronized,
+                on_error_synchronized,
+                on_completed_synchronized,
+                scheduler=scheduler_,
+            ),
+        )
+
+    return Observable(subscribe)
+
+
+__all__ = ["aggregate_by_key_"]
@@ -1,13 +1,82 @@
-from collections.abc import Callable
-from typing import Any, TypeVar
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, TypeVar, cast, overload
 
-from reactivex import Observable
+from reactivex import Observable, abc
 from reactivex import operators as ops
-from reactivex.internal import curry_flip
+from reactivex.disposable import (
+    CompositeDisposable,
+    SerialDisposable,
+    SingleAssignmentDisposable,
+)
+from reactivex.internal import ArgumentOutOfRangeException, curry_flip, noop
 
 _T = TypeVar("_T")
 
 
+class BufferView(Sequence[_T]):
+    """Read-only view of a slice of a shared buffer.
+
+    Views are emitted by ``buffer_with_count(..., view=True)`` instead
+    of lists, so overlapping buffers share their elements rather than
+    copying them. The underlying storage is never modified after
+    elements are written, so a view stays valid for as long as it is
+    referenced. Use :meth:`copy` or ``list(view)`` to get an
+    independent list.
+    """
+
+    __slots__ = ("_storage", "_start", "_stop")
+
+    def __init__(self, storage: list[_T], start: int, stop: int) -> None:
+        self._storage = storage
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> _T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "BufferView[_T]": ...
+
+    def __getitem__(self, index: int | slice) -> "_T | BufferView[_T]":
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("BufferView slices must be contiguous")
+            stop = max(start, stop)
+            return BufferView(self._storage, self._start + start, self._start + stop)
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("BufferView index out of range")
+        return self._storage[self._start + index]
+
+    def __iter__(self) -> Iterator[_T]:
+        # Indexing does not walk the storage before the view
+        return map(self._storage.__getitem__, range(self._start, self._stop))
+
+    def __eq__(self, other: object) -> bool:
+        # Like lists, views are only equal to lists and views
+        if not isinstance(other, (list, BufferView)):
+            return NotImplemented
+        other_ = cast(Sequence[Any], other)
+        return len(self) == len(other_) and all(a == b for a, b in zip(self, other_))
+
+    # Views compare equal to lists, so like lists they are not hashable
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"BufferView({self.copy()!r})"
+
+    def copy(self) -> list[_T]:
+        """Returns the elements of the view as a new list."""
+        return self._storage[self._start : self._stop]
+
+
 @curry_flip
 def buffer_(
     source: Observable[_T],
@@ -26,10 +95,40 @@ def buffer_(
     Returns:
         Observable of lists of buffered elements.
     """
-    return source.pipe(
-        ops.window(boundaries),
-        ops.flat_map(ops.to_list()),
-    )
+
+    def subscribe(
+        observer: abc.ObserverBase[list[_T]],
+        scheduler: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        buffer: list[_T] = []
+
+        def on_next(x: _T) -> None:
+            with source.lock:
+                buffer.append(x)
+
+        def on_next_boundary(_: Any) -> None:
+            nonlocal buffer
+            with source.lock:
+                current, buffer = buffer, []
+            observer.on_next(current)
+
+        def on_completed() -> None:
+            nonlocal buffer
+            with source.lock:
+                current, buffer = buffer, []
+            observer.on_next(current)
+            observer.on_completed()
+
+        return CompositeDisposable(
+            source.subscribe(
+                on_next, observer.on_error, on_completed, scheduler=scheduler
+            ),
+            boundaries.subscribe(
+                on_next_boundary, observer.on_error, on_completed, scheduler=scheduler
+            ),
+        )
+
+    return Observable(subscribe)
 
 
 @curry_flip
@@ -50,10 +149,53 @@ def buffer_when_(
     Returns:
         Observable of lists of buffered elements.
     """
-    return source.pipe(
-        ops.window_when(closing_mapper),
-        ops.flat_map(ops.to_list()),
-    )
+
+    def subscribe(
+        observer: abc.ObserverBase[list[_T]],
+        scheduler: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        m = SerialDisposable()
+        buffer: list[_T] = []
+
+        def on_next(x: _T) -> None:
+            with source.lock:
+                buffer.append(x)
+
+        def on_completed() -> None:
+            nonlocal buffer
+            with source.lock:
+                current, buffer = buffer, []
+            observer.on_next(current)
+            observer.on_completed()
+
+        subscription = source.subscribe(
+            on_next, observer.on_error, on_completed, scheduler=scheduler
+        )
+
+        def create_buffer_on_completed() -> None:
+            try:
+                buffer_close = closing_mapper()
+            except Exception as exception:  # pylint: disable=broad-except
+                observer.on_error(exception)
+                return
+
+            def on_completed() -> None:
+                nonlocal buffer
+                with source.lock:
+                    current, buffer = buffer, []
+                observer.on_next(current)
+                create_buffer_on_completed()
+
+            m1 = SingleAssignmentDisposable()
+            m.disposable = m1
+            m1.disposable = buffer_close.pipe(ops.take(1)).subscribe(
+                noop, observer.on_error, on_completed, scheduler=scheduler
+            )
+
+        create_buffer_on_completed()
+        return CompositeDisposable(subscription, m)
+
+    return Observable(subscribe)
 
 
 @curry_flip
@@ -87,7 +229,8 @@ def buffer_with_count_(
     source: Observable[_T],
     count: int,
     skip: int | None = None,
-) -> Observable[list[_T]]:
+    view: bool = False,
+) -> Observable[Sequence[_T]]:
     """Projects each element of an observable sequence into zero or more
     buffers which are produced based on element count information.
 
@@ -102,25 +245,115 @@ def buffer_with_count_(
         skip: [Optional] Number of elements to skip between
             creation of consecutive buffers. If not provided, defaults to
             the count.
+        view: [Optional] If True, emit :class:`BufferView` instances
+            sharing a single storage instead of lists.
 
     Returns:
         An observable sequence of buffers.
     """
+
+    if count <= 0:
+        raise ArgumentOutOfRangeException()
+
     skip_ = skip if skip is not None else count
 
-    def mapper(value: Observable[_T]) -> Observable[list[_T]]:
-        return value.pipe(
-            ops.to_list(),
+    if skip_ <= 0:
+        raise ArgumentOutOfRangeException()
+
+    if view:
+        return _buffer_view_with_count(source, count, skip_)
+
+    def subscribe(
+        observer: abc.ObserverBase[list[_T]],
+        scheduler: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        buffers: deque[list[_T]] = deque([[]])
+        n = 0
+
+        def on_next(x: _T) -> None:
+            nonlocal n
+
+            for buffer in buffers:
+                buffer.append(x)
+
+            c = n - count + 1
+            if c >= 0 and c % skip_ == 0:
+                observer.on_next(buffers.popleft())
+
+            n += 1
+            if n % skip_ == 0:
+                buffers.append([])
+
+        def on_completed() -> None:
+            while buffers:
+                buffer = buffers.popleft()
+                if buffer:
+                    observer.on_next(buffer)
+            observer.on_completed()
+
+        return source.subscribe(
+            on_next, observer.on_error, on_completed, scheduler=scheduler
         )
 
-    def predicate(value: list[_T]) -> bool:
-        return len(value) > 0
+    return Observable(subscribe)
 
-    return source.pipe(
-        ops.window_with_count(count, skip_),
-        ops.flat_map(mapper),
-        ops.filter(predicate),
-    )
+
+def _buffer_view_with_count(
+    source: Observable[_T], count: int, skip: int
+) -> Observable[Sequence[_T]]:
+    """Count based buffers emitted as views of a shared storage.
+
+    Elements are appended to a storage list that is never modified
+    afterwards. When the storage is full, the elements still needed by
+    open buffers are copied to a new storage of twice the buffer
+    size, so each element is copied at most once on average.
+    """
+
+    capacity = 2 * count
+
+    def subscribe(
+        observer: abc.ObserverBase[Sequence[_T]],
+        scheduler: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        storage: list[_T] = []
+        base = 0  # Index of storage[0] in the source sequence
+        next_start = 0  # Index of the first element of the oldest open buffer
+        n = 0
+
+        def on_next(x: _T) -> None:
+            nonlocal storage, base, next_start, n
+
+            if len(storage) == capacity:
+                keep = min(next_start, n)
+                storage = storage[keep - base :]
+                base = keep
+
+            storage.append(x)
+
+            if n - next_start == count - 1:
+                observer.on_next(BufferView(storage, next_start - base, n + 1 - base))
+                next_start += skip
+
+            n += 1
+
+        def on_completed() -> None:
+            start = next_start
+            while start < n:
+                observer.on_next(BufferView(storage, start - base, n - base))
+                start += skip
+            observer.on_completed()
+
+        return source.subscribe(
+            on_next, observer.on_error, on_completed, scheduler=scheduler
+        )
+
+    return Observable(subscribe)
 
 
-__all__ = ["buffer_", "buffer_with_count_", "buffer_when_", "buffer_toggle_"]
+__all__ = [
+    "BufferView",
+    "buffer_",
+    "buffer_with_count_",
+    "buffer_when_",
+    "buffer_toggle_",
+]
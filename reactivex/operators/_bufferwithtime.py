@@ -1,8 +1,15 @@
-from typing import TypeVar
+from collections import deque
+from datetime import timedelta
+from typing import Any, TypeVar
 
-from reactivex import Observable, abc, compose, typing
-from reactivex import operators as ops
-from reactivex.internal import curry_flip
+from reactivex import Observable, abc, typing
+from reactivex.disposable import (
+    CompositeDisposable,
+    SerialDisposable,
+    SingleAssignmentDisposable,
+)
+from reactivex.internal import DELTA_ZERO, curry_flip, latency, synchronized
+from reactivex.scheduler import TimeoutScheduler
 
 _T = TypeVar("_T")
 
@@ -33,12 +40,100 @@ def buffer_with_time_(
     if not timeshift:
         timeshift = timespan
 
-    return source.pipe(
-        compose(
-            ops.window_with_time(timespan, timeshift, scheduler),
-            ops.flat_map(ops.to_list()),
+    if not isinstance(timespan, timedelta):
+        timespan = timedelta(seconds=timespan)
+    if not isinstance(timeshift, timedelta):
+        timeshift = timedelta(seconds=timeshift)
+
+    def subscribe(
+        observer: abc.ObserverBase[list[_T]],
+        scheduler_: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+
+        timer_d = SerialDisposable()
+        next_shift = timeshift
+        next_span = timespan
+        total_time = DELTA_ZERO
+        queue: deque[list[_T]] = deque([[]])
+        # Ingress stamp of the oldest element of every open buffer, if
+        # stamps are carried
+        stamps: deque[float | None] | None = deque([None]) if latency.enabled else None
+
+        def create_timer() -> None:
+            nonlocal next_shift, next_span, total_time
+
+            m = SingleAssignmentDisposable()
+            timer_d.disposable = m
+            is_span = next_span <= next_shift
+            is_shift = next_shift <= next_span
+
+            new_total_time = next_span if is_span else next_shift
+
+            ts = new_total_time - total_time
+            total_time = new_total_time
+            if is_span:
+                next_span += timeshift
+
+            if is_shift:
+                next_shift += timeshift
+
+            def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+                stamp = None
+                with source.lock:
+                    if is_shift:
+                        queue.append([])
+                        if stamps is not None:
+                            stamps.append(None)
+
+                    if is_span:
+                        buffer = queue.popleft()
+                        if stamps is not None:
+                            stamp = stamps.popleft()
+                    else:
+                        buffer = None
+
+                    create_timer()
+
+                if buffer is not None:
+                    if stamps is None:
+                        observer.on_next(buffer)
+                    else:
+                        latency.emit(observer, buffer, stamp)
+
+            m.disposable = _scheduler.schedule_relative(ts, action)
+
+        create_timer()
+
+        def on_next(x: _T) -> None:
+            with source.lock:
+                for buffer in queue:
+                    buffer.append(x)
+
+                if stamps is not None and latency.active and None in stamps:
+                    stamp = latency.current.stamp
+                    for i, buffer in enumerate(queue):
+                        if stamps[i] is None and len(buffer) == 1:
+                            stamps[i] = stamp
+
+        @synchronized(source.lock)
+        def on_completed() -> None:
+            while queue:
+                if stamps is None:
+                    observer.on_next(queue.popleft())
+                else:
+                    latency.emit(observer, queue.popleft(), stamps.popleft())
+
+            observer.on_completed()
+
+        return CompositeDisposable(
+            timer_d,
+            source.subscribe(
+                on_next, observer.on_error, on_completed, scheduler=scheduler_
+            ),
         )
-    )
+
+    return Observable(subscribe)
 
 
 __all__ = ["buffer_with_time_"]
@@ -1,8 +1,13 @@
-from typing import TypeVar
+from typing import Any, TypeVar
 
-from reactivex import Observable, abc, compose, typing
-from reactivex import operators as ops
-from reactivex.internal import curry_flip
+from reactivex import Observable, abc, typing
+from reactivex.disposable import (
+    CompositeDisposable,
+    SerialDisposable,
+    SingleAssignmentDisposable,
+)
+from reactivex.internal import curry_flip, latency, synchronized
+from reactivex.scheduler import TimeoutScheduler
 
 _T = TypeVar("_T")
 
@@ -29,12 +34,79 @@ def buffer_with_time_or_count_(
     Returns:
         An observable sequence of buffers.
     """
-    return source.pipe(
-        compose(
-            ops.window_with_time_or_count(timespan, count, scheduler),
-            ops.flat_map(ops.to_iterable()),
+
+    def subscribe(
+        observer: abc.ObserverBase[list[_T]],
+        scheduler_: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+
+        buffer: list[_T] = []
+        # Ingress stamp of the oldest element of the buffer, if stamps
+        # are carried
+        stamped = latency.enabled
+        buffer_stamp: float | None = None
+        timer_d = SerialDisposable()
+        buffer_id = 0
+
+        def create_timer(_id: int) -> None:
+            m = SingleAssignmentDisposable()
+            timer_d.disposable = m
+
+            def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+                nonlocal buffer, buffer_id, buffer_stamp
+
+                with source.lock:
+                    if _id != buffer_id:
+                        return
+
+                    buffer_id += 1
+                    new_id = buffer_id
+                    current, buffer = buffer, []
+                    if stamped:
+                        stamp, buffer_stamp = buffer_stamp, None
+                        latency.emit(observer, current, stamp)
+                    else:
+                        observer.on_next(current)
+                    create_timer(new_id)
+
+            m.disposable = _scheduler.schedule_relative(timespan, action)
+
+        create_timer(0)
+
+        @synchronized(source.lock)
+        def on_next(x: _T) -> None:
+            nonlocal buffer, buffer_id, buffer_stamp
+
+            buffer.append(x)
+            if stamped and len(buffer) == 1:
+                buffer_stamp = latency.capture()
+            if len(buffer) == count:
+                buffer_id += 1
+                current, buffer = buffer, []
+                if stamped:
+                    stamp, buffer_stamp = buffer_stamp, None
+                    latency.emit(observer, current, stamp)
+                else:
+                    observer.on_next(current)
+                create_timer(buffer_id)
+
+        @synchronized(source.lock)
+        def on_completed() -> None:
+            if stamped:
+                latency.emit(observer, buffer, buffer_stamp)
+            else:
+                observer.on_next(buffer)
+            observer.on_completed()
+
+        return CompositeDisposable(
+            timer_d,
+            source.subscribe(
+                on_next, observer.on_error, on_completed, scheduler=scheduler_
+            ),
         )
-    )
+
+    return Observable(subscribe)
 
 
 __all__ = ["buffer_with_time_or_count_"]
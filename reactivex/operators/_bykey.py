@@ -0,0 +1,310 @@
+from collections import OrderedDict
+from datetime import datetime
+from threading import RLock
+from typing import Any, TypeVar
+
+import reactivex
+from reactivex import Observable, abc, typing
+from reactivex.disposable import CompositeDisposable, SerialDisposable
+from reactivex.internal import DELTA_ZERO, ArgumentOutOfRangeException, curry_flip
+from reactivex.scheduler import TimeoutScheduler
+
+_T = TypeVar("_T")
+_TKey = TypeVar("_TKey")
+
+
+def _check_max_keys(max_keys: int | None) -> None:
+    if max_keys is not None and max_keys < 1:
+        raise ArgumentOutOfRangeException("max_keys must be at least 1")
+
+
+@curry_flip
+def debounce_by_key_(
+    source: Observable[_T],
+    key_mapper: typing.Mapper[_T, _TKey],
+    duetime: typing.RelativeTime,
+    max_keys: int | None = None,
+    scheduler: abc.SchedulerBase | None = None,
+) -> Observable[_T]:
+    """Debounces the values of an observable sequence separately for
+    each key.
+
+    Pending values are kept in a single ordered map. Since every key
+    gets the same duetime, moving an updated key to the end keeps the
+    map sorted by deadline, and one timer for the earliest deadline
+    drives all keys.
+
+    Examples:
+        >>> res = source.pipe(debounce_by_key(lambda x: x.id, 0.5))
+        >>> res = debounce_by_key(lambda x: x.id, 0.5)(source)
+
+    Args:
+        source: Source observable to debounce.
+        key_mapper: A function to extract the key for each element.
+        duetime: Duration to wait after the last value of a key
+            before emitting it.
+        max_keys: Optional maximum number of keys with a pending value.
+            When exceeded, the value of the least recently updated key
+            is emitted right away.
+        scheduler: Scheduler to use.
+
+    Returns:
+        The debounced observable sequence.
+    """
+
+    _check_max_keys(max_keys)
+
+    def subscribe(
+        observer: abc.ObserverBase[_T],
+        scheduler_: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+        duration = _scheduler.to_timedelta(duetime)
+        pending: OrderedDict[_TKey, _T] = OrderedDict()
+        deadlines: dict[_TKey, datetime] = {}
+        timer = SerialDisposable()
+        armed = False
+
+        def arm(duetime: typing.RelativeTime) -> None:
+            nonlocal armed
+            armed = True
+            timer.disposable = _scheduler.schedule_relative(duetime, action)
+
+        def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+            nonlocal armed
+
+            due: list[_T] = []
+            with source.lock:
+                now = _scheduler.now
+                armed = False
+                while pending:
+                    key = next(iter(pending))
+                    remaining = deadlines[key] - now
+                    if remaining > DELTA_ZERO:
+                        arm(remaining)
+                        break
+                    due.append(pending.pop(key))
+                    del deadlines[key]
+
+            for value in due:
+                observer.on_next(value)
+
+        def on_next(x: _T) -> None:
+            try:
+                key = key_mapper(x)
+            except Exception as ex:  # pylint: disable=broad-except
+                on_error(ex)
+                return
+
+            evicted: list[_T] = []
+            with source.lock:
+                if key in pending:
+                    pending.move_to_end(key)
+                elif max_keys is not None and len(pending) >= max_keys:
+                    oldest, value = pending.popitem(last=False)
+                    del deadlines[oldest]
+                    evicted.append(value)
+
+                pending[key] = x
+                deadlines[key] = _scheduler.now + duration
+                if not armed:
+                    arm(duration)
+
+            for value in evicted:
+                observer.on_next(value)
+
+        def on_error(exception: Exception) -> None:
+            with source.lock:
+                timer.dispose()
+                pending.clear()
+                deadlines.clear()
+            observer.on_error(exception)
+
+        def on_completed() -> None:
+            with source.lock:
+                timer.dispose()
+                due = list(pending.values())
+                pending.clear()
+                deadlines.clear()
+
+            for value in due:
+                observer.on_next(value)
+            observer.on_completed()
+
+        subscription = source.subscribe(
+            on_next, on_error, on_completed, scheduler=scheduler_
+        )
+        return CompositeDisposable(subscription, timer)
+
+    return Observable(subscribe)
+
+
+@curry_flip
+def throttle_first_by_key_(
+    source: Observable[_T],
+    key_mapper: typing.Mapper[_T, _TKey],
+    window_duration: typing.RelativeTime,
+    max_keys: int | None = None,
+    scheduler: abc.SchedulerBase | None = None,
+) -> Observable[_T]:
+    """Emits the first value of each key, then ignores values with the
+    same key for the duration of a time window.
+
+    No timer is used. Open windows are kept in order of their start
+    time and expired ones are dropped from the front whenever a value
+    arrives.
+
+    Examples:
+        >>> res = source.pipe(throttle_first_by_key(lambda x: x.id, 1.0))
+        >>> res = throttle_first_by_key(lambda x: x.id, 1.0)(source)
+
+    Args:
+        source: Source observable to throttle.
+        key_mapper: A function to extract the key for each element.
+        window_duration: Duration of the window opened for a key by an
+            emitted value.
+        max_keys: Optional maximum number of open windows. When
+            exceeded, the oldest window is closed early.
+        scheduler: Optional scheduler to use for timing.
+
+    Returns:
+        An Observable that performs the throttle operation.
+    """
+
+    _check_max_keys(max_keys)
+
+    def subscribe(
+        observer: abc.ObserverBase[_T],
+        scheduler_: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+
+        duration = _scheduler.to_timedelta(window_duration or 0.0)
+        if duration <= DELTA_ZERO:
+            raise ValueError("window_duration cannot be less or equal zero.")
+        windows: OrderedDict[_TKey, datetime] = OrderedDict()
+
+        def on_next(x: _T) -> None:
+            try:
+                key = key_mapper(x)
+            except Exception as ex:  # pylint: disable=broad-except
+                observer.on_error(ex)
+                return
+
+            now = _scheduler.now
+            with source.lock:
+                while windows:
+                    oldest = next(iter(windows))
+                    if now - windows[oldest] < duration:
+                        break
+                    del windows[oldest]
+
+                if key in windows:
+                    return
+
+                if max_keys is not None and len(windows) >= max_keys:
+                    windows.popitem(last=False)
+                windows[key] = now
+
+            observer.on_next(x)
+
+        return source.subscribe(
+            on_next, observer.on_error, observer.on_completed, scheduler=scheduler_
+        )
+
+    return Observable(subscribe)
+
+
+@curry_flip
+def sample_by_key_(
+    source: Observable[_T],
+    key_mapper: typing.Mapper[_T, _TKey],
+    interval: typing.RelativeTime,
+    max_keys: int | None = None,
+    scheduler: abc.SchedulerBase | None = None,
+) -> Observable[_T]:
+    """Samples the latest value of each key at each interval.
+
+    Examples:
+        >>> res = source.pipe(sample_by_key(lambda x: x.id, 1.0))
+        >>> res = sample_by_key(lambda x: x.id, 1.0)(source)
+
+    Args:
+        source: Source sequence to sample.
+        key_mapper: A function to extract the key for each element.
+        interval: Interval at which the latest value of every key
+            updated since the previous sample is emitted.
+        max_keys: Optional maximum number of keys with a pending value.
+            When exceeded, the value of the least recently updated key
+            is emitted right away.
+        scheduler: Scheduler to use.
+
+    Returns:
+        Sampled observable sequence.
+    """
+
+    _check_max_keys(max_keys)
+
+    def subscribe(
+        observer: abc.ObserverBase[_T],
+        scheduler_: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        pending: OrderedDict[_TKey, _T] = OrderedDict()
+        # Ticks and source notifications arrive on different threads, so
+        # every emission is serialized, and ticks stop with the output
+        lock = RLock()
+        is_stopped = False
+
+        def flush() -> None:
+            due = list(pending.values())
+            pending.clear()
+            for value in due:
+                observer.on_next(value)
+
+        def on_tick(_: Any) -> None:
+            with lock:
+                if not is_stopped:
+                    flush()
+
+        def on_next(x: _T) -> None:
+            try:
+                key = key_mapper(x)
+            except Exception as ex:  # pylint: disable=broad-except
+                on_error(ex)
+                return
+
+            with lock:
+                if is_stopped:
+                    return
+                if key in pending:
+                    pending.move_to_end(key)
+                elif max_keys is not None and len(pending) >= max_keys:
+                    observer.on_next(pending.popitem(last=False)[1])
+                pending[key] = x
+
+        def on_error(error: Exception) -> None:
+            nonlocal is_stopped
+            with lock:
+                if not is_stopped:
+                    is_stopped = True
+                    pending.clear()
+                    observer.on_error(error)
+
+        def on_completed() -> None:
+            nonlocal is_stopped
+            with lock:
+                if not is_stopped:
+                    is_stopped = True
+                    flush()
+                    observer.on_completed()
+
+        ticks = reactivex.interval(interval, scheduler=scheduler)
+        return CompositeDisposable(
+            ticks.subscribe(on_tick, on_error, scheduler=scheduler_),
+            source.subscribe(on_next, on_error, on_completed, scheduler=scheduler_),
+        )
+
+    return Observable(subscribe)
+
+
+__all__ = ["debounce_by_key_", "sample_by_key_", "throttle_first_by_key_"]
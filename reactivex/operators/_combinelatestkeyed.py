@@ -0,0 +1,332 @@
+from collections.abc import Iterator, Mapping
+from threading import RLock
+from typing import Any, Final, Generic, Literal, TypeVar
+
+from reactivex import Observable, abc
+from reactivex.disposable import CompositeDisposable, SingleAssignmentDisposable
+from reactivex.internal import curry_flip
+
+_TKey = TypeVar("_TKey")
+_TValue = TypeVar("_TValue")
+
+
+class _Removed:
+    """Type of :data:`REMOVED`."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "REMOVED"
+
+
+REMOVED: Final = _Removed()
+"""Value of a removed key in the deltas of ``combine_latest_keyed``."""
+
+# Snapshots are hash array mapped tries. Every node is a list of 32
+# slots indexed by 5 bits of the hash, holding None, an entry, a bucket
+# of entries with equal hashes or a child node. Nodes are never changed
+# once a snapshot refers to them.
+_SHIFT = 5
+_MASK = (1 << _SHIFT) - 1
+_HASH_MASK = (1 << 64) - 1
+
+
+class _Entry:
+    __slots__ = ("hash", "key", "value")
+
+    def __init__(self, hash_: int, key: Any, value: Any) -> None:
+        self.hash = hash_
+        self.key = key
+        self.value = value
+
+
+class _Bucket:
+    __slots__ = ("hash", "items")
+
+    def __init__(self, hash_: int, items: dict[Any, Any]) -> None:
+        self.hash = hash_
+        self.items = items
+
+
+def _insert(
+    node: list[Any], hash_: int, key: Any, value: Any, shift: int
+) -> tuple[list[Any], bool]:
+    """Returns a copy of node with key set, and whether key is new."""
+
+    index = (hash_ >> shift) & _MASK
+    slot = node[index]
+    node = node.copy()
+    added = True
+    if slot is None:
+        node[index] = _Entry(hash_, key, value)
+    elif not isinstance(slot, (_Entry, _Bucket)):
+        node[index], added = _insert(slot, hash_, key, value, shift + _SHIFT)
+    elif slot.hash != hash_:
+        child: list[Any] = [None] * (_MASK + 1)
+        child[(slot.hash >> (shift + _SHIFT)) & _MASK] = slot
+        node[index], added = _insert(child, hash_, key, value, shift + _SHIFT)
+    elif isinstance(slot, _Entry):
+        if slot.key == key:
+            node[index] = _Entry(hash_, key, value)
+            added = False
+        else:
+            node[index] = _Bucket(hash_, {slot.key: slot.value, key: value})
+    else:
+        added = key not in slot.items
+        node[index] = _Bucket(hash_, {**slot.items, key: value})
+    return node, added
+
+
+def _remove(node: list[Any], hash_: int, key: Any, shift: int) -> list[Any] | None:
+    """Returns a copy of node without key, or None if key is absent."""
+
+    index = (hash_ >> shift) & _MASK
+    slot = node[index]
+    replacement: Any = None
+    if slot is None:
+        return None
+    if isinstance(slot, _Entry):
+        if slot.hash != hash_ or slot.key != key:
+            return None
+    elif isinstance(slot, _Bucket):
+        if slot.hash != hash_ or key not in slot.items:
+            return None
+        items = {k: v for k, v in slot.items.items() if k != key}
+        if len(items) == 1:
+            ((k, v),) = items.items()
+            replacement = _Entry(hash_, k, v)
+        else:
+            replacement = _Bucket(hash_, items)
+    else:
+        child = _remove(slot, hash_, key, shift + _SHIFT)
+        if child is None:
+            return None
+        if any(s is not None for s in child):
+            replacement = child
+
+    node = node.copy()
+    node[index] = replacement
+    return node
+
+
+def _keys(node: list[Any]) -> Iterator[Any]:
+    for slot in node:
+        if slot is None:
+            continue
+        if isinstance(slot, _Entry):
+            yield slot.key
+        elif isinstance(slot, _Bucket):
+            yield from slot.items
+        else:
+            yield from _keys(slot)
+
+
+class _Snapshot(Mapping[_TKey, _TValue], Generic[_TKey, _TValue]):
+    """Read-only mapping of the latest values that shares its entries
+    with the snapshot emitted before it.
+
+    Snapshots are persistent hash tries, so setting or removing a key
+    only copies the nodes on the path to it. Lookups and updates take
+    O(log N), with 32 children per node, and snapshots do not keep the
+    snapshots before them alive. Keys are iterated in the order of
+    their hashes, not in the order they were added.
+    """
+
+    __slots__ = ("_root", "_len")
+
+    def __init__(self, root: list[Any] | None = None, length: int = 0) -> None:
+        self._root: list[Any] = [None] * (_MASK + 1) if root is None else root
+        self._len = length
+
+    def set(self, key: _TKey, value: _TValue) -> "_Snapshot[_TKey, _TValue]":
+        """Returns a snapshot where key maps to value."""
+        root, added = _insert(self._root, hash(key) & _HASH_MASK, key, value, 0)
+        return _Snapshot(root, self._len + added)
+
+    def discard(self, key: _TKey) -> "_Snapshot[_TKey, _TValue]":
+        """Returns a snapshot without key."""
+        root = _remove(self._root, hash(key) & _HASH_MASK, key, 0)
+        if root is None:
+            return self
+        return _Snapshot(root, self._len - 1)
+
+    def __getitem__(self, key: _TKey) -> _TValue:
+        hash_ = hash(key) & _HASH_MASK
+        slot: Any = self._root
+        shift = 0
+        while True:
+            slot = slot[(hash_ >> shift) & _MASK]
+            if isinstance(slot, _Entry):
+                if slot.hash == hash_ and slot.key == key:
+                    return slot.value
+                raise KeyError(key)
+            if isinstance(slot, _Bucket):
+                if slot.hash == hash_:
+                    return slot.items[key]
+                raise KeyError(key)
+            if slot is None:
+                raise KeyError(key)
+            shift += _SHIFT
+
+    def __iter__(self) -> Iterator[_TKey]:
+        return _keys(self._root)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+@curry_flip
+def combine_latest_keyed_(
+    source: Observable[tuple[_TKey, Observable[_TValue] | None]],
+    emit: Literal["snapshot", "delta"] = "snapshot",
+) -> Observable[Mapping[_TKey, Any]]:
+    """Combines the latest values of a changing set of keyed
+    observable sequences.
+
+    The source emits ``(key, observable)`` tuples to add a key, and
+    ``(key, None)`` tuples to remove it. Adding a key that is already
+    present replaces its observable. Readiness is tracked with a
+    counter of keys without a value, and snapshots share their entries
+    with the previous snapshot, so an update costs O(1) in delta mode
+    and O(log N) in snapshot mode.
+
+    Examples:
+        >>> res = sensors.pipe(combine_latest_keyed())
+        >>> res = combine_latest_keyed(emit="delta")(sensors)
+
+    Args:
+        source: Observable sequence of additions and removals.
+        emit: ``"snapshot"`` emits a read-only mapping of the latest
+            value of every key. ``"delta"`` emits a dictionary with the
+            keys changed since the previous emission, where removed
+            keys map to :data:`REMOVED`.
+
+    Returns:
+        An observable sequence of mappings, emitted whenever every
+        current key has produced a value.
+    """
+
+    if emit not in ("snapshot", "delta"):
+        raise ValueError(f"Invalid emit mode: {emit!r}")
+
+    def subscribe(
+        observer: abc.ObserverBase[Mapping[_TKey, Any]],
+        scheduler: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        lock = RLock()
+        group = CompositeDisposable()
+        inners: dict[_TKey, SingleAssignmentDisposable] = {}
+        finished: set[_TKey] = set()
+        latest: dict[_TKey, _TValue] = {}
+        snapshot: _Snapshot[_TKey, _TValue] = _Snapshot()
+        pending: dict[_TKey, Any] = {}
+        missing = 0
+        is_stopped = False
+
+        def flush() -> None:
+            nonlocal pending
+
+            if missing:
+                return
+
+            if emit == "snapshot":
+                observer.on_next(snapshot)
+            elif pending:
+                delta, pending = pending, {}
+                observer.on_next(delta)
+
+        def check_completed() -> None:
+            if is_stopped and len(finished) == len(inners):
+                observer.on_completed()
+
+        def remove(key: _TKey) -> None:
+            nonlocal missing, snapshot
+
+            inner = inners.pop(key, None)
+            if inner is None:
+                return
+
+            group.remove(inner)
+            finished.discard(key)
+            if key in latest:
+                del latest[key]
+                if emit == "delta":
+                    pending[key] = REMOVED
+                else:
+                    snapshot = snapshot.discard(key)
+                flush()
+            else:
+                missing -= 1
+                if latest or pending:
+                    flush()
+
+        def add(key: _TKey, xs: Observable[_TValue]) -> None:
+            nonlocal missing
+
+            remove(key)
+            inner = SingleAssignmentDisposable()
+            inners[key] = inner
+            group.add(inner)
+            missing += 1
+
+            def on_next(value: _TValue) -> None:
+                nonlocal missing, snapshot
+
+                with lock:
+                    if inners.get(key) is not inner:
+                        return
+
+                    if key not in latest:
+                        missing -= 1
+                    latest[key] = value
+                    if emit == "delta":
+                        pending[key] = value
+                    else:
+                        snapshot = snapshot.set(key, value)
+                    flush()
+
+            def on_error(error: Exception) -> None:
+                with lock:
+                    observer.on_error(error)
+
+            def on_completed() -> None:
+                with lock:
+                    if inners.get(key) is inner:
+                        finished.add(key)
+                        check_completed()
+
+            inner.disposable = xs.subscribe(
+                on_next, on_error, on_completed, scheduler=scheduler
+            )
+
+        def on_next(item: tuple[_TKey, Observable[_TValue] | None]) -> None:
+            key, xs = item
+            with lock:
+                if xs is None:
+                    remove(key)
+                else:
+                    add(key, xs)
+
+        def on_error(error: Exception) -> None:
+            with lock:
+                observer.on_error(error)
+
+        def on_completed() -> None:
+            nonlocal is_stopped
+
+            with lock:
+                is_stopped = True
+                check_completed()
+
+        group.add(
+            source.subscribe(on_next, on_error, on_completed, scheduler=scheduler)
+        )
+        return group
+
+    return Observable(subscribe)
+
+
+__all__ = ["REMOVED", "combine_latest_keyed_"]
@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from datetime import datetime
 from typing import Any, TypeVar, cast
 
 from reactivex import Observable, abc, typing
@@ -7,7 +8,7 @@ from reactivex.disposable import (
     SerialDisposable,
     SingleAssignmentDisposable,
 )
-from reactivex.internal import curry_flip
+from reactivex.internal import DELTA_ZERO, curry_flip
 from reactivex.scheduler import TimeoutScheduler
 
 _T = TypeVar("_T")
@@ -22,6 +23,11 @@ def debounce_(
     """Ignores values from an observable sequence which are followed by
     another value before duetime.
 
+    Incoming values only move a deadline forward. A single timer is
+    kept armed while a value is pending, and re-armed for the remaining
+    time when it fires before the deadline, so at most one timer is
+    scheduled per quiet period instead of one per value.
+
     Examples:
         >>> res = source.pipe(debounce(0.5))
         >>> res = debounce(0.5)(source)
@@ -40,45 +46,66 @@ def debounce_(
         scheduler_: abc.SchedulerBase | None = None,
     ) -> abc.DisposableBase:
         _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
-        cancelable = SerialDisposable()
-        has_value = [False]
-        value: list[_T] = [cast(_T, None)]
-        _id: list[int] = [0]
+        duration = _scheduler.to_timedelta(duetime)
+        timer = SerialDisposable()
+        has_value = False
+        armed = False
+        value: _T = cast(_T, None)
+        deadline: datetime = _scheduler.now
 
-        def on_next(x: _T) -> None:
-            has_value[0] = True
-            value[0] = x
-            _id[0] += 1
-            current_id = _id[0]
-            d = SingleAssignmentDisposable()
-            cancelable.disposable = d
+        def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+            nonlocal has_value, armed
+
+            with source.lock:
+                remaining = deadline - _scheduler.now
+                if remaining > DELTA_ZERO:
+                    timer.disposable = _scheduler.schedule_relative(remaining, action)
+                    return
+
+                armed = False
+                emit = has_value
+                has_value = False
+                current = value
+
+            if emit:
+                observer.on_next(current)
 
-            def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
-                if has_value[0] and _id[0] == current_id:
-                    observer.on_next(value[0])
-                has_value[0] = False
+        def on_next(x: _T) -> None:
+            nonlocal has_value, armed, value, deadline
 
-            d.disposable = _scheduler.schedule_relative(duetime, action)
+            with source.lock:
+                has_value = True
+                value = x
+                deadline = _scheduler.now + duration
+                if not armed:
+                    armed = True
+                    timer.disposable = _scheduler.schedule_relative(duration, action)
 
         def on_error(exception: Exception) -> None:
-            cancelable.dispose()
+            nonlocal has_value
+
+            with source.lock:
+                timer.dispose()
+                has_value = False
             observer.on_error(exception)
-            has_value[0] = False
-            _id[0] += 1
 
         def on_completed() -> None:
-            cancelable.dispose()
-            if has_value[0]:
-                observer.on_next(value[0])
+            nonlocal has_value
+
+            with source.lock:
+                timer.dispose()
+                emit = has_value
+                has_value = False
+                current = value
 
+            if emit:
+                observer.on_next(current)
             observer.on_completed()
-            has_value[0] = False
-            _id[0] += 1
 
         subscription = source.subscribe(
             on_next, on_error, on_completed, scheduler=scheduler_
         )
-        return CompositeDisposable(subscription, cancelable)
+        return CompositeDisposable(subscription, timer)
 
     return Observable(subscribe)
 
@@ -1,20 +1,12 @@
+from collections import deque
 from datetime import datetime
 from typing import Any, TypeVar
 
-from reactivex import Notification, Observable, abc, typing
-from reactivex import operators as ops
-from reactivex.disposable import (
-    CompositeDisposable,
-    MultipleAssignmentDisposable,
-    SerialDisposable,
-)
-from reactivex.internal import curry_flip
-from reactivex.internal.constants import DELTA_ZERO
-from reactivex.notification import OnError
+from reactivex import Observable, abc, typing
+from reactivex.disposable import CompositeDisposable, SerialDisposable
+from reactivex.internal import buffers, curry_flip, latency
 from reactivex.scheduler import TimeoutScheduler
 
-from ._timestamp import Timestamp
-
 _T = TypeVar("_T")
 
 
@@ -26,92 +18,90 @@ def observable_delay_timespan(
     def subscribe(
         observer: abc.ObserverBase[_T], scheduler_: abc.SchedulerBase | None = None
     ):
-        nonlocal duetime
-
         _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
 
         if isinstance(duetime, datetime):
             duetime_ = _scheduler.to_datetime(duetime) - _scheduler.now
         else:
             duetime_ = _scheduler.to_timedelta(duetime)
+        delay = max(0.0, _scheduler.to_seconds(duetime_))
+
+        # Elements are queued with their due time on the numeric clock.
+        # As the delay is the same for all of them, the queue is sorted
+        # and a single timer for the head drives the whole sequence.
+        queue: deque[tuple[float, _T]] = deque()
+        # Ingress stamps of the queued elements, if stamps are carried
+        stamps: deque[float | None] | None = deque() if latency.enabled else None
+        completed_at: float | None = None
+        timer = SerialDisposable()
+        armed = False
+        gauge = buffers.track(
+            "delay", lambda: len(queue), lambda: [item[1] for item in queue]
+        )
+
+        def clock() -> float:
+            return _scheduler.to_seconds(_scheduler.now)
+
+        def arm(duetime: float) -> None:
+            nonlocal armed
+            armed = True
+            timer.disposable = _scheduler.schedule_relative(duetime, action)
+
+        def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+            nonlocal armed
 
-        cancelable = SerialDisposable()
-        exception: Exception | None = None
-        active = [False]
-        running = [False]
-        queue: list[Timestamp[Notification[_T]]] = []
+            with source.lock:
+                armed = False
+                now = clock()
+                while queue:
+                    due, value = queue[0]
+                    if due > now:
+                        arm(due - now)
+                        return
+                    queue.popleft()
+                    if stamps is None:
+                        observer.on_next(value)
+                    else:
+                        latency.emit(observer, value, stamps.popleft())
+
+                if completed_at is not None:
+                    if completed_at > now:
+                        arm(completed_at - now)
+                    else:
+                        observer.on_completed()
+
+        def on_next(x: _T) -> None:
+            with source.lock:
+                queue.append((clock() + delay, x))
+                if stamps is not None:
+                    stamps.append(latency.capture())
+                if not armed:
+                    arm(delay)
+            if gauge is not None:
+                gauge.check()
+
+        def on_error(exception: Exception) -> None:
+            with source.lock:
+                timer.dispose()
+                queue.clear()
+                if stamps is not None:
+                    stamps.clear()
+                observer.on_error(exception)
 
-        def on_next(notification: Timestamp[Notification[_T]]) -> None:
-            nonlocal exception
-            should_run = False
+        def on_completed() -> None:
+            nonlocal completed_at
 
             with source.lock:
-                if isinstance(notification.value, OnError):
-                    del queue[:]
-                    queue.append(notification)
-                    exception = notification.value.exception
-                    should_run = not running[0]
-                else:
-                    queue.append(
-                        Timestamp(
-                            value=notification.value,
-                            timestamp=notification.timestamp + duetime_,
-                        )
-                    )
-                    should_run = not active[0]
-                    active[0] = True
-
-            if should_run:
-                if exception:
-                    observer.on_error(exception)
-                else:
-                    mad = MultipleAssignmentDisposable()
-                    cancelable.disposable = mad
-
-                    def action(scheduler: abc.SchedulerBase, state: Any = None):
-                        if exception:
-                            return
-
-                        with source.lock:
-                            running[0] = True
-                            while True:
-                                result = None
-                                if queue and queue[0].timestamp <= scheduler.now:
-                                    result = queue.pop(0).value
-
-                                if result:
-                                    result.accept(observer)
-
-                                if not result:
-                                    break
-
-                            should_continue = False
-                            recurse_duetime: typing.RelativeTime = 0
-                            if queue:
-                                should_continue = True
-                                diff = queue[0].timestamp - scheduler.now
-                                recurse_duetime = max(DELTA_ZERO, diff)
-                            else:
-                                active[0] = False
-
-                            ex = exception
-                            running[0] = False
-
-                        if ex:
-                            observer.on_error(ex)
-                        elif should_continue:
-                            mad.disposable = scheduler.schedule_relative(
-                                recurse_duetime, action
-                            )
-
-                    mad.disposable = _scheduler.schedule_relative(duetime_, action)
-
-        subscription = source.pipe(
-            ops.materialize(),
-            ops.timestamp(),
-        ).subscribe(on_next, scheduler=_scheduler)
-
-        return CompositeDisposable(subscription, cancelable)
+                completed_at = clock() + delay
+                if not armed:
+                    arm(delay)
+
+        subscription = source.subscribe(
+            on_next, on_error, on_completed, scheduler=_scheduler
+        )
+        if gauge is None:
+            return CompositeDisposable(subscription, timer)
+        return CompositeDisposable(subscription, timer, gauge)
 
     return Observable(subscribe)
 
@@ -1,7 +1,8 @@
 from typing import Generic, TypeVar, cast
 
 from reactivex import Observable, abc, typing
-from reactivex.internal import curry_flip
+from reactivex.disposable import CompositeDisposable
+from reactivex.internal import buffers, curry_flip
 from reactivex.internal.basic import default_comparer
 
 _T = TypeVar("_T")
@@ -64,6 +65,7 @@ def distinct_(
         scheduler: abc.SchedulerBase | None = None,
     ) -> abc.DisposableBase:
         hashset = HashSet(comparer_)
+        gauge = buffers.track("distinct", lambda: len(hashset.set), lambda: hashset.set)
 
         def on_next(x: _T) -> None:
             key = cast(_TKey, x)
@@ -76,11 +78,16 @@ def distinct_(
                     return
 
             if hashset.push(key):
+                if gauge is not None:
+                    gauge.check()
                 observer.on_next(x)
 
-        return source.subscribe(
+        subscription = source.subscribe(
             on_next, observer.on_error, observer.on_completed, scheduler=scheduler
         )
+        if gauge is None:
+            return subscription
+        return CompositeDisposable(subscription, gauge)
 
     return Observable(subscribe)
 
@@ -1,3 +1,4 @@
+from collections import deque
 from typing import Any, TypeVar
 
 from reactivex import Observable, abc, typing
@@ -39,7 +40,7 @@ def expand_(
     ) -> abc.DisposableBase:
         scheduler = scheduler or ImmediateScheduler.singleton()
 
-        queue: list[Observable[_T]] = []
+        queue: deque[Observable[_T]] = deque()
         m = SerialDisposable()
         d = CompositeDisposable(m)
         active_count = 0
@@ -57,7 +58,7 @@ def expand_(
                 nonlocal is_acquired, active_count
 
                 if queue:
-                    work = queue.pop(0)
+                    work = queue.popleft()
                 else:
                     is_acquired = False
                     return
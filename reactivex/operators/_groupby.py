@@ -1,15 +1,40 @@
+from collections import OrderedDict
 from collections.abc import Callable
-from typing import Any, TypeVar
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from threading import RLock
+from typing import Any, TypeVar, cast
 
-from reactivex import GroupedObservable, Observable, typing
+from reactivex import GroupedObservable, Observable, abc, typing
+from reactivex.disposable import (
+    CompositeDisposable,
+    RefCountDisposable,
+    SerialDisposable,
+)
 from reactivex.internal import curry_flip
+from reactivex.internal.basic import identity
+from reactivex.scheduler import TimeoutScheduler
 from reactivex.subject import Subject
 
 _T = TypeVar("_T")
 _TKey = TypeVar("_TKey")
 _TValue = TypeVar("_TValue")
 
-# pylint: disable=import-outside-toplevel
+
+@dataclass
+class GroupByCounters:
+    """Counters updated by :func:`group_by <reactivex.operators.group_by>`.
+
+    The same instance may be shared by several subscriptions, in which
+    case the counts are aggregated over all of them.
+    """
+
+    active: int = 0
+    """Number of groups that are currently open."""
+
+    evicted: int = 0
+    """Number of groups completed because of ``max_groups`` or
+    ``idle_timeout``."""
 
 
 @curry_flip
@@ -18,13 +43,23 @@ def group_by_(
     key_mapper: typing.Mapper[_T, _TKey],
     element_mapper: typing.Mapper[_T, _TValue] | None = None,
     subject_mapper: Callable[[], Subject[_TValue]] | None = None,
+    max_groups: int | None = None,
+    idle_timeout: typing.RelativeTime | None = None,
+    counters: GroupByCounters | None = None,
+    scheduler: abc.SchedulerBase | None = None,
 ) -> Observable[GroupedObservable[_TKey, _TValue]]:
     """Groups the elements of an observable sequence according to a
     specified key mapper function.
 
+    Open groups are kept in a single ordered map where the least
+    recently used group comes first. This map doubles as the expiry
+    structure for ``idle_timeout``, so a single timer per subscription
+    is enough to complete all idle groups.
+
     Examples:
         >>> res = source.pipe(group_by(lambda x: x.id))
         >>> res = group_by(lambda x: x.id)(source)
+        >>> res = source.pipe(group_by(lambda x: x.id, max_groups=10_000))
 
     Args:
         source: Source observable to group.
@@ -32,20 +67,153 @@ def group_by_(
         element_mapper: Optional function to map elements to values.
         subject_mapper: Optional function that returns a subject used to initiate
             a grouped observable.
+        max_groups: Optional maximum number of open groups. When a new
+            group would exceed the limit, the least recently used group
+            is completed.
+        idle_timeout: Optional time after which a group that has not
+            received any element is completed.
+        counters: Optional counters updated with the number of active
+            and evicted groups.
+        scheduler: Optional scheduler used for ``idle_timeout``.
 
     Returns:
         An observable sequence of grouped observables.
     """
-    from reactivex import operators as ops
 
-    def duration_mapper(_: GroupedObservable[Any, Any]) -> Observable[Any]:
-        import reactivex
+    if max_groups is not None and max_groups < 1:
+        raise ValueError("max_groups must be at least 1")
+
+    element_mapper_ = element_mapper or cast(typing.Mapper[_T, _TValue], identity)
+    subject_mapper_ = subject_mapper or cast(Callable[[], Subject[_TValue]], Subject)
+    counters_ = counters or GroupByCounters()
+
+    def subscribe(
+        observer: abc.ObserverBase[GroupedObservable[_TKey, _TValue]],
+        scheduler_: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        writers: OrderedDict[_TKey, Subject[_TValue]] = OrderedDict()
+        last_seen: dict[_TKey, float] = {}
+        timer = SerialDisposable()
+        group_disposable = CompositeDisposable(timer)
+        ref_count_disposable = RefCountDisposable(group_disposable)
+
+        _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+        timeout = (
+            _scheduler.to_seconds(idle_timeout) if idle_timeout is not None else 0.0
+        )
+        armed = [False]
+
+        # The source never calls us concurrently, so only the idle timer
+        # races with on_next. Observers are called outside the lock.
+        lock: AbstractContextManager[Any] = (
+            RLock() if idle_timeout is not None else nullcontext()
+        )
+
+        def clock() -> float:
+            return _scheduler.to_seconds(_scheduler.now)
+
+        def close() -> list[Subject[_TValue]]:
+            timer.dispose()
+            closed = list(writers.values())
+            counters_.active -= len(writers)
+            writers.clear()
+            last_seen.clear()
+            return closed
+
+        def fail(error: Exception) -> None:
+            with lock:
+                closed = close()
+            for wrt in closed:
+                wrt.on_error(error)
+            observer.on_error(error)
+
+        def evict(key: _TKey) -> Subject[_TValue]:
+            writer = writers.pop(key)
+            last_seen.pop(key, None)
+            counters_.active -= 1
+            counters_.evicted += 1
+            return writer
+
+        def arm(duetime: float) -> None:
+            armed[0] = True
+            timer.disposable = _scheduler.schedule_relative(duetime, expire)
+
+        def expire(_: abc.SchedulerBase, __: Any = None) -> None:
+            expired: list[Subject[_TValue]] = []
+            with lock:
+                armed[0] = False
+                now = clock()
+                while writers:
+                    key = next(iter(writers))
+                    idle = now - last_seen[key]
+                    if idle < timeout:
+                        arm(timeout - idle)
+                        break
+                    expired.append(evict(key))
+
+            for writer in expired:
+                writer.on_completed()
+
+        def touch(key: _TKey) -> None:
+            if idle_timeout is not None:
+                last_seen[key] = clock()
+                if not armed[0]:
+                    arm(timeout)
+
+        def on_next(x: _T) -> None:
+            try:
+                key = key_mapper(x)
+            except Exception as e:  # pylint: disable=broad-except
+                fail(e)
+                return
+
+            with lock:
+                writer = writers.get(key)
+                if writer is not None:
+                    writers.move_to_end(key)
+                    touch(key)
+
+            if writer is None:
+                try:
+                    writer = subject_mapper_()
+                except Exception as e:  # pylint: disable=broad-except
+                    fail(e)
+                    return
+
+                evicted: Subject[_TValue] | None = None
+                with lock:
+                    if max_groups is not None and len(writers) >= max_groups:
+                        evicted = evict(next(iter(writers)))
+                    writers[key] = writer
+                    counters_.active += 1
+                    touch(key)
+
+                if evicted is not None:
+                    evicted.on_completed()
+                observer.on_next(GroupedObservable(key, writer, ref_count_disposable))
+
+            try:
+                element = element_mapper_(x)
+            except Exception as error:  # pylint: disable=broad-except
+                fail(error)
+                return
+
+            writer.on_next(element)
+
+        def on_completed() -> None:
+            with lock:
+                closed = close()
+            for wrt in closed:
+                wrt.on_completed()
+
+            observer.on_completed()
 
-        return reactivex.never()
+        group_disposable.add(
+            source.subscribe(on_next, fail, on_completed, scheduler=scheduler_)
+        )
+        return ref_count_disposable
 
-    return source.pipe(
-        ops.group_by_until(key_mapper, element_mapper, duration_mapper, subject_mapper)
-    )
+    return Observable(subscribe)
 
 
-__all__ = ["group_by_"]
+__all__ = ["GroupByCounters", "group_by_"]
@@ -9,6 +9,7 @@ from reactivex.disposable import (
     RefCountDisposable,
     SingleAssignmentDisposable,
 )
+from reactivex.internal import buffers
 from reactivex.internal.basic import identity
 from reactivex.subject import Subject
 from reactivex.typing import Mapper
@@ -76,6 +77,9 @@ def group_by_until_(
             writers: OrderedDict[_TKey, Subject[_TValue]] = OrderedDict()
             group_disposable = CompositeDisposable()
             ref_count_disposable = RefCountDisposable(group_disposable)
+            gauge = buffers.track("group_by_until", lambda: len(writers), writers.keys)
+            if gauge is not None:
+                group_disposable.add(gauge)
 
             def on_next(x: _T) -> None:
                 writer = None
@@ -104,6 +108,8 @@ def group_by_until_(
 
                     writers[key] = writer
                     fire_new_map_entry = True
+                    if gauge is not None:
+                        gauge.check()
 
                 if fire_new_map_entry:
                     group: GroupedObservable[_TKey, _TValue] = GroupedObservable(
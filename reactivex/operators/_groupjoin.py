@@ -10,7 +10,7 @@ from reactivex.disposable import (
     RefCountDisposable,
     SingleAssignmentDisposable,
 )
-from reactivex.internal import add_ref
+from reactivex.internal import add_ref, buffers
 from reactivex.subject import Subject
 
 _TLeft = TypeVar("_TLeft")
@@ -57,6 +57,13 @@ def group_join_(
             right_map: OrderedDict[int, _TRight] = OrderedDict()
             left_id = [0]
             right_id = [0]
+            gauge = buffers.track(
+                "group_join",
+                lambda: len(left_map) + len(right_map),
+                right_map.values,
+            )
+            if gauge is not None:
+                group.add(gauge)
 
             def on_next_left(value: _TLeft) -> None:
                 subject: Subject[_TRight] = Subject()
@@ -65,6 +72,8 @@ def group_join_(
                     _id = left_id[0]
                     left_id[0] += 1
                     left_map[_id] = subject
+                if gauge is not None:
+                    gauge.check()
 
                 try:
                     result = (value, add_ref(subject, rcd))
@@ -130,6 +139,8 @@ def group_join_(
                     _id = right_id[0]
                     right_id[0] += 1
                     right_map[_id] = value
+                if gauge is not None:
+                    gauge.check()
 
                 md = SingleAssignmentDisposable()
                 group.add(md)
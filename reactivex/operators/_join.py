@@ -1,10 +1,11 @@
 from collections import OrderedDict
 from collections.abc import Callable
+from itertools import chain
 from typing import Any, TypeVar
 
 from reactivex import Observable, abc
 from reactivex.disposable import CompositeDisposable, SingleAssignmentDisposable
-from reactivex.internal import noop
+from reactivex.internal import buffers, noop
 from reactivex.operators import take
 
 _T1 = TypeVar("_T1")
@@ -42,6 +43,13 @@ def join_(
             right_done = False
             right_map: OrderedDict[int, _T2] = OrderedDict()
             right_id = 0
+            gauge = buffers.track(
+                "join",
+                lambda: len(left_map) + len(right_map),
+                lambda: chain(left_map.values(), right_map.values()),
+            )
+            if gauge is not None:
+                group.add(gauge)
 
             def on_next_left(value: _T1):
                 nonlocal left_id
@@ -52,6 +60,8 @@ def join_(
 
                 left_map[current_id] = value
                 group.add(md)
+                if gauge is not None:
+                    gauge.check()
 
                 def expire():
                     if current_id in left_map:
@@ -98,6 +108,8 @@ def join_(
                 md = SingleAssignmentDisposable()
                 right_map[current_id] = value
                 group.add(md)
+                if gauge is not None:
+                    gauge.check()
 
                 def expire():
                     if current_id in right_map:
@@ -0,0 +1,123 @@
+from time import perf_counter
+from typing import TYPE_CHECKING, TypeVar
+
+from reactivex import Observable, abc
+from reactivex.disposable import CompositeDisposable, Disposable
+from reactivex.internal import curry_flip, latency
+
+if TYPE_CHECKING:
+    from reactivex.metrics import Histogram
+
+_T = TypeVar("_T")
+
+
+@curry_flip
+def stamp_latency_(source: Observable[_T]) -> Observable[_T]:
+    """Stamps every element with its ingress time.
+
+    The stamp is not attached to the element itself. It is kept on the
+    side while the element, or anything derived from it, is emitted
+    downstream. Operators that emit later or on another thread, such as
+    ``observe_on``, ``delay``, ``buffer_with_time`` and ``merge``, carry
+    the stamp along.
+
+    Examples:
+        >>> res = source.pipe(stamp_latency())
+
+    Args:
+        source: Observable sequence to stamp.
+
+    Returns:
+        The source sequence with its elements stamped.
+    """
+
+    # Operators subscribed from now on carry the stamps
+    latency.enable()
+
+    def subscribe(
+        observer: abc.ObserverBase[_T], scheduler: abc.SchedulerBase | None = None
+    ) -> abc.DisposableBase:
+        state = latency.current
+        is_active = True
+
+        def release() -> None:
+            nonlocal is_active
+            if is_active:
+                is_active = False
+                latency.deactivate()
+
+        def on_next(value: _T) -> None:
+            previous = state.stamp
+            state.stamp = perf_counter()
+            try:
+                observer.on_next(value)
+            finally:
+                state.stamp = previous
+
+        def on_error(error: Exception) -> None:
+            release()
+            observer.on_error(error)
+
+        def on_completed() -> None:
+            release()
+            observer.on_completed()
+
+        latency.activate()
+        subscription = source.subscribe(
+            on_next, on_error, on_completed, scheduler=scheduler
+        )
+        return CompositeDisposable(subscription, Disposable(release))
+
+    return Observable(subscribe)
+
+
+@curry_flip
+def measure_latency_(
+    source: Observable[_T],
+    histogram: "Histogram | None" = None,
+    label: str | None = None,
+) -> Observable[_T]:
+    """Records the time since the ingress stamp of every element.
+
+    Elements that were not stamped upstream are passed through without
+    being recorded.
+
+    Examples:
+        >>> res = source.pipe(measure_latency())
+        >>> res = source.pipe(measure_latency(label="orders"))
+
+    Args:
+        source: Observable sequence to measure.
+        histogram: Histogram to record the latencies in.
+        label: Label of the latency histogram in the default metrics
+            registry, used if no histogram is given.
+
+    Returns:
+        The source sequence, unchanged.
+    """
+
+    if histogram is None:
+        from reactivex.metrics import registry
+
+        histogram = registry.latency(label)
+    observe = histogram.observe
+
+    def subscribe(
+        observer: abc.ObserverBase[_T], scheduler: abc.SchedulerBase | None = None
+    ) -> abc.DisposableBase:
+        state = latency.current
+
+        def on_next(value: _T) -> None:
+            stamp = state.stamp
+            if stamp is not None:
+                observe(perf_counter() - stamp)
+            observer.on_next(value)
+
+        return source.subscribe(
+            on_next, observer.on_error, observer.on_completed, scheduler=scheduler
+        )
+
+    return Observable(subscribe)
+
+
+__all__ = ["measure_latency_", "stamp_latency_"]
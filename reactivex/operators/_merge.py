@@ -1,9 +1,13 @@
+from collections import deque
+from threading import RLock
 from typing import TypeVar, Union
 
 import reactivex
 from reactivex import Observable, abc, from_future, typing
 from reactivex.disposable import CompositeDisposable, SingleAssignmentDisposable
 from reactivex.internal import curry_flip, is_future, synchronized
+from reactivex.observable import ScalarObservable
+from reactivex.observer import SerializedObserver
 
 _T = TypeVar("_T")
 
@@ -44,29 +48,45 @@ def merge_(
         active_count = [0]
         group = CompositeDisposable()
         is_stopped = [False]
-        queue: list[Observable[_T]] = []
+        queue: deque[Observable[_T]] = deque()
+        lock = RLock()
+        serialized = SerializedObserver(observer)
 
         def subscribe(xs: Observable[_T]):
+            # Constant sequences are emitted inline, and the next queued
+            # source takes their place right away
+            while scheduler is None and isinstance(xs, ScalarObservable):
+                if not xs.emit(serialized):
+                    return
+                if not queue:
+                    active_count[0] -= 1
+                    if is_stopped[0] and active_count[0] == 0:
+                        serialized.on_completed()
+                    return
+                xs = queue.popleft()
+
             subscription = SingleAssignmentDisposable()
             group.add(subscription)
 
-            @synchronized(source.lock)
+            @synchronized(lock)
             def on_completed():
                 group.remove(subscription)
                 if queue:
-                    s = queue.pop(0)
+                    s = queue.popleft()
                     subscribe(s)
                 else:
                     active_count[0] -= 1
                     if is_stopped[0] and active_count[0] == 0:
-                        observer.on_completed()
+                        serialized.on_completed()
 
-            on_next = synchronized(source.lock)(observer.on_next)
-            on_error = synchronized(source.lock)(observer.on_error)
             subscription.disposable = xs.subscribe(
-                on_next, on_error, on_completed, scheduler=scheduler
+                serialized.on_next,
+                serialized.on_error,
+                on_completed,
+                scheduler=scheduler,
             )
 
+        @synchronized(lock)
         def on_next(inner_source: Observable[_T]) -> None:
             assert max_concurrent
             if active_count[0] < max_concurrent:
@@ -75,14 +95,15 @@ def merge_(
             else:
                 queue.append(inner_source)
 
+        @synchronized(lock)
         def on_completed():
             is_stopped[0] = True
             if active_count[0] == 0:
-                observer.on_completed()
+                serialized.on_completed()
 
         group.add(
             source.subscribe(
-                on_next, observer.on_error, on_completed, scheduler=scheduler
+                on_next, serialized.on_error, on_completed, scheduler=scheduler
             )
         )
         return group
@@ -117,8 +138,15 @@ def merge_all_(
         is_stopped = [False]
         m = SingleAssignmentDisposable()
         group.add(m)
+        lock = RLock()
+        serialized = SerializedObserver(observer)
 
         def on_next(inner_source: Union[Observable[_T], "typing.AnyFuture[_T]"]):
+            # Constant sequences are emitted inline without subscribing
+            if scheduler is None and isinstance(inner_source, ScalarObservable):
+                inner_source.emit(serialized)
+                return
+
             inner_subscription = SingleAssignmentDisposable()
             group.add(inner_subscription)
 
@@ -126,26 +154,28 @@ def merge_all_(
                 from_future(inner_source) if is_future(inner_source) else inner_source
             )
 
-            @synchronized(source.lock)
+            @synchronized(lock)
             def on_completed():
                 group.remove(inner_subscription)
                 if is_stopped[0] and len(group) == 1:
-                    observer.on_completed()
+                    serialized.on_completed()
 
-            on_next: typing.OnNext[_T] = synchronized(source.lock)(observer.on_next)
-            on_error = synchronized(source.lock)(observer.on_error)
             subscription = inner_source.subscribe(
-                on_next, on_error, on_completed, scheduler=scheduler
+                serialized.on_next,
+                serialized.on_error,
+                on_completed,
+                scheduler=scheduler,
             )
             inner_subscription.disposable = subscription
 
+        @synchronized(lock)
         def on_completed():
             is_stopped[0] = True
             if len(group) == 1:
-                observer.on_completed()
+                serialized.on_completed()
 
         m.disposable = source.subscribe(
-            on_next, observer.on_error, on_completed, scheduler=scheduler
+            on_next, serialized.on_error, on_completed, scheduler=scheduler
         )
         return group
 
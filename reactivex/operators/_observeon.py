@@ -1,7 +1,8 @@
 from typing import TypeVar
 
 from reactivex import Observable, abc
-from reactivex.internal import curry_flip
+from reactivex.disposable import CompositeDisposable
+from reactivex.internal import buffers, curry_flip
 from reactivex.observer import ObserveOnObserver
 
 _T = TypeVar("_T")
@@ -52,9 +53,16 @@ def observe_on_(
         observer: abc.ObserverBase[_T],
         subscribe_scheduler: abc.SchedulerBase | None = None,
     ):
-        return source.subscribe(
-            ObserveOnObserver(scheduler, observer), scheduler=subscribe_scheduler
+        observe_on_observer = ObserveOnObserver(scheduler, observer)
+        gauge = observe_on_observer.gauge = buffers.track(
+            "observe_on", lambda: len(observe_on_observer.queue)
         )
+        subscription = source.subscribe(
+            observe_on_observer, scheduler=subscribe_scheduler
+        )
+        if gauge is None:
+            return subscription
+        return CompositeDisposable(subscription, gauge)
 
     return Observable(subscribe)
 
@@ -0,0 +1,149 @@
+from collections import deque
+from typing import Any, Literal, TypeVar
+
+from reactivex import Observable, abc
+from reactivex.disposable import CompositeDisposable, SerialDisposable
+from reactivex.internal import (
+    ArgumentOutOfRangeException,
+    QueueOverflowError,
+    curry_flip,
+)
+from reactivex.scheduler import TimeoutScheduler
+
+_T = TypeVar("_T")
+
+OverflowPolicy = Literal["error", "drop_newest", "drop_oldest"]
+
+
+@curry_flip
+def rate_limit_(
+    source: Observable[_T],
+    rate: float,
+    burst: int = 1,
+    max_queue: int | None = None,
+    overflow: OverflowPolicy = "error",
+    scheduler: abc.SchedulerBase | None = None,
+) -> Observable[_T]:
+    """Limits the rate of an observable sequence using a token bucket.
+
+    The bucket holds up to ``burst`` tokens and is refilled with
+    ``rate`` tokens per second. Each emitted element consumes a token.
+    Elements arriving while the bucket is empty are queued, and a single
+    timer is armed for the moment the next token becomes available.
+
+    Examples:
+        >>> res = source.pipe(rate_limit(100.0))
+        >>> res = rate_limit(100.0, burst=10, max_queue=1000)(source)
+
+    Args:
+        source: Source observable to rate limit.
+        rate: Number of elements per second.
+        burst: Maximum number of elements emitted back to back.
+        max_queue: Optional maximum number of queued elements.
+        overflow: What to do when the queue is full.
+        scheduler: Scheduler to use for timing.
+
+    Returns:
+        The rate limited observable sequence.
+    """
+
+    if rate <= 0 or burst < 1:
+        raise ArgumentOutOfRangeException()
+
+    if max_queue is not None and max_queue < 0:
+        raise ArgumentOutOfRangeException()
+
+    if overflow not in ("error", "drop_newest", "drop_oldest"):
+        raise ValueError(f"Invalid overflow policy: {overflow!r}")
+
+    def subscribe(
+        observer: abc.ObserverBase[_T],
+        scheduler_: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+        queue: deque[_T] = deque()
+        timer = SerialDisposable()
+        tokens = float(burst)
+        last_refill = _scheduler.to_seconds(_scheduler.now)
+        armed = False
+        completed = False
+
+        def refill() -> None:
+            nonlocal tokens, last_refill
+
+            now = _scheduler.to_seconds(_scheduler.now)
+            tokens = min(float(burst), tokens + (now - last_refill) * rate)
+            last_refill = now
+
+        def drain() -> None:
+            nonlocal tokens, armed
+
+            while queue and tokens >= 1.0:
+                tokens -= 1.0
+                observer.on_next(queue.popleft())
+
+            if queue:
+                armed = True
+                timer.disposable = _scheduler.schedule_relative(
+                    (1.0 - tokens) / rate, action
+                )
+            elif completed:
+                observer.on_completed()
+
+        def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+            nonlocal armed
+
+            with source.lock:
+                armed = False
+                refill()
+                drain()
+
+        def on_next(x: _T) -> None:
+            nonlocal tokens
+
+            with source.lock:
+                # The queue is only non-empty while the timer is armed
+                if not armed:
+                    refill()
+                    if tokens >= 1.0:
+                        tokens -= 1.0
+                        observer.on_next(x)
+                        return
+
+                if max_queue is not None and len(queue) >= max_queue:
+                    if overflow == "error":
+                        timer.dispose()
+                        queue.clear()
+                        observer.on_error(QueueOverflowError())
+                        return
+                    if overflow == "drop_newest" or not queue:
+                        return
+                    queue.popleft()
+
+                queue.append(x)
+                if not armed:
+                    drain()
+
+        def on_error(error: Exception) -> None:
+            with source.lock:
+                timer.dispose()
+                queue.clear()
+                observer.on_error(error)
+
+        def on_completed() -> None:
+            nonlocal completed
+
+            with source.lock:
+                completed = True
+                if not queue:
+                    observer.on_completed()
+
+        subscription = source.subscribe(
+            on_next, on_error, on_completed, scheduler=scheduler_
+        )
+        return CompositeDisposable(subscription, timer)
+
+    return Observable(subscribe)
+
+
+__all__ = ["rate_limit_"]
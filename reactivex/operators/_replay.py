@@ -3,6 +3,7 @@ from typing import TypeVar
 
 from reactivex import ConnectableObservable, Observable, abc, typing
 from reactivex import operators as ops
+from reactivex.internal import buffers
 from reactivex.subject import ReplaySubject
 from reactivex.typing import Mapper
 
@@ -49,16 +50,23 @@ def replay_(
     mapper function.
     """
 
+    def create(scheduler: abc.SchedulerBase | None) -> ReplaySubject[_TSource]:
+        subject: ReplaySubject[_TSource] = ReplaySubject(buffer_size, window, scheduler)
+        queue = subject.queue
+        subject.gauge = buffers.track(
+            "replay", lambda: len(queue), lambda: [item.value for item in queue]
+        )
+        return subject
+
     if mapper:
 
         def subject_factory(
             scheduler: abc.SchedulerBase | None = None,
         ) -> ReplaySubject[_TSource]:
-            return ReplaySubject(buffer_size, window, scheduler)
+            return create(scheduler)
 
         return ops.multicast(subject_factory=subject_factory, mapper=mapper)
-    rs: ReplaySubject[_TSource] = ReplaySubject(buffer_size, window, scheduler)
-    return ops.multicast(subject=rs)
+    return ops.multicast(subject=create(scheduler))
 
 
 __all__ = ["replay_"]
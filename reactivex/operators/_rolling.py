@@ -0,0 +1,259 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
+from typing import Any, Generic, Literal, TypeVar, cast
+
+from reactivex import Observable, abc, typing
+from reactivex.internal import ArgumentOutOfRangeException, curry_flip
+from reactivex.scheduler import TimeoutScheduler
+
+_T = TypeVar("_T")
+
+RollingAggregate = Literal["sum", "mean", "min", "max", "var"]
+
+
+class RollingWindow(ABC, Generic[_T]):
+    """Incrementally maintained aggregate over a FIFO window.
+
+    Every method runs in amortized O(1) time.
+    """
+
+    @abstractmethod
+    def push(self, value: _T) -> None:
+        """Appends the newest element to the window."""
+
+    @abstractmethod
+    def pop(self) -> None:
+        """Evicts the oldest element from the window."""
+
+    @abstractmethod
+    def value(self) -> Any:
+        """Returns the aggregate of the elements in the window."""
+
+
+class _SumWindow(RollingWindow[Any]):
+    """Running sum, subtracting evicted elements."""
+
+    def __init__(self) -> None:
+        self.items: deque[Any] = deque()
+        self.total: Any = 0
+
+    def push(self, value: Any) -> None:
+        self.items.append(value)
+        self.total += value
+
+    def pop(self) -> None:
+        self.total -= self.items.popleft()
+
+    def value(self) -> Any:
+        return self.total
+
+
+class _MeanWindow(_SumWindow):
+    def value(self) -> float:
+        return self.total / len(self.items)
+
+
+class _VarWindow(RollingWindow[Any]):
+    """Population variance using Welford's update and its inverse."""
+
+    def __init__(self) -> None:
+        self.items: deque[float] = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, value: float) -> None:
+        self.items.append(value)
+        delta = value - self.mean
+        self.mean += delta / len(self.items)
+        self.m2 += delta * (value - self.mean)
+
+    def pop(self) -> None:
+        value = self.items.popleft()
+        n = len(self.items)
+        if not n:
+            self.mean = self.m2 = 0.0
+            return
+
+        delta = value - self.mean
+        self.mean -= delta / n
+        self.m2 -= delta * (value - self.mean)
+
+    def value(self) -> float:
+        return max(self.m2, 0.0) / len(self.items)
+
+
+class _ExtremumWindow(RollingWindow[Any]):
+    """Monotonic deque holding the candidates for the extremum.
+
+    Each entry is ``(sequence number, value)``. An element is dropped
+    from the back as soon as a newer element makes it irrelevant, so
+    the front always holds the current extremum.
+    """
+
+    def __init__(self, better: Callable[[Any, Any], bool]) -> None:
+        self.better = better
+        self.candidates: deque[tuple[int, Any]] = deque()
+        self.head = 0
+        self.tail = 0
+
+    def push(self, value: Any) -> None:
+        candidates = self.candidates
+        while candidates and not self.better(candidates[-1][1], value):
+            candidates.pop()
+        candidates.append((self.tail, value))
+        self.tail += 1
+
+    def pop(self) -> None:
+        if self.candidates[0][0] == self.head:
+            self.candidates.popleft()
+        self.head += 1
+
+    def value(self) -> Any:
+        return self.candidates[0][1]
+
+
+class _MonoidWindow(RollingWindow[_T]):
+    """Two-stack queue for an arbitrary associative combine function.
+
+    New elements go on the back stack and are folded into a running
+    aggregate. When the front stack is empty on eviction, the back
+    stack is moved over while computing suffix aggregates, so each
+    element is combined a constant number of times.
+    """
+
+    def __init__(self, combine: Callable[[_T, _T], _T]) -> None:
+        self.combine = combine
+        self.front: list[_T] = []
+        self.back: list[_T] = []
+        self.back_value: _T = cast(_T, None)
+
+    def push(self, value: _T) -> None:
+        if self.back:
+            self.back_value = self.combine(self.back_value, value)
+        else:
+            self.back_value = value
+        self.back.append(value)
+
+    def pop(self) -> None:
+        if not self.front:
+            back = self.back
+            front = self.front
+            while back:
+                value = back.pop()
+                front.append(self.combine(value, front[-1]) if front else value)
+        self.front.pop()
+
+    def value(self) -> _T:
+        if not self.front:
+            return self.back_value
+        if not self.back:
+            return self.front[-1]
+        return self.combine(self.front[-1], self.back_value)
+
+
+def _create_window(agg: RollingAggregate | Callable[[Any, Any], Any]) -> Any:
+    if callable(agg):
+        return _MonoidWindow(agg)
+    if agg == "sum":
+        return _SumWindow()
+    if agg == "mean":
+        return _MeanWindow()
+    if agg == "var":
+        return _VarWindow()
+    if agg == "min":
+        return _ExtremumWindow(lambda a, b: a < b)
+    if agg == "max":
+        return _ExtremumWindow(lambda a, b: a > b)
+
+    raise ValueError(f"Invalid rolling aggregate: {agg!r}")
+
+
+@curry_flip
+def rolling_(
+    source: Observable[_T],
+    agg: RollingAggregate | Callable[[_T, _T], _T],
+    count: int | None = None,
+    timespan: typing.RelativeTime | None = None,
+    scheduler: abc.SchedulerBase | None = None,
+) -> Observable[Any]:
+    """Computes an aggregate over a sliding window for each element.
+
+    Examples:
+        >>> res = source.pipe(rolling("sum", count=10))
+        >>> res = rolling("max", timespan=5.0)(source)
+
+    Args:
+        source: Source observable to aggregate.
+        agg: The aggregate to compute, or an associative function
+            combining two values.
+        count: Number of most recent elements in the window.
+        timespan: Age of the oldest element kept in the window.
+        scheduler: Scheduler used to timestamp elements when using
+            ``timespan``.
+
+    Returns:
+        An observable sequence of aggregates, one for each element.
+    """
+
+    if (count is None) == (timespan is None):
+        raise ValueError("Exactly one of count or timespan must be given")
+
+    if count is not None and count <= 0:
+        raise ArgumentOutOfRangeException()
+
+    _create_window(agg)  # Fail early on an invalid aggregate
+
+    def subscribe(
+        observer: abc.ObserverBase[Any],
+        scheduler_: abc.SchedulerBase | None = None,
+    ) -> abc.DisposableBase:
+        window: RollingWindow[_T] = _create_window(agg)
+
+        if count is not None:
+            size = 0
+
+            def on_next(x: _T) -> None:
+                nonlocal size
+
+                try:
+                    window.push(x)
+                    if size == count:
+                        window.pop()
+                    else:
+                        size += 1
+                    value = window.value()
+                except Exception as ex:  # pylint: disable=broad-except
+                    observer.on_error(ex)
+                    return
+
+                observer.on_next(value)
+
+        else:
+            _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
+            span = _scheduler.to_seconds(cast(typing.RelativeTime, timespan))
+            times: deque[float] = deque()
+
+            def on_next(x: _T) -> None:
+                now = _scheduler.to_seconds(_scheduler.now)
+                try:
+                    while times and now - times[0] >= span:
+                        times.popleft()
+                        window.pop()
+                    window.push(x)
+                    times.append(now)
+                    value = window.value()
+                except Exception as ex:  # pylint: disable=broad-except
+                    observer.on_error(ex)
+                    return
+
+                observer.on_next(value)
+
+        return source.subscribe(
+            on_next, observer.on_error, observer.on_completed, scheduler=scheduler_
+        )
+
+    return Observable(subscribe)
+
+
+__all__ = ["rolling_"]
@@ -1,3 +1,4 @@
+from collections import deque
 from collections.abc import Callable, Iterable
 from typing import TypeVar
 
@@ -48,12 +49,12 @@ def sequence_equal_(
         ) -> abc.DisposableBase:
             donel = [False]
             doner = [False]
-            ql: list[_T] = []
-            qr: list[_T] = []
+            ql: deque[_T] = deque()
+            qr: deque[_T] = deque()
 
             def on_next1(x: _T) -> None:
                 if len(qr) > 0:
-                    v = qr.pop(0)
+                    v = qr.popleft()
                     try:
                         equal = comparer_(v, x)
                     except Exception as e:
@@ -82,7 +83,7 @@ def sequence_equal_(
 
             def on_next2(x: _T):
                 if len(ql) > 0:
-                    v = ql.pop(0)
+                    v = ql.popleft()
                     try:
                         equal = comparer_(v, x)
                     except Exception as exception:
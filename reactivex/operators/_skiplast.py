@@ -1,3 +1,4 @@
+from collections import deque
 from typing import TypeVar
 
 from reactivex import Observable, abc
@@ -34,14 +35,14 @@ def skip_last_(source: Observable[_T], count: int) -> Observable[_T]:
         observer: abc.ObserverBase[_T],
         scheduler: abc.SchedulerBase | None = None,
     ) -> abc.DisposableBase:
-        q: list[_T] = []
+        q: deque[_T] = deque()
 
         def on_next(value: _T) -> None:
             front = None
             with source.lock:
                 q.append(value)
                 if len(q) > count:
-                    front = q.pop(0)
+                    front = q.popleft()
 
             if front is not None:
                 observer.on_next(front)
@@ -1,5 +1,7 @@
+from collections import deque
 from collections.abc import Callable
-from typing import Any, TypeVar
+from datetime import datetime
+from typing import TypeVar
 
 from reactivex import Observable, abc, typing
 from reactivex.scheduler import TimeoutScheduler
@@ -37,24 +39,22 @@ def skip_last_with_time_(
             observer: abc.ObserverBase[_T],
             scheduler_: abc.SchedulerBase | None = None,
         ) -> abc.DisposableBase:
-            nonlocal duration
-
             _scheduler: abc.SchedulerBase = (
                 scheduler or scheduler_ or TimeoutScheduler.singleton()
             )
-            duration = _scheduler.to_timedelta(duration)
-            q: list[dict[str, Any]] = []
+            duration_ = _scheduler.to_timedelta(duration)
+            q: deque[tuple[datetime, _T]] = deque()
 
             def on_next(x: _T) -> None:
                 now = _scheduler.now
-                q.append({"interval": now, "value": x})
-                while q and now - q[0]["interval"] >= duration:
-                    observer.on_next(q.pop(0)["value"])
+                q.append((now, x))
+                while q and now - q[0][0] >= duration_:
+                    observer.on_next(q.popleft()[1])
 
             def on_completed() -> None:
                 now = _scheduler.now
-                while q and now - q[0]["interval"] >= duration:
-                    observer.on_next(q.pop(0)["value"])
+                while q and now - q[0][0] >= duration_:
+                    observer.on_next(q.popleft()[1])
 
                 observer.on_completed()
 
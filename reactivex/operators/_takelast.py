@@ -1,7 +1,9 @@
+from collections import deque
 from typing import TypeVar
 
 from reactivex import Observable, abc
-from reactivex.internal import curry_flip
+from reactivex.disposable import CompositeDisposable
+from reactivex.internal import buffers, curry_flip
 
 _T = TypeVar("_T")
 
@@ -34,21 +36,25 @@ def take_last_(source: Observable[_T], count: int) -> Observable[_T]:
         observer: abc.ObserverBase[_T],
         scheduler: abc.SchedulerBase | None = None,
     ) -> abc.DisposableBase:
-        q: list[_T] = []
+        q: deque[_T] = deque(maxlen=max(count, 0))
+        gauge = buffers.track("take_last", lambda: len(q), lambda: q)
 
         def on_next(x: _T) -> None:
             q.append(x)
-            if len(q) > count:
-                q.pop(0)
+            if gauge is not None:
+                gauge.check()
 
         def on_completed():
             while q:
-                observer.on_next(q.pop(0))
+                observer.on_next(q.popleft())
             observer.on_completed()
 
-        return source.subscribe(
+        subscription = source.subscribe(
             on_next, observer.on_error, on_completed, scheduler=scheduler
         )
+        if gauge is None:
+            return subscription
+        return CompositeDisposable(subscription, gauge)
 
     return Observable(subscribe)
 
@@ -1,3 +1,4 @@
+from collections import deque
 from typing import TypeVar
 
 from reactivex import Observable, abc
@@ -34,16 +35,14 @@ def take_last_buffer_(source: Observable[_T], count: int) -> Observable[list[_T]
         observer: abc.ObserverBase[list[_T]],
         scheduler: abc.SchedulerBase | None = None,
     ) -> abc.DisposableBase:
-        q: list[_T] = []
+        q: deque[_T] = deque(maxlen=max(count, 0))
 
         def on_next(x: _T) -> None:
             with source.lock:
                 q.append(x)
-                if len(q) > count:
-                    q.pop(0)
 
         def on_completed() -> None:
-            observer.on_next(q)
+            observer.on_next(list(q))
             observer.on_completed()
 
         return source.subscribe(
@@ -1,4 +1,6 @@
-from typing import Any, TypeVar
+from collections import deque
+from datetime import datetime
+from typing import TypeVar
 
 from reactivex import Observable, abc, typing
 from reactivex.internal import curry_flip
@@ -41,24 +43,22 @@ def take_last_with_time_(
         observer: abc.ObserverBase[_T],
         scheduler_: abc.SchedulerBase | None = None,
     ) -> abc.DisposableBase:
-        nonlocal duration
-
         _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
-        duration = _scheduler.to_timedelta(duration)
-        q: list[dict[str, Any]] = []
+        duration_ = _scheduler.to_timedelta(duration)
+        q: deque[tuple[datetime, _T]] = deque()
 
         def on_next(x: _T) -> None:
             now = _scheduler.now
-            q.append({"interval": now, "value": x})
-            while q and now - q[0]["interval"] >= duration:
-                q.pop(0)
+            q.append((now, x))
+            while q and now - q[0][0] >= duration_:
+                q.popleft()
 
         def on_completed():
             now = _scheduler.now
             while q:
-                _next = q.pop(0)
-                if now - _next["interval"] <= duration:
-                    observer.on_next(_next["value"])
+                interval, value = q.popleft()
+                if now - interval <= duration_:
+                    observer.on_next(value)
 
             observer.on_completed()
 
@@ -7,7 +7,7 @@ from reactivex.disposable import (
     SerialDisposable,
     SingleAssignmentDisposable,
 )
-from reactivex.internal import curry_flip, is_future
+from reactivex.internal import DELTA_ZERO, curry_flip, is_future
 from reactivex.scheduler import TimeoutScheduler
 
 _T = TypeVar("_T")
@@ -23,6 +23,9 @@ def timeout_(
     """Returns the source observable sequence or the other observable
     sequence if duetime elapses.
 
+    With a relative duetime each value just pushes the deadline back;
+    the pending timer is only rescheduled if it fires too early.
+
     Examples:
         >>> source.pipe(timeout(5.0))
         >>> timeout(5.0)(source)
@@ -49,50 +52,72 @@ def timeout_(
     ) -> abc.DisposableBase:
         _scheduler = scheduler or scheduler_ or TimeoutScheduler.singleton()
 
-        switched = [False]
-        _id = [0]
+        switched = False
+        stopped = False
+        duration = (
+            None if isinstance(duetime, datetime) else _scheduler.to_timedelta(duetime)
+        )
+        deadline = _scheduler.now + duration if duration is not None else None
 
         original = SingleAssignmentDisposable()
         subscription = SerialDisposable()
         timer = SerialDisposable()
         subscription.disposable = original
 
-        def create_timer() -> None:
-            my_id = _id[0]
+        def action(scheduler: abc.SchedulerBase, state: Any = None) -> None:
+            nonlocal switched
+
+            with source.lock:
+                if stopped:
+                    return
 
-            def action(scheduler: abc.SchedulerBase, state: Any = None):
-                switched[0] = _id[0] == my_id
-                timer_wins = switched[0]
-                if timer_wins:
-                    subscription.disposable = obs.subscribe(
-                        observer, scheduler=scheduler
-                    )
+                if deadline is not None:
+                    remaining = deadline - _scheduler.now
+                    if remaining > DELTA_ZERO:
+                        timer.disposable = _scheduler.schedule_relative(
+                            remaining, action
+                        )
+                        return
 
-            if isinstance(duetime, datetime):
-                timer.disposable = _scheduler.schedule_absolute(duetime, action)
-            else:
-                timer.disposable = _scheduler.schedule_relative(duetime, action)
+                switched = True
 
-        create_timer()
+            subscription.disposable = obs.subscribe(observer, scheduler=scheduler)
+
+        if isinstance(duetime, datetime):
+            timer.disposable = _scheduler.schedule_absolute(duetime, action)
+        else:
+            timer.disposable = _scheduler.schedule_relative(duetime, action)
 
         def on_next(value: _T) -> None:
-            send_wins = not switched[0]
-            if send_wins:
-                _id[0] += 1
-                observer.on_next(value)
-                create_timer()
+            nonlocal deadline
+
+            with source.lock:
+                if switched:
+                    return
+                if duration is not None:
+                    deadline = _scheduler.now + duration
+
+            observer.on_next(value)
 
         def on_error(error: Exception) -> None:
-            on_error_wins = not switched[0]
-            if on_error_wins:
-                _id[0] += 1
-                observer.on_error(error)
+            nonlocal stopped
+
+            with source.lock:
+                if switched:
+                    return
+                stopped = True
+
+            observer.on_error(error)
 
         def on_completed() -> None:
-            on_completed_wins = not switched[0]
-            if on_completed_wins:
-                _id[0] += 1
-                observer.on_completed()
+            nonlocal stopped
+
+            with source.lock:
+                if switched:
+                    return
+                stopped = True
+
+            observer.on_completed()
 
         original.disposable = source.subscribe(
             on_next, on_error, on_completed, scheduler=scheduler_
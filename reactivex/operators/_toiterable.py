@@ -1,7 +1,8 @@
 from typing import TypeVar
 
 from reactivex import Observable, abc
-from reactivex.internal import curry_flip
+from reactivex.disposable import CompositeDisposable
+from reactivex.internal import buffers, curry_flip
 
 _T = TypeVar("_T")
 
@@ -30,9 +31,12 @@ def to_iterable_(source: Observable[_T]) -> Observable[list[_T]]:
         nonlocal source
 
         queue: list[_T] = []
+        gauge = buffers.track("to_list", lambda: len(queue), lambda: queue)
 
         def on_next(item: _T):
             queue.append(item)
+            if gauge is not None:
+                gauge.check()
 
         def on_completed():
             nonlocal queue
@@ -40,9 +44,12 @@ def to_iterable_(source: Observable[_T]) -> Observable[list[_T]]:
             queue = []
             observer.on_completed()
 
-        return source.subscribe(
+        subscription = source.subscribe(
             on_next, observer.on_error, on_completed, scheduler=scheduler
         )
+        if gauge is None:
+            return subscription
+        return CompositeDisposable(subscription, gauge)
 
     return Observable(subscribe)
 
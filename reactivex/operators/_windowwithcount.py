@@ -1,4 +1,5 @@
 import logging
+from collections import deque
 from typing import TypeVar
 
 from reactivex import Observable, abc
@@ -51,7 +52,7 @@ def window_with_count_(
         m = SingleAssignmentDisposable()
         refCountDisposable = RefCountDisposable(m)
         n = [0]
-        q: list[Subject[_T]] = []
+        q: deque[Subject[_T]] = deque()
 
         def create_window():
             s: Subject[_T] = Subject()
@@ -66,7 +67,7 @@ def window_with_count_(
 
             c = n[0] - count + 1
             if c >= 0 and c % skip_ == 0:
-                s = q.pop(0)
+                s = q.popleft()
                 s.on_completed()
 
             n[0] += 1
@@ -75,12 +76,12 @@ def window_with_count_(
 
         def on_error(exception: Exception) -> None:
             while q:
-                q.pop(0).on_error(exception)
+                q.popleft().on_error(exception)
             observer.on_error(exception)
 
         def on_completed() -> None:
             while q:
-                q.pop(0).on_completed()
+                q.popleft().on_completed()
             observer.on_completed()
 
         m.disposable = source.subscribe(
@@ -1,3 +1,4 @@
+from collections import deque
 from datetime import timedelta
 from typing import Any, TypeVar
 
@@ -57,7 +58,7 @@ def window_with_time_(
         next_shift = [timeshift]
         next_span = [timespan]
         total_time = [DELTA_ZERO]
-        queue: list[Subject[_T]] = []
+        queue: deque[Subject[_T]] = deque()
 
         group_disposable = CompositeDisposable(timer_d)
         ref_count_disposable = RefCountDisposable(group_disposable)
@@ -96,7 +97,7 @@ def window_with_time_(
                     observer.on_next(add_ref(s, ref_count_disposable))
 
                 if is_span:
-                    s = queue.pop(0)
+                    s = queue.popleft()
                     s.on_completed()
 
                 create_timer()
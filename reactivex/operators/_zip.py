@@ -1,5 +1,5 @@
 from collections.abc import Iterable
-from typing import Any, TypeVar
+from typing import Any, Literal, TypeVar
 
 import reactivex
 from reactivex import Observable, abc
@@ -13,6 +13,8 @@ _TOther = TypeVar("_TOther")
 def zip_(
     source: Observable[Any],
     *args: Observable[Any],
+    max_backlog: int | None = None,
+    overflow: Literal["error", "drop_newest", "drop_oldest"] = "error",
 ) -> Observable[tuple[Any, ...]]:
     """Merges the specified observable sequences into one observable
     sequence by creating a tuple whenever all of the
@@ -26,12 +28,15 @@ def zip_(
     Args:
         source: Source observable to zip.
         *args: Additional observables to zip with.
+        max_backlog: Optional maximum number of elements queued for
+            each source.
+        overflow: What to do when the queue of a source is full.
 
     Returns:
         An observable sequence containing the result of combining
         elements of the sources as a tuple.
     """
-    return reactivex.zip(source, *args)
+    return reactivex.zip(source, *args, max_backlog=max_backlog, overflow=overflow)
 
 
 @curry_flip
@@ -1,6 +1,9 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import reduce
-from typing import Any, TypeVar, overload
+from typing import Any, Generic, TypeVar, overload
+
+from .internal import assembly
+from .internal.curry import uncurry
 
 _A = TypeVar("_A")
 _B = TypeVar("_B")
@@ -81,11 +84,164 @@ def compose(*operators: Callable[[Any], Any]) -> Callable[[Any], Any]:
     """
 
     def _compose(source: Any) -> Any:
+        if assembly.hooks:
+            return assembly.assemble(operators, source)
         return reduce(lambda obs, op: op(obs), operators, source)
 
     return _compose
 
 
+class Template(Generic[_A, _B]):
+    """A pipeline of operators that is built once and applied to many
+    sources.
+
+    Calling the template applies its operators to the given source,
+    like :func:`compose`. Operators made by the operator functions of
+    :mod:`reactivex.operators` are resolved when the template is
+    created to the implementation and the arguments they were made
+    from, so applying the template calls the implementations directly.
+    Templates can be passed to ``pipe`` and to :func:`compile` like any
+    other operator.
+
+    Attributes:
+        operators: The operators in the order they are applied.
+    """
+
+    __slots__ = ("operators", "_steps")
+
+    def __init__(self, operators: Iterable[Callable[[Any], Any]]) -> None:
+        self.operators: tuple[Callable[[Any], Any], ...] = tuple(operators)
+        self._steps = tuple(_bind(operator) for operator in self.operators)
+
+    def __call__(self, source: _A) -> _B:
+        if assembly.hooks:
+            return assembly.assemble(self.operators, source)
+
+        result: Any = source
+        for function, args, kwargs in self._steps:
+            result = function(result, *args, **kwargs)
+        return result
+
+    def __len__(self) -> int:
+        return len(self.operators)
+
+    def __repr__(self) -> str:
+        names = ", ".join(assembly.operator_name(op) for op in self.operators)
+        return f"Template({names})"
+
+
+def _bind(
+    operator: Callable[[Any], Any],
+) -> tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]:
+    curried = uncurry(operator)
+    if curried is None:
+        return operator, (), {}
+    return curried
+
+
+def _validate(position: int, operator: Any) -> None:
+    if not callable(operator):
+        raise TypeError(f"Argument {position} is not an operator: {operator!r}")
+
+    # The public operator functions return operators, e.g. ops.count is
+    # a mistake for ops.count()
+    if getattr(operator, "__module__", None) == "reactivex.operators":
+        name = assembly.operator_name(operator)
+        raise TypeError(
+            f"Argument {position} is the operator function "
+            f"{name}, call it to create the operator, e.g. {name}(...)"
+        )
+
+
+@overload
+def compile(__op1: Callable[[_A], _B]) -> Template[_A, _B]: ...
+
+
+@overload
+def compile(
+    __op1: Callable[[_A], _B], __op2: Callable[[_B], _C]
+) -> Template[_A, _C]: ...
+
+
+@overload
+def compile(
+    __op1: Callable[[_A], _B],
+    __op2: Callable[[_B], _C],
+    __op3: Callable[[_C], _D],
+) -> Template[_A, _D]: ...
+
+
+@overload
+def compile(
+    __op1: Callable[[_A], _B],
+    __op2: Callable[[_B], _C],
+    __op3: Callable[[_C], _D],
+    __op4: Callable[[_D], _E],
+) -> Template[_A, _E]: ...
+
+
+@overload
+def compile(
+    __op1: Callable[[_A], _B],
+    __op2: Callable[[_B], _C],
+    __op3: Callable[[_C], _D],
+    __op4: Callable[[_D], _E],
+    __op5: Callable[[_E], _F],
+) -> Template[_A, _F]: ...
+
+
+@overload
+def compile(
+    __op1: Callable[[_A], _B],
+    __op2: Callable[[_B], _C],
+    __op3: Callable[[_C], _D],
+    __op4: Callable[[_D], _E],
+    __op5: Callable[[_E], _F],
+    __op6: Callable[[_F], _G],
+) -> Template[_A, _G]: ...
+
+
+@overload
+def compile(*operators: Callable[[Any], Any]) -> Template[Any, Any]: ...
+
+
+def compile(*operators: Callable[[Any], Any]) -> Template[Any, Any]:
+    """Compiles operators into a reusable pipeline template.
+
+    Building a pipeline with ``pipe`` calls every operator function,
+    e.g. ``ops.map(mapper)``, each time. A template checks and builds
+    the operators once, so that a pipeline that is set up for many
+    sources, e.g. once per request, only pays for applying them.
+    Nested templates are flattened.
+
+    Examples:
+        >>> template = reactivex.compile(ops.map(parse), ops.filter(valid))
+        >>> template(source) == source.pipe(ops.map(parse), ops.filter(valid))
+        >>> source.pipe(template, ops.take(1))
+
+    Args:
+        operators: Sequence of operators.
+
+    Returns:
+        The template, which applies the operators left to right to the
+        source it is called with.
+
+    Raises:
+        TypeError: If an operator is not callable, or is an operator
+            function that was not called.
+    """
+
+    flattened: list[Callable[[Any], Any]] = []
+    for position, operator in enumerate(operators):
+        if isinstance(operator, Template):
+            flattened.extend(operator.operators)
+        else:
+            _validate(position, operator)
+            flattened.append(operator)
+
+    return Template(flattened)
+
+
 @overload
 def pipe(__value: _A) -> _A: ...
 
@@ -201,4 +357,4 @@ def pipe(__value: Any, *fns: Callable[[Any], Any]) -> Any:
     return compose(*fns)(__value)
 
 
-__all__ = ["pipe", "compose"]
+__all__ = ["pipe", "compile", "compose", "Template"]
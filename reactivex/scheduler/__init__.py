@@ -1,14 +1,37 @@
-from .catchscheduler import CatchScheduler
-from .currentthreadscheduler import CurrentThreadScheduler
-from .eventloopscheduler import EventLoopScheduler
-from .historicalscheduler import HistoricalScheduler
-from .immediatescheduler import ImmediateScheduler
-from .newthreadscheduler import NewThreadScheduler
-from .scheduleditem import ScheduledItem
-from .threadpoolscheduler import ThreadPoolScheduler
-from .timeoutscheduler import TimeoutScheduler
-from .trampolinescheduler import TrampolineScheduler
-from .virtualtimescheduler import VirtualTimeScheduler
+from typing import TYPE_CHECKING
+
+from reactivex.internal.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .catchscheduler import CatchScheduler
+    from .currentthreadscheduler import CurrentThreadScheduler
+    from .eventloopscheduler import EventLoopScheduler
+    from .historicalscheduler import HistoricalScheduler
+    from .immediatescheduler import ImmediateScheduler
+    from .newthreadscheduler import NewThreadScheduler
+    from .scheduleditem import ScheduledItem
+    from .threadpoolscheduler import ThreadPoolScheduler
+    from .timeoutscheduler import TimeoutScheduler
+    from .trampolinescheduler import TrampolineScheduler
+    from .virtualtimescheduler import VirtualTimeScheduler
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "CatchScheduler": ".catchscheduler",
+        "CurrentThreadScheduler": ".currentthreadscheduler",
+        "EventLoopScheduler": ".eventloopscheduler",
+        "HistoricalScheduler": ".historicalscheduler",
+        "ImmediateScheduler": ".immediatescheduler",
+        "NewThreadScheduler": ".newthreadscheduler",
+        "ScheduledItem": ".scheduleditem",
+        "ThreadPoolScheduler": ".threadpoolscheduler",
+        "TimeoutScheduler": ".timeoutscheduler",
+        "TrampolineScheduler": ".trampolinescheduler",
+        "VirtualTimeScheduler": ".virtualtimescheduler",
+    },
+    ("eventloop", "mainloop"),
+)
 
 __all__ = [
     "CatchScheduler",
@@ -1,9 +1,26 @@
-from .asyncioscheduler import AsyncIOScheduler
-from .asynciothreadsafescheduler import AsyncIOThreadSafeScheduler
-from .eventletscheduler import EventletScheduler
-from .geventscheduler import GEventScheduler
-from .ioloopscheduler import IOLoopScheduler
-from .twistedscheduler import TwistedScheduler
+from typing import TYPE_CHECKING
+
+from reactivex.internal.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .asyncioscheduler import AsyncIOScheduler
+    from .asynciothreadsafescheduler import AsyncIOThreadSafeScheduler
+    from .eventletscheduler import EventletScheduler
+    from .geventscheduler import GEventScheduler
+    from .ioloopscheduler import IOLoopScheduler
+    from .twistedscheduler import TwistedScheduler
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AsyncIOScheduler": ".asyncioscheduler",
+        "AsyncIOThreadSafeScheduler": ".asynciothreadsafescheduler",
+        "EventletScheduler": ".eventletscheduler",
+        "GEventScheduler": ".geventscheduler",
+        "IOLoopScheduler": ".ioloopscheduler",
+        "TwistedScheduler": ".twistedscheduler",
+    },
+)
 
 __all__ = [
     "AsyncIOScheduler",
@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import TypeVar
+from collections.abc import Callable
+from typing import TYPE_CHECKING, TypeVar
 
 from reactivex import abc, typing
 from reactivex.disposable import (
@@ -11,6 +12,9 @@ from reactivex.disposable import (
 
 from ..periodicscheduler import PeriodicScheduler
 
+if TYPE_CHECKING:
+    from reactivex.metrics import Ticket
+
 _TState = TypeVar("_TState")
 log = logging.getLogger("Rx")
 
@@ -48,10 +52,13 @@ class AsyncIOScheduler(PeriodicScheduler):
         def interval() -> None:
             sad.disposable = self.invoke_action(action, state=state)
 
+        interval, ticket = self._track(interval, 0.0)
         handle = self._loop.call_soon(interval)
 
         def dispose() -> None:
             handle.cancel()
+            if ticket is not None:
+                ticket.discard()
 
         return CompositeDisposable(sad, Disposable(dispose))
 
@@ -81,10 +88,13 @@ class AsyncIOScheduler(PeriodicScheduler):
         def interval() -> None:
             sad.disposable = self.invoke_action(action, state=state)
 
+        interval, ticket = self._track(interval, seconds)
         handle = self._loop.call_later(seconds, interval)
 
         def dispose() -> None:
             handle.cancel()
+            if ticket is not None:
+                ticket.discard()
 
         return CompositeDisposable(sad, Disposable(dispose))
 
@@ -108,3 +118,25 @@ class AsyncIOScheduler(PeriodicScheduler):
 
         duetime = self.to_datetime(duetime)
         return self.schedule_relative(duetime - self.now, action, state=state)
+
+    def _track(
+        self, interval: Callable[[], None], seconds: float
+    ) -> tuple[Callable[[], None], "Ticket | None"]:
+        """Wraps a callback to record statistics, if enabled.
+
+        The loop drops cancelled handles lazily, so they are counted as
+        discarded as soon as they are cancelled.
+        """
+
+        stats = self.stats
+        if stats is None:
+            return interval, None
+
+        loop = self._loop
+        ticket = stats.ticket(seconds <= 0)
+        due = loop.time() + seconds
+
+        def run() -> None:
+            ticket.run(interval, loop.time() - due)
+
+        return run, ticket
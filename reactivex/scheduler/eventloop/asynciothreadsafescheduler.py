@@ -40,9 +40,12 @@ class AsyncIOThreadSafeScheduler(AsyncIOScheduler):
         def interval() -> None:
             sad.disposable = self.invoke_action(action, state=state)
 
+        interval, ticket = self._track(interval, 0.0)
         handle = self._loop.call_soon_threadsafe(interval)
 
         def dispose() -> None:
+            if ticket is not None:
+                ticket.discard()
             if self._on_self_loop_or_not_running():
                 handle.cancel()
                 return
@@ -84,6 +87,8 @@ class AsyncIOThreadSafeScheduler(AsyncIOScheduler):
         def interval() -> None:
             sad.disposable = self.invoke_action(action, state=state)
 
+        interval, ticket = self._track(interval, seconds)
+
         # the operations on the list used here are atomic, so there is no
         # need to protect its access with a lock
         handle: list[asyncio.Handle] = []
@@ -94,6 +99,9 @@ class AsyncIOThreadSafeScheduler(AsyncIOScheduler):
         handle.append(self._loop.call_soon_threadsafe(stage2))
 
         def dispose() -> None:
+            if ticket is not None:
+                ticket.discard()
+
             def do_cancel_handles() -> None:
                 try:
                     handle.pop().cancel()
@@ -11,7 +11,7 @@ from reactivex.internal.exceptions import DisposedException
 from reactivex.internal.priorityqueue import PriorityQueue
 
 from .periodicscheduler import PeriodicScheduler
-from .scheduleditem import ScheduledItem
+from .scheduleditem import ScheduledItem, TrackedScheduledItem
 
 log = logging.getLogger("Rx")
 
@@ -98,7 +98,12 @@ class EventLoopScheduler(PeriodicScheduler, abc.DisposableBase):
             raise DisposedException()
 
         dt = self.to_datetime(duetime)
-        si: ScheduledItem = ScheduledItem(self, state, action, dt)
+        si: ScheduledItem
+        if self.stats is None:
+            si = ScheduledItem(self, state, action, dt)
+        else:
+            ticket = self.stats.ticket(dt <= self.now)
+            si = TrackedScheduledItem(self, state, action, dt, ticket)
 
         with self._condition:
             if dt <= self.now:
@@ -1,8 +1,24 @@
-from .gtkscheduler import GtkScheduler
-from .pygamescheduler import PyGameScheduler
-from .qtscheduler import QtScheduler
-from .tkinterscheduler import TkinterScheduler
-from .wxscheduler import WxScheduler
+from typing import TYPE_CHECKING
+
+from reactivex.internal.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .gtkscheduler import GtkScheduler
+    from .pygamescheduler import PyGameScheduler
+    from .qtscheduler import QtScheduler
+    from .tkinterscheduler import TkinterScheduler
+    from .wxscheduler import WxScheduler
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "GtkScheduler": ".gtkscheduler",
+        "PyGameScheduler": ".pygamescheduler",
+        "QtScheduler": ".qtscheduler",
+        "TkinterScheduler": ".tkinterscheduler",
+        "WxScheduler": ".wxscheduler",
+    },
+)
 
 __all__ = [
     "GtkScheduler",
@@ -41,6 +41,7 @@ class NewThreadScheduler(PeriodicScheduler):
         scheduler = EventLoopScheduler(
             thread_factory=self.thread_factory, exit_if_empty=True
         )
+        scheduler.stats = self.stats
         return scheduler.schedule(action, state)
 
     def schedule_relative(
@@ -64,6 +65,7 @@ class NewThreadScheduler(PeriodicScheduler):
         scheduler = EventLoopScheduler(
             thread_factory=self.thread_factory, exit_if_empty=True
         )
+        scheduler.stats = self.stats
         return scheduler.schedule_relative(duetime, action, state)
 
     def schedule_absolute(
@@ -1,11 +1,14 @@
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from reactivex import abc
 from reactivex.disposable import SingleAssignmentDisposable
 
 from .scheduler import Scheduler
 
+if TYPE_CHECKING:
+    from reactivex.metrics import Ticket
+
 
 class ScheduledItem:
     def __init__(
@@ -45,3 +48,49 @@ class ScheduledItem:
             return self.duetime == other.duetime
         except AttributeError:
             return NotImplemented
+
+
+class _TicketDisposable(SingleAssignmentDisposable):
+    """Disposable of a tracked item, which also reports the
+    cancellation to the statistics of the scheduler."""
+
+    def __init__(self, ticket: "Ticket") -> None:
+        super().__init__()
+        self.ticket = ticket
+
+    def dispose(self) -> None:
+        if not self.is_disposed:
+            self.ticket.cancel()
+        super().dispose()
+
+
+class TrackedScheduledItem(ScheduledItem):
+    """Scheduled item of a scheduler collecting statistics.
+
+    Schedulers create tracked items only while their ``stats`` are
+    set, so that items of other schedulers keep no ticket.
+    """
+
+    def __init__(
+        self,
+        scheduler: Scheduler,
+        state: Any | None,
+        action: abc.ScheduledAction[Any],
+        duetime: datetime,
+        ticket: "Ticket",
+    ) -> None:
+        super().__init__(scheduler, state, action, duetime)
+        self.ticket = ticket
+        self.disposable = _TicketDisposable(ticket)
+
+    def invoke(self) -> None:
+        lag = (self.scheduler.now - self.duetime).total_seconds()
+        self.ticket.run(super().invoke, lag)
+
+    def is_cancelled(self) -> bool:
+        # Schedulers drop the items found cancelled, so the ticket is
+        # discarded here
+        if self.disposable.is_disposed:
+            self.ticket.discard()
+            return True
+        return False
@@ -1,12 +1,15 @@
 from abc import abstractmethod
 from datetime import datetime, timedelta, timezone
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
 from reactivex import abc, typing
 from reactivex.disposable import Disposable
 from reactivex.internal.basic import default_now
 from reactivex.internal.constants import UTC_ZERO
 
+if TYPE_CHECKING:
+    from reactivex.metrics import SchedulerStats
+
 _TState = TypeVar("_TState")
 
 
@@ -16,6 +19,46 @@ class Scheduler(abc.SchedulerBase):
     of schedule_periodic, refer to PeriodicScheduler.
     """
 
+    stats: "SchedulerStats | None" = None
+    """Statistics of the scheduler, if enabled with
+    :meth:`enable_stats`."""
+
+    def enable_stats(self, label: str | None = None) -> "SchedulerStats":
+        """Starts collecting queue depth, lag and utilization statistics.
+
+        Statistics are collected by the :class:`EventLoopScheduler`,
+        :class:`NewThreadScheduler`, :class:`ThreadPoolScheduler`, the
+        trampoline schedulers, :class:`VirtualTimeScheduler` and
+        :class:`AsyncIOScheduler
+        <reactivex.scheduler.eventloop.AsyncIOScheduler>`. Only items
+        scheduled after enabling are counted.
+
+        Examples:
+            >>> stats = scheduler.enable_stats("io")
+            >>> stats.queued, stats.utilization, stats.lag.quantile(0.99)
+
+        Args:
+            label: [Optional] If given, the statistics are added to the
+                default metrics registry with this label.
+
+        Returns:
+            The statistics, also available as :attr:`stats`.
+        """
+
+        from reactivex.metrics import SchedulerStats, registry
+
+        stats = self.stats
+        if stats is None:
+            stats = self.stats = SchedulerStats()
+        if label is not None:
+            registry.add_scheduler(label, stats)
+        return stats
+
+    def disable_stats(self) -> None:
+        """Stops collecting statistics for newly scheduled items."""
+
+        self.stats = None
+
     @property
     def now(self) -> datetime:
         """Represents a notion of time for this scheduler. Tasks being
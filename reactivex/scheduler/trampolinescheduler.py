@@ -6,7 +6,7 @@ from reactivex.abc.disposable import DisposableBase
 from reactivex.abc.scheduler import ScheduledAction
 from reactivex.internal.constants import DELTA_ZERO
 
-from .scheduleditem import ScheduledItem
+from .scheduleditem import ScheduledItem, TrackedScheduledItem
 from .scheduler import Scheduler
 from .trampoline import Trampoline
 
@@ -89,7 +89,12 @@ class TrampolineScheduler(Scheduler):
         dt = self.to_datetime(duetime)
         if dt > self.now:
             log.warning("Do not schedule blocking work!")
-        item: ScheduledItem = ScheduledItem(self, state, action, dt)
+        item: ScheduledItem
+        if self.stats is None:
+            item = ScheduledItem(self, state, action, dt)
+        else:
+            ticket = self.stats.ticket(dt <= self.now)
+            item = TrackedScheduledItem(self, state, action, dt, ticket)
 
         self.get_trampoline().run(item)
 
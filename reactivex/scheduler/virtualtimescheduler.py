@@ -8,7 +8,7 @@ from reactivex.abc.scheduler import AbsoluteTime
 from reactivex.internal import ArgumentOutOfRangeException, PriorityQueue
 
 from .periodicscheduler import PeriodicScheduler
-from .scheduleditem import ScheduledItem
+from .scheduleditem import ScheduledItem, TrackedScheduledItem
 
 log = logging.getLogger("Rx")
 
@@ -109,7 +109,12 @@ class VirtualTimeScheduler(PeriodicScheduler):
         """
 
         dt = self.to_datetime(duetime)
-        si: ScheduledItem = ScheduledItem(self, state, action, dt)
+        si: ScheduledItem
+        if self.stats is None:
+            si = ScheduledItem(self, state, action, dt)
+        else:
+            ticket = self.stats.ticket(dt <= self.now)
+            si = TrackedScheduledItem(self, state, action, dt, ticket)
         with self._lock:
             self._queue.enqueue(si)
         return si.disposable
@@ -1,6 +1,21 @@
-from .asyncsubject import AsyncSubject
-from .behaviorsubject import BehaviorSubject
-from .replaysubject import ReplaySubject
-from .subject import Subject
+from typing import TYPE_CHECKING
+
+from reactivex.internal.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .asyncsubject import AsyncSubject
+    from .behaviorsubject import BehaviorSubject
+    from .replaysubject import ReplaySubject
+    from .subject import Subject
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AsyncSubject": ".asyncsubject",
+        "BehaviorSubject": ".behaviorsubject",
+        "ReplaySubject": ".replaysubject",
+        "Subject": ".subject",
+    },
+)
 
 __all__ = ["Subject", "AsyncSubject", "BehaviorSubject", "ReplaySubject"]
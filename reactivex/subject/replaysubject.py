@@ -1,7 +1,7 @@
 import sys
 from collections import deque
 from datetime import datetime, timedelta
-from typing import Any, NamedTuple, TypeVar, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, cast
 
 from reactivex.observer.scheduledobserver import ScheduledObserver
 from reactivex.scheduler import CurrentThreadScheduler
@@ -10,6 +10,9 @@ from .. import abc, typing
 from ..observer import Observer
 from .subject import Subject
 
+if TYPE_CHECKING:
+    from reactivex.internal.buffers import BufferGauge
+
 _T = TypeVar("_T")
 
 
@@ -35,6 +38,9 @@ class ReplaySubject(Subject[_T]):
     and future observers, subject to buffer trimming policies.
     """
 
+    gauge: "BufferGauge | None" = None
+    """Set by replay when buffers are tracked."""
+
     def __init__(
         self,
         buffer_size: int | None = None,
@@ -98,6 +104,8 @@ class ReplaySubject(Subject[_T]):
             now = self.scheduler.now
             self.queue.append(QueueItem(interval=now, value=value))
             self._trim(now)
+            if self.gauge is not None:
+                self.gauge.check()
 
         for observer in observers:
             observer.on_next(value)
@@ -138,4 +146,6 @@ class ReplaySubject(Subject[_T]):
 
         with self.lock:
             self.queue.clear()
+            if self.gauge is not None:
+                self.gauge.dispose()
             super().dispose()
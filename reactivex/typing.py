@@ -1,8 +1,6 @@
-import asyncio
-import concurrent.futures
 from collections.abc import Callable
 from threading import Thread
-from typing import TypeAlias, TypeVar
+from typing import TYPE_CHECKING, TypeAlias, TypeVar
 
 from typing_extensions import TypeAliasType
 
@@ -20,6 +18,10 @@ from .abc.scheduler import (
 )
 from .abc.startable import StartableBase
 
+if TYPE_CHECKING:
+    import asyncio
+    import concurrent.futures
+
 _TState = TypeVar("_TState")
 _T1 = TypeVar("_T1")
 _T2 = TypeVar("_T2")
@@ -46,9 +48,11 @@ SubComparer = TypeAliasType(
 Accumulator = TypeAliasType(
     "Accumulator", Callable[[_TState, _T1], _TState], type_params=(_TState, _T1)
 )
+# The value is a forward reference so that importing reactivex does not
+# import asyncio and concurrent.futures
 AnyFuture = TypeAliasType(
     "AnyFuture",
-    asyncio.Future[_T1] | concurrent.futures.Future[_T1],
+    "asyncio.Future[_T1] | concurrent.futures.Future[_T1]",
     type_params=(_T1,),
 )
 """Any future-like object, i.e. either an :class:`asyncio.Future` or a
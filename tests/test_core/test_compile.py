@@ -0,0 +1,103 @@
+import unittest
+
+import pytest
+
+import reactivex
+from reactivex import debug
+from reactivex import operators as ops
+from reactivex.pipe import Template
+from reactivex.subject import Subject
+
+
+def double(x: int) -> int:
+    return x * 2
+
+
+def increment(x: int) -> int:
+    return x + 1
+
+
+def above_two(x: int) -> bool:
+    return x > 2
+
+
+def add(acc: int, x: int) -> int:
+    return acc + x
+
+
+def invert(x: int) -> int:
+    return 1 // x
+
+
+class TestCompile(unittest.TestCase):
+    def test_same_result_as_pipe(self) -> None:
+        template = reactivex.compile(
+            ops.map(double),
+            ops.filter(above_two),
+            ops.to_list(),
+        )
+
+        for _ in range(3):
+            results: list[list[int]] = []
+            template(reactivex.of(1, 2, 3)).subscribe(results.append)
+            assert results == [[4, 6]]
+
+    def test_sources_are_independent(self) -> None:
+        template = reactivex.compile(ops.scan(add, 0))
+        xs: Subject[int] = Subject()
+        ys: Subject[int] = Subject()
+        results: list[tuple[str, int]] = []
+
+        template(xs).subscribe(lambda x: results.append(("xs", x)))
+        template(ys).subscribe(lambda x: results.append(("ys", x)))
+        xs.on_next(1)
+        ys.on_next(10)
+        xs.on_next(2)
+
+        assert results == [("xs", 1), ("ys", 10), ("xs", 3)]
+
+    def test_in_pipe_and_nested(self) -> None:
+        inner = reactivex.compile(ops.map(increment), ops.take(2))
+        outer = reactivex.compile(inner, ops.map(str))
+
+        assert isinstance(outer, Template)
+        assert len(outer) == 3
+        assert repr(outer) == "Template(map, take, map)"
+
+        results: list[str] = []
+        reactivex.of(1, 2, 3).pipe(outer).subscribe(results.append)
+        assert results == ["2", "3"]
+
+    def test_keyword_arguments_are_bound(self) -> None:
+        template = reactivex.compile(ops.take_while(above_two, inclusive=True))
+
+        results: list[int] = []
+        template(reactivex.of(5, 4, 1, 6)).subscribe(results.append)
+        assert results == [5, 4, 1]
+
+    def test_empty(self) -> None:
+        source = reactivex.of(1)
+        assert reactivex.compile()(source) is source
+
+    def test_not_callable(self) -> None:
+        with pytest.raises(TypeError, match="Argument 1 is not an operator"):
+            reactivex.compile(ops.take(1), 42)  # type: ignore
+
+    def test_operator_function_not_called(self) -> None:
+        with pytest.raises(TypeError, match="operator function count"):
+            reactivex.compile(ops.count)  # type: ignore
+
+    def test_assembly_hooks(self) -> None:
+        template = reactivex.compile(ops.map(invert))
+        debug.enable()
+        try:
+            errors: list[Exception] = []
+            template(reactivex.of(0)).subscribe(on_error=errors.append)
+        finally:
+            debug.disable()
+
+        (error,) = errors
+        site = debug.assembly_site(error)
+        assert site is not None
+        assert (site.operator, site.stage) == ("map", 0)
+        assert site.function == "test_assembly_hooks"
@@ -0,0 +1,77 @@
+import cProfile
+import pstats
+import sys
+import unittest
+from typing import Any
+
+import reactivex
+from reactivex import debug
+from reactivex import operators as ops
+from reactivex.internal import assembly
+
+
+def raise_on_three(x: int) -> int:
+    if x == 3:
+        raise ValueError("three")
+    return x
+
+
+class TestAssemblyTracking(unittest.TestCase):
+    def setUp(self) -> None:
+        debug.enable()
+
+    def tearDown(self) -> None:
+        debug.disable()
+
+    def test_disable_removes_hook(self) -> None:
+        debug.disable()
+        assert not assembly.hooks
+
+    def test_error_attributed_to_operator(self) -> None:
+        errors: list[Exception] = []
+        xs = reactivex.of(1, 2, 3).pipe(
+            ops.map(lambda x: x + 1),
+            ops.map(raise_on_three),
+            ops.filter(lambda x: True),
+        )
+        xs.subscribe(on_error=errors.append)
+
+        (error,) = errors
+        site = debug.assembly_site(error)
+        assert site is not None
+        assert (site.operator, site.stage) == ("map", 1)
+        assert site.filename == __file__
+        assert site.function == "test_error_attributed_to_operator"
+        assert "xs = reactivex.of(1, 2, 3).pipe(" in site.line
+        if sys.version_info >= (3, 11):
+            assert error.__notes__ == [f"Operator {site}"]
+
+    def test_upstream_error_not_attributed(self) -> None:
+        errors: list[Exception] = []
+        xs = reactivex.throw(ValueError("ex")).pipe(ops.map(lambda x: x))
+        xs.subscribe(on_error=errors.append)
+
+        (error,) = errors
+        assert debug.assembly_site(error) is None
+
+    def test_values_pass_through(self) -> None:
+        xs = reactivex.of(1, 2, 3).pipe(ops.map(lambda x: x * 2), ops.to_list())
+        assert xs.run() == [2, 4, 6]
+
+    def test_profile_stats(self) -> None:
+        values: list[Any] = []
+        xs = reactivex.from_iterable(range(10)).pipe(
+            ops.map(lambda x: x + 1),
+            ops.filter(lambda x: x % 2 == 0),
+        )
+
+        profiler = cProfile.Profile()
+        profiler.runcall(lambda: xs.subscribe(values.append))
+
+        entries = debug.profile_stats(pstats.Stats(profiler))
+        assert values == [2, 4, 6, 8, 10]
+        assert sorted((e.site.tag, e.calls) for e in entries) == [
+            ("rx.filter[1]", 10),
+            ("rx.map[0]", 10),
+        ]
+        assert all(e.site.filename == __file__ for e in entries)
@@ -0,0 +1,170 @@
+import io
+import unittest
+from collections.abc import Callable
+from contextlib import redirect_stdout
+
+import reactivex
+from reactivex import graph, metrics
+from reactivex import operators as ops
+from reactivex.metrics import MetricsRegistry
+from reactivex.scheduler import ImmediateScheduler
+from reactivex.subject import Subject
+
+
+def increment(x: int) -> int:
+    return x + 1
+
+
+def double(x: int) -> int:
+    return x * 2
+
+
+def is_even(x: int) -> bool:
+    return x % 2 == 0
+
+
+def is_positive(x: int) -> bool:
+    return x > 0
+
+
+IDENTITY: Callable[[reactivex.Observable[int]], reactivex.Observable[int]] = ops.map()
+
+
+class TestGraph(unittest.TestCase):
+    def setUp(self) -> None:
+        graph.enable()
+
+    def tearDown(self) -> None:
+        graph.disable()
+
+    def test_records_kind_params_and_sources(self) -> None:
+        xs: Subject[int] = Subject()
+        ys = reactivex.of(1)
+        zs = xs.pipe(ops.map(increment), ops.merge(ys), ops.take(2))
+
+        node = graph.node_of(zs)
+        assert (node.kind, node.params, node.stage) == ("take", {"count": 2}, 2)
+        (merge,) = node.sources
+        assert merge.kind == "merge"
+        assert [n.kind for n in merge.sources] == ["map", "Observable"]
+        assert merge.sources[0].params == {"mapper": increment}
+        assert merge.sources[0].sources == (graph.node_of(xs),)
+
+    def test_scalar_sources_are_named_like_other_sources(self) -> None:
+        immediate = ImmediateScheduler()
+        for xs, ys in [
+            (reactivex.just(1), reactivex.just(1, immediate)),
+            (reactivex.empty(), reactivex.empty(immediate)),
+            (reactivex.of(1, 2), reactivex.of(*range(100))),
+        ]:
+            assert graph.node_of(xs).kind == graph.node_of(ys).kind == "Observable"
+            node = graph.node_of(xs.pipe(ops.map(increment)))
+            assert [n.kind for n in node.sources] == ["Observable"]
+
+    def test_not_recorded_when_disabled(self) -> None:
+        graph.disable()
+        xs: Subject[int] = Subject()
+        node = graph.node_of(xs.pipe(ops.map(increment)))
+
+        assert (node.kind, node.params, node.sources) == ("Observable", None, ())
+
+    def test_outermost_hook(self) -> None:
+        with metrics.instrument():
+            xs: Subject[int] = Subject()
+            ys = xs.pipe(ops.map(increment))
+
+        assert graph.node_of(ys).kind == "map"
+
+    def test_explain(self) -> None:
+        registry = MetricsRegistry()
+        xs: Subject[int] = Subject()
+        with metrics.instrument("explain", registry):
+            ys = xs.pipe(ops.map(increment), ops.filter(is_even), ops.merge(xs))
+        ys.subscribe()
+        for value in range(4):
+            xs.on_next(value)
+
+        text = graph.explain(ys, registry, "explain")
+        lines = text.splitlines()
+        assert lines[0].startswith("#0 merge(sources=(Subject,), max_concurrent=None)")
+        assert lines[1].startswith("├── #1 filter(predicate=is_even)  [")
+        assert lines[1].endswith("us/element, 4 in, 2 out]")
+        assert lines[2].startswith("│   └── #2 map(mapper=increment)  [")
+        assert lines[3] == "│       └── #3 Subject"
+        assert lines[4] == "└── #3 (see above)"
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            ys.explain(registry, "explain")
+        assert output.getvalue() == text + "\n"
+
+
+class TestRewrite(unittest.TestCase):
+    def test_merge_windows(self) -> None:
+        template = reactivex.compile(
+            ops.skip(1), ops.take(10), ops.skip(2), ops.slice(1, 5)
+        )
+        rewritten = graph.rewrite(template)
+
+        (node,) = [graph.describe(op) for op in rewritten.operators]
+        assert (node.kind, node.params) == (
+            "slice",
+            {"start": 4, "stop": 8, "step": None},
+        )
+        source = reactivex.range(20)
+        expected = source.pipe(template, ops.to_list()).run()
+        assert source.pipe(rewritten, ops.to_list()).run() == expected
+
+    def test_merge_windows_without_elements(self) -> None:
+        for operators in [
+            (ops.skip(2), ops.take(0)),
+            (ops.slice(1, 3), ops.take(0)),
+            (ops.take(0), ops.skip(1)),
+        ]:
+            template = reactivex.compile(*operators)
+            rewritten = graph.rewrite(template)
+            assert repr(rewritten) == "Template(take)"
+
+            completed: list[str] = []
+            for name, pipeline in [("original", template), ("rewritten", rewritten)]:
+                source: Subject[int] = Subject()
+                source.pipe(pipeline).subscribe(
+                    on_completed=lambda name=name: completed.append(name)
+                )
+            assert completed == ["original", "rewritten"]
+
+    def test_collapse_maps_and_filters(self) -> None:
+        template = reactivex.compile(
+            ops.map(increment),
+            IDENTITY,
+            ops.map(double),
+            ops.filter(is_even),
+            ops.filter(is_positive),
+        )
+        rewritten = graph.rewrite(template)
+
+        assert repr(rewritten) == "Template(map, filter)"
+        source = reactivex.range(-5, 5)
+        expected = source.pipe(template, ops.to_list()).run()
+        assert source.pipe(rewritten, ops.to_list()).run() == expected
+
+    def test_unknown_operators_are_barriers(self) -> None:
+        def identity(source: reactivex.Observable[int]) -> reactivex.Observable[int]:
+            return source
+
+        template = reactivex.compile(ops.take(5), identity, ops.take(3), ops.slice(-2))
+        rewritten = graph.rewrite(template)
+
+        assert rewritten.operators == template.operators
+
+    def test_custom_pass(self) -> None:
+        def drop_identity_maps(nodes: list[graph.Node]) -> list[graph.Node]:
+            return [
+                n
+                for n in nodes
+                if not (n.kind == "map" and n.params == {"mapper": None})
+            ]
+
+        template = reactivex.compile(ops.map(increment), IDENTITY, ops.take(1))
+        rewritten = graph.rewrite(template, [drop_identity_maps])
+        assert repr(rewritten) == "Template(map, take)"
@@ -0,0 +1,66 @@
+import subprocess
+import sys
+import unittest
+
+import reactivex
+import reactivex.scheduler
+import reactivex.scheduler.eventloop
+import reactivex.subject
+from reactivex import operators as ops
+from reactivex.operators._groupby import GroupByCounters
+from reactivex.scheduler.eventloop.asyncioscheduler import AsyncIOScheduler
+from reactivex.scheduler.threadpoolscheduler import ThreadPoolScheduler
+from reactivex.subject.replaysubject import ReplaySubject
+
+
+def imported_modules(statement: str) -> set[str]:
+    script = f"{statement}; import sys; print(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestImports(unittest.TestCase):
+    def test_import_is_lazy(self) -> None:
+        modules = imported_modules("import reactivex")
+
+        assert "asyncio" not in modules
+        assert "concurrent.futures" not in modules
+        assert "reactivex.operators" not in modules
+        assert "reactivex.scheduler.eventloop" not in modules
+        assert "reactivex.subject.replaysubject" not in modules
+
+    def test_operators_import_is_lazy(self) -> None:
+        modules = imported_modules("import reactivex.operators")
+
+        assert "asyncio" not in modules
+        assert not [m for m in modules if m.startswith("reactivex.operators._")]
+
+    def test_lazy_attributes_are_the_defining_objects(self) -> None:
+        assert reactivex.scheduler.ThreadPoolScheduler is ThreadPoolScheduler
+        assert reactivex.scheduler.eventloop.AsyncIOScheduler is AsyncIOScheduler
+        assert reactivex.subject.ReplaySubject is ReplaySubject
+        assert ops.GroupByCounters is GroupByCounters
+
+    def test_lazy_subpackage(self) -> None:
+        modules = imported_modules(
+            "import reactivex; reactivex.scheduler.eventloop.AsyncIOScheduler"
+        )
+
+        assert "reactivex.scheduler.eventloop.asyncioscheduler" in modules
+        assert "reactivex.scheduler.eventloop.twistedscheduler" not in modules
+
+    def test_dir_lists_lazy_attributes(self) -> None:
+        assert set(reactivex.scheduler.__all__) <= set(dir(reactivex.scheduler))
+        assert "eventloop" in dir(reactivex.scheduler)
+
+    def test_star_import(self) -> None:
+        namespace: dict[str, object] = {}
+        exec("from reactivex.scheduler.mainloop import *", namespace)
+
+        assert "QtScheduler" in namespace
+
+    def test_unknown_attribute(self) -> None:
+        with self.assertRaises(AttributeError):
+            getattr(reactivex.scheduler, "NoSuchScheduler")
@@ -0,0 +1,83 @@
+import threading
+from typing import Any
+
+from reactivex import Observer
+from reactivex.observer import SerializedObserver
+
+
+def test_serialized_observer_forwards() -> None:
+    values: list[Any] = []
+    observer = SerializedObserver(
+        Observer(values.append, values.append, lambda: values.append("done"))
+    )
+
+    observer.on_next(1)
+    observer.on_next(2)
+    observer.on_completed()
+
+    assert values == [1, 2, "done"]
+
+
+def test_serialized_observer_ignores_after_terminal() -> None:
+    values: list[Any] = []
+    error = Exception("ex")
+    observer = SerializedObserver(
+        Observer(values.append, values.append, lambda: values.append("done"))
+    )
+
+    observer.on_next(1)
+    observer.on_error(error)
+    observer.on_next(2)
+    observer.on_completed()
+
+    assert values == [1, error]
+
+
+def test_serialized_observer_reentrant_calls_are_queued() -> None:
+    values: list[int] = []
+    observer: SerializedObserver[int]
+
+    def on_next(value: int) -> None:
+        values.append(value)
+        if value < 3:
+            observer.on_next(value + 1)
+            values.append(-value)
+
+    observer = SerializedObserver(Observer(on_next))
+    observer.on_next(1)
+
+    assert values == [1, -1, 2, -2, 3]
+
+
+def test_serialized_observer_concurrent_producers() -> None:
+    threads = 8
+    count = 2000
+    values: list[int] = []
+    active = [0]
+    overlaps = [0]
+
+    def on_next(value: int) -> None:
+        active[0] += 1
+        if active[0] > 1:
+            overlaps[0] += 1
+        values.append(value)
+        active[0] -= 1
+
+    observer = SerializedObserver(Observer(on_next))
+    barrier = threading.Barrier(threads)
+
+    def produce(offset: int) -> None:
+        barrier.wait()
+        for i in range(count):
+            observer.on_next(offset + i)
+
+    workers = [
+        threading.Thread(target=produce, args=(n * count,)) for n in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert overlaps[0] == 0
+    assert sorted(values) == list(range(threads * count))
@@ -1,3 +1,7 @@
+import pytest
+
+import reactivex
+from reactivex import operators as ops
 from reactivex.disposable import (
     BooleanDisposable,
     CompositeDisposable,
@@ -206,6 +210,146 @@ def test_groupdisposable_clear():
     assert g.length == 1
 
 
+def test_groupdisposable_dispose_order():
+    order: list[int] = []
+    disposables = [Disposable(lambda i=i: order.append(i)) for i in range(6)]
+
+    g = CompositeDisposable(disposables[:5])
+    g.remove(disposables[2])
+    g.add(disposables[5])
+    g.dispose()
+
+    assert order == [2, 0, 1, 3, 4, 5]
+
+
+def test_groupdisposable_duplicates():
+    disposed = [0]
+
+    def action():
+        disposed[0] += 1
+
+    d = Disposable(action)
+    g = CompositeDisposable(d, d)
+
+    assert g.length == 2
+    assert g.to_list() == [d, d]
+    assert g.remove(d)
+    assert g.length == 1
+    assert g.contains(d)
+    assert g.remove(d)
+    assert not g.contains(d)
+    assert not g.length
+
+
+def test_groupdisposable_duplicates_keep_order():
+    a = Disposable()
+    b = Disposable()
+
+    g = CompositeDisposable(a, b, a)
+    assert g.to_list() == [a, b, a]
+    g.add(b)
+    g.remove(a)
+    assert g.disposable == [b, a, b]
+
+
+def test_groupdisposable_unhashable():
+    class Unhashable(Disposable):
+        __hash__ = None  # type: ignore[assignment]
+
+    d = Unhashable()
+    g = CompositeDisposable(d)
+
+    assert g.contains(d)
+    assert g.remove(d)
+    assert d.is_disposed
+
+
+def test_groupdisposable_assign_disposable():
+    d1 = Disposable()
+    d2 = Disposable()
+    g = CompositeDisposable(d1)
+
+    g.disposable = [d2, d2]
+    assert g.length == 2
+    assert not g.contains(d1)
+    g.dispose()
+    assert d2.is_disposed
+    assert not d1.is_disposed
+
+
+def test_groupdisposable_remove_many():
+    disposables = [Disposable() for _ in range(100_000)]
+    g = CompositeDisposable(disposables)
+
+    for d in disposables:
+        assert g.remove(d)
+
+    assert not g.length
+
+
+def test_dispose_deep_tree():
+    order: list[str] = []
+    node = Disposable(lambda: order.append("leaf"))
+    for _ in range(50_000):
+        single = SingleAssignmentDisposable()
+        single.disposable = node
+        serial = SerialDisposable()
+        serial.disposable = CompositeDisposable(single)
+        node = serial
+
+    root = CompositeDisposable(node, Disposable(lambda: order.append("sibling")))
+    root.dispose()
+
+    assert order == ["leaf", "sibling"]
+
+
+def test_dispose_error_disposes_remaining():
+    def fail(message: str) -> None:
+        raise ValueError(message)
+
+    d1 = Disposable()
+    d2 = Disposable()
+    inner = CompositeDisposable(Disposable(lambda: fail("first")), d1)
+    root = CompositeDisposable(inner, Disposable(lambda: fail("second")), d2)
+
+    with pytest.raises(ValueError, match="first"):
+        root.dispose()
+
+    assert d1.is_disposed
+    assert d2.is_disposed
+
+
+def test_dispose_nested_call_completes_with_outer_call():
+    leaf = Disposable()
+    nested = CompositeDisposable(leaf)
+    seen: list[bool] = []
+
+    def action() -> None:
+        nested.dispose()
+        seen.append(leaf.is_disposed)
+
+    root = CompositeDisposable(Disposable(action))
+    root.dispose()
+
+    # The nested call only queues the leaf, the outer call disposes it
+    assert seen == [False]
+    assert leaf.is_disposed
+
+
+def test_dispose_deep_operator_chain():
+    disposed = [False]
+    source: reactivex.Observable[int] = reactivex.create(
+        lambda observer, scheduler: Disposable(lambda: disposed.__setitem__(0, True))
+    )
+
+    xs = source
+    for _ in range(100):
+        xs = xs.pipe(ops.map(lambda x: x + 1))
+
+    xs.subscribe().dispose()
+    assert disposed[0]
+
+
 def test_mutabledisposable_ctor_prop():
     m = SerialDisposable()
     assert not m.disposable
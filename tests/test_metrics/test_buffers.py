@@ -0,0 +1,175 @@
+import gc
+import sys
+import unittest
+from typing import Any
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.metrics import BufferGauge, buffers
+from reactivex.subject import Subject
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+
+
+def gauge_of(operator: str) -> BufferGauge:
+    (gauge,) = [g for g in buffers.gauges() if g.operator == operator]
+    return gauge
+
+
+class TestBuffers(unittest.TestCase):
+    def setUp(self) -> None:
+        gc.collect()
+        buffers.enable()
+
+    def tearDown(self) -> None:
+        buffers.disable()
+
+    def test_disabled_is_not_tracked(self) -> None:
+        buffers.disable()
+        subject: Subject[int] = Subject()
+        subject.pipe(ops.to_list()).subscribe()
+
+        assert buffers.gauges() == []
+
+    def test_to_list(self) -> None:
+        subject: Subject[int] = Subject()
+        subscription = subject.pipe(ops.to_list()).subscribe()
+        subject.on_next(1)
+        subject.on_next(2)
+
+        assert buffers.snapshot(nbytes=True) == [
+            {
+                "operator": "to_list",
+                "count": 2,
+                "peak": 2,
+                "alerted": False,
+                "nbytes": 2 * sys.getsizeof(1),
+            }
+        ]
+
+        subscription.dispose()
+        assert buffers.gauges() == []
+
+    def test_zip(self) -> None:
+        xs: Subject[int] = Subject()
+        ys: Subject[int] = Subject()
+        subscription = reactivex.zip(xs, ys).subscribe()
+
+        xs.on_next(1)
+        xs.on_next(2)
+        xs.on_next(3)
+        ys.on_next(1)
+
+        gauge = gauge_of("zip")
+        assert (gauge.count, gauge.peak) == (2, 3)
+        subscription.dispose()
+
+    def test_operators_report_their_buffers(self) -> None:
+        subject: Subject[int] = Subject()
+        ys: Subject[int] = Subject()
+        scheduler = TestScheduler()
+
+        def parity(x: int) -> int:
+            return x % 2
+
+        pipelines: list[Any] = [
+            ops.take_last(2),
+            ops.distinct(),
+            ops.delay(10, scheduler),
+            ops.group_by_until(parity, None, lambda _: reactivex.never()),
+            ops.join(ys, lambda _: reactivex.never(), lambda _: reactivex.never()),
+            ops.group_join(
+                ys, lambda _: reactivex.never(), lambda _: reactivex.never()
+            ),
+            ops.replay(mapper=lambda xs: xs),
+            ops.observe_on(scheduler),
+        ]
+        subscriptions = [subject.pipe(op).subscribe() for op in pipelines]
+        for value in (1, 2, 3):
+            subject.on_next(value)
+        ys.on_next(4)
+
+        counts = {g.operator: g.count for g in buffers.gauges()}
+        assert counts == {
+            "take_last": 2,
+            "distinct": 3,
+            "delay": 3,
+            "group_by_until": 2,
+            "join": 4,
+            "group_join": 4,
+            "replay": 3,
+            "observe_on": 3,
+        }
+
+        for subscription in subscriptions:
+            subscription.dispose()
+
+        # The replay subject is tracked until it is garbage collected
+        del subscriptions
+        gc.collect()
+        assert buffers.gauges() == []
+
+    def test_alert_once_per_crossing(self) -> None:
+        alerts: list[tuple[str, int]] = []
+        buffers.enable(3, lambda gauge: alerts.append((gauge.operator, gauge.count)))
+
+        subject: Subject[int] = Subject()
+        subject.pipe(ops.take_last(10)).subscribe()
+        for value in range(5):
+            subject.on_next(value)
+
+        assert alerts == [("take_last", 3)]
+        assert gauge_of("take_last").alerted
+
+    def test_alert_rearms_below_threshold(self) -> None:
+        alerts: list[int] = []
+        buffers.enable(2, lambda gauge: alerts.append(gauge.count))
+
+        xs: Subject[int] = Subject()
+        ys: Subject[int] = Subject()
+        reactivex.zip(xs, ys).subscribe()
+
+        xs.on_next(1)
+        xs.on_next(2)
+        for _ in range(2):
+            ys.on_next(0)
+        xs.on_next(3)
+        xs.on_next(4)
+
+        assert alerts == [2, 2]
+
+    def test_prometheus(self) -> None:
+        subject: Subject[int] = Subject()
+        subject.pipe(ops.to_list()).subscribe()
+        subject.pipe(ops.to_list()).subscribe()
+        subject.on_next(1)
+
+        text = buffers.to_prometheus()
+        assert 'rx_buffer_elements{operator="to_list"} 2' in text
+        assert 'rx_buffer_peak_elements{operator="to_list"} 1' in text
+        assert 'rx_buffer_subscriptions{operator="to_list"} 2' in text
+
+    def test_scheduled_delay(self) -> None:
+        scheduler = TestScheduler()
+        counts: list[int] = []
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_completed(230)
+        )
+
+        def count(scheduler: Any, state: Any) -> None:
+            counts.append(gauge_of("delay").count)
+
+        scheduler.schedule_absolute(225, count)
+        scheduler.schedule_absolute(315, count)
+        scheduler.schedule_absolute(325, count)
+        results = scheduler.start(lambda: xs.pipe(ops.delay(100)))
+
+        assert counts == [2, 1, 0]
+        assert results.messages == [
+            on_next(310, 1),
+            on_next(320, 2),
+            on_completed(330),
+        ]
+        assert buffers.gauges() == []
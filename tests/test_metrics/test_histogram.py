@@ -0,0 +1,44 @@
+from reactivex.metrics import Histogram
+
+
+def test_histogram_empty() -> None:
+    histogram = Histogram()
+
+    assert histogram.count == 0
+    assert histogram.quantile(0.99) == 0.0
+
+
+def test_histogram_observe() -> None:
+    histogram = Histogram([1.0, 2.0, 4.0])
+
+    for value in (0.5, 1.0, 1.5, 3.0, 8.0):
+        histogram.observe(value)
+
+    assert histogram.count == 5
+    assert histogram.sum == 14.0
+    assert histogram.max == 8.0
+    assert histogram.buckets() == [(1.0, 2), (2.0, 3), (4.0, 4), (float("inf"), 5)]
+
+
+def test_histogram_quantile() -> None:
+    histogram = Histogram([1.0, 2.0, 4.0])
+
+    for _ in range(98):
+        histogram.observe(0.5)
+    histogram.observe(1.5)
+    histogram.observe(3.0)
+
+    assert histogram.quantile(0.5) == 1.0
+    assert histogram.quantile(0.99) == 2.0
+    assert histogram.quantile(1.0) == 3.0
+
+
+def test_histogram_reset() -> None:
+    histogram = Histogram()
+    histogram.observe(0.1)
+
+    histogram.reset()
+
+    assert histogram.count == 0
+    assert histogram.max == 0.0
+    assert histogram.snapshot()["p50"] == 0.0
@@ -0,0 +1,143 @@
+import time
+import unittest
+
+import reactivex
+from reactivex import metrics
+from reactivex import operators as ops
+from reactivex.internal import assembly
+from reactivex.metrics import MetricsRegistry
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+
+
+class TestInstrumentation(unittest.TestCase):
+    def tearDown(self) -> None:
+        metrics.disable()
+
+    def test_disabled_pipeline_is_untouched(self) -> None:
+        registry = MetricsRegistry()
+        with metrics.instrument(registry=registry):
+            pass
+
+        assert not assembly.hooks
+        assert reactivex.of(1).pipe(ops.map(str)).run() == "1"
+        assert registry.snapshot() == {
+            "operators": [],
+            "latency": [],
+            "schedulers": [],
+        }
+
+    def test_instrument_counts_elements(self) -> None:
+        registry = MetricsRegistry()
+        with metrics.instrument("orders", registry):
+            xs = reactivex.of(1, 2, 3, 4).pipe(
+                ops.map(lambda x: x * 10),
+                ops.filter(lambda x: x > 20),
+            )
+
+        assert xs.pipe(ops.to_list()).run() == [30, 40]
+
+        stages = registry.snapshot()["operators"]
+        assert [(s["operator"], s["stage"], s["label"]) for s in stages] == [
+            ("map", 0, "orders"),
+            ("filter", 1, "orders"),
+        ]
+        assert [(s["elements_in"], s["elements_out"]) for s in stages] == [
+            (4, 4),
+            (4, 2),
+        ]
+        assert [s["completions"] for s in stages] == [1, 1]
+        assert [s["subscriptions"] for s in stages] == [0, 0]
+        assert [s["on_next_seconds"]["count"] for s in stages] == [4, 4]
+
+    def test_on_next_time_excludes_downstream_stages(self) -> None:
+        def fast(x: int) -> int:
+            return x
+
+        def slow(x: int) -> int:
+            time.sleep(0.005)
+            return x
+
+        registry = MetricsRegistry()
+        with metrics.instrument(registry=registry):
+            xs = reactivex.of(1, 2, 3, 4).pipe(ops.map(fast), ops.map(slow))
+
+        xs.pipe(ops.to_list()).run()
+        fast_stage, slow_stage = registry.operators
+        assert slow_stage.on_next.sum >= 0.02
+        assert fast_stage.on_next.sum < 0.01
+
+    def test_instrument_counts_errors(self) -> None:
+        registry = MetricsRegistry()
+        ex = Exception("ex")
+
+        def mapper(x: int) -> int:
+            raise ex
+
+        with metrics.instrument(registry=registry):
+            xs = reactivex.of(1).pipe(ops.map(mapper))
+
+        self.assertRaises(Exception, xs.run)
+        (stage,) = registry.operators
+        assert stage.errors == 1
+        assert stage.elements_out == 0
+
+    def test_instrument_live_subscriptions(self) -> None:
+        scheduler = TestScheduler()
+        registry = MetricsRegistry()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_completed(300))
+
+        with metrics.instrument(registry=registry):
+            ys = xs.pipe(ops.map(lambda x: x))
+
+        subscriptions = [ys.subscribe(), ys.subscribe()]
+        (stage,) = registry.operators
+        assert stage.subscriptions == 2
+
+        subscriptions[0].dispose()
+        assert stage.subscriptions == 1
+
+        scheduler.start()
+        assert stage.subscriptions == 0
+        assert stage.elements_in == 1
+
+    def test_instrument_nested_pipes_are_one_stage(self) -> None:
+        registry = MetricsRegistry()
+        with metrics.instrument(registry=registry):
+            xs = reactivex.of(1, 2, 3).pipe(ops.average())
+
+        assert xs.run() == 2
+        assert [s.operator for s in registry.operators] == ["average"]
+
+    def test_instrument_keeps_connectable(self) -> None:
+        registry = MetricsRegistry()
+        with metrics.instrument(registry=registry):
+            xs = reactivex.of(1, 2).pipe(ops.publish())
+
+        assert isinstance(xs, reactivex.ConnectableObservable)
+
+    def test_enable_disable(self) -> None:
+        registry = MetricsRegistry()
+        metrics.enable("global", registry)
+        reactivex.of(1).pipe(ops.map(lambda x: x))
+        metrics.disable()
+        reactivex.of(1).pipe(ops.filter(lambda x: True))
+
+        assert not assembly.hooks
+        assert [s.operator for s in registry.operators] == ["map"]
+
+    def test_to_prometheus(self) -> None:
+        registry = MetricsRegistry()
+        with metrics.instrument('a "b"', registry):
+            reactivex.of(1, 2).pipe(ops.map(lambda x: x)).run()
+
+        text = registry.to_prometheus()
+        labels = 'operator="map",stage="0",label="a \\"b\\""'
+        assert "# TYPE rx_operator_elements_in_total counter" in text
+        assert f"rx_operator_elements_in_total{{{labels}}} 2" in text
+        assert f"rx_operator_subscriptions{{{labels}}} 0" in text
+        assert f'rx_operator_on_next_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"rx_operator_on_next_seconds_count{{{labels}}} 2" in text
@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+import unittest
+from datetime import timedelta
+from typing import Any
+
+from reactivex import metrics
+from reactivex.disposable import SingleAssignmentDisposable
+from reactivex.metrics import MetricsRegistry, SchedulerStats
+from reactivex.scheduler import (
+    CurrentThreadScheduler,
+    EventLoopScheduler,
+    ThreadPoolScheduler,
+    TrampolineScheduler,
+)
+from reactivex.scheduler.eventloop import AsyncIOScheduler
+from reactivex.testing import TestScheduler
+
+
+class TestSchedulerStats(unittest.TestCase):
+    def test_stats_disabled_by_default(self) -> None:
+        scheduler = TestScheduler()
+
+        assert scheduler.stats is None
+        scheduler.schedule(lambda s, t: None)
+        scheduler.advance_to(1000)
+        assert scheduler.stats is None
+
+    def test_virtual_time_counts(self) -> None:
+        scheduler = TestScheduler()
+        stats = scheduler.enable_stats()
+        ran: list[int] = []
+
+        scheduler.schedule(lambda s, t: ran.append(1))
+        scheduler.schedule_absolute(100, lambda s, t: ran.append(2))
+        cancelled = scheduler.schedule_absolute(200, lambda s, t: ran.append(3))
+
+        assert (stats.scheduled, stats.queued, stats.ready) == (3, 3, 1)
+
+        cancelled.dispose()
+        assert stats.cancelled == 1
+        assert stats.queued == 3
+
+        scheduler.advance_to(1000)
+        assert ran == [1, 2]
+        assert (stats.executed, stats.discarded) == (2, 1)
+        assert (stats.queued, stats.ready, stats.cancelled) == (0, 0, 0)
+        assert stats.lag.count == 2
+
+    def test_disposable_is_single_assignment(self) -> None:
+        scheduler = TestScheduler()
+        plain = scheduler.schedule_absolute(100, lambda s, t: None)
+        scheduler.enable_stats()
+        tracked = scheduler.schedule_absolute(100, lambda s, t: None)
+
+        assert type(plain) is SingleAssignmentDisposable
+        assert isinstance(tracked, SingleAssignmentDisposable)
+
+    def test_trampoline_counts(self) -> None:
+        scheduler = TrampolineScheduler()
+        stats = scheduler.enable_stats()
+        disposables: list[Any] = []
+
+        def outer(scheduler_: Any, state: Any) -> None:
+            scheduler.schedule(lambda s, t: None)
+            disposables.append(scheduler.schedule(lambda s, t: None))
+            assert stats.queued == 3
+            assert stats.ready == 2
+            disposables[0].dispose()
+            assert stats.cancelled == 1
+
+        scheduler.schedule(outer)
+
+        assert (stats.scheduled, stats.executed, stats.discarded) == (3, 2, 1)
+        assert (stats.queued, stats.ready, stats.cancelled) == (0, 0, 0)
+
+    def test_current_thread_counts(self) -> None:
+        scheduler = CurrentThreadScheduler()
+        stats = scheduler.enable_stats()
+
+        scheduler.schedule(lambda s, t: None)
+        scheduler.schedule_relative(0.01, lambda s, t: None)
+
+        assert (stats.scheduled, stats.executed, stats.queued) == (2, 2, 0)
+        assert stats.lag.count == 2
+
+    def test_event_loop_lag_and_busy(self) -> None:
+        scheduler = EventLoopScheduler()
+        stats = scheduler.enable_stats()
+        gate = threading.Event()
+        done = threading.Event()
+
+        def block(scheduler_: Any, state: Any) -> None:
+            gate.wait()
+            time.sleep(0.05)
+
+        scheduler.schedule(block)
+        scheduler.schedule(lambda s, t: done.set())
+        cancelled = scheduler.schedule_relative(
+            timedelta(seconds=10), lambda s, t: None
+        )
+        cancelled.dispose()
+
+        assert stats.cancelled == 1
+        gate.set()
+        assert done.wait(5)
+        scheduler.dispose()
+
+        assert stats.executed == 2
+        assert stats.queued == 1
+        assert stats.cancelled == 1
+        assert stats.busy >= 0.05
+        assert stats.lag.max >= 0.05
+        assert 0.0 < stats.utilization <= 1.0
+
+    def test_thread_pool_shares_stats(self) -> None:
+        scheduler = ThreadPoolScheduler(2)
+        stats = scheduler.enable_stats()
+        done = threading.Semaphore(0)
+
+        for _ in range(4):
+            scheduler.schedule(lambda s, t: done.release())
+        for _ in range(4):
+            assert done.acquire(timeout=5)
+
+        deadline = time.monotonic() + 5
+        while stats.executed < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert (stats.scheduled, stats.executed, stats.queued) == (4, 4, 0)
+        scheduler.executor.shutdown()
+
+    def test_asyncio_counts(self) -> None:
+        stats_: list[SchedulerStats] = []
+
+        async def go() -> None:
+            scheduler = AsyncIOScheduler(asyncio.get_running_loop())
+            stats = scheduler.enable_stats()
+            stats_.append(stats)
+            done = asyncio.Event()
+
+            scheduler.schedule(lambda s, t: None)
+            scheduler.schedule_relative(0.01, lambda s, t: done.set())
+            cancelled = scheduler.schedule_relative(10, lambda s, t: None)
+            assert (stats.queued, stats.ready) == (3, 1)
+
+            cancelled.dispose()
+            assert stats.queued == 2
+            await asyncio.wait_for(done.wait(), 5)
+
+        asyncio.run(go())
+        stats = stats_[0]
+        assert (stats.scheduled, stats.executed, stats.discarded) == (3, 2, 1)
+        assert (stats.queued, stats.ready, stats.cancelled) == (0, 0, 0)
+        assert stats.lag.count == 2
+
+    def test_registry_export(self) -> None:
+        registry = MetricsRegistry()
+        scheduler = TestScheduler()
+        stats = scheduler.enable_stats()
+        registry.add_scheduler("test", stats)
+
+        scheduler.schedule(lambda s, t: None)
+        scheduler.advance_to(1000)
+
+        (entry,) = registry.snapshot()["schedulers"]
+        assert entry["label"] == "test"
+        assert (entry["scheduled"], entry["executed"], entry["queued"]) == (1, 1, 0)
+        assert entry["lag_seconds"]["count"] == 1
+
+        text = registry.to_prometheus()
+        assert 'rx_scheduler_executed_total{label="test"} 1' in text
+        assert 'rx_scheduler_queued{label="test"} 0' in text
+        assert 'rx_scheduler_lag_seconds_count{label="test"} 1' in text
+
+    def test_enable_stats_with_label(self) -> None:
+        scheduler = TestScheduler()
+        stats = scheduler.enable_stats("virtual")
+
+        try:
+            assert ("virtual", stats) in metrics.registry.schedulers
+            assert scheduler.enable_stats() is stats
+        finally:
+            metrics.reset()
+
+        scheduler.disable_stats()
+        assert scheduler.stats is None
@@ -0,0 +1,179 @@
+import threading
+import unittest
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.scheduler import HistoricalScheduler
+from reactivex.subject import Subject
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestAggregateByKey(unittest.TestCase):
+    def test_aggregate_by_key_on_complete(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1),
+            on_next(210, 2),
+            on_next(220, 3),
+            on_next(230, 4),
+            on_next(240, 5),
+            on_completed(250),
+        )
+
+        def create():
+            return xs.pipe(
+                ops.aggregate_by_key(lambda x: x % 2, 0, lambda acc, x: acc + x)
+            )
+
+        results = scheduler.start(create=create)
+        assert results.messages == [
+            on_next(250, {0: 6, 1: 8}),
+            on_completed(250),
+        ]
+        assert xs.subscriptions == [subscribe(200, 250)]
+
+    def test_aggregate_by_key_every_update(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a"),
+            on_next(220, "b"),
+            on_next(230, "a"),
+            on_completed(250),
+        )
+
+        def create():
+            return xs.pipe(
+                ops.aggregate_by_key(
+                    lambda x: x, 0, lambda acc, x: acc + 1, emit="every_update"
+                )
+            )
+
+        results = scheduler.start(create=create)
+        assert results.messages == [
+            on_next(210, ("a", 1)),
+            on_next(220, ("b", 1)),
+            on_next(230, ("a", 2)),
+            on_completed(250),
+        ]
+
+    def test_aggregate_by_key_on_interval(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a"),
+            on_next(220, "b"),
+            on_next(230, "a"),
+            on_next(280, "b"),
+            on_next(330, "c"),
+            on_completed(350),
+        )
+
+        def create():
+            return xs.pipe(
+                ops.aggregate_by_key(
+                    lambda x: x,
+                    0,
+                    lambda acc, x: acc + 1,
+                    emit="on_interval",
+                    interval=50,
+                )
+            )
+
+        results = scheduler.start(create=create)
+        assert results.messages == [
+            on_next(250, {"a": 2, "b": 1}),
+            on_next(300, {"b": 2}),
+            on_next(350, {"c": 1}),
+            on_completed(350),
+        ]
+
+    def test_aggregate_by_key_key_mapper_throws(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_completed(250),
+        )
+
+        def key_mapper(x):
+            if x == 2:
+                raise Exception(ex)
+            return x
+
+        def create():
+            return xs.pipe(ops.aggregate_by_key(key_mapper, 0, lambda acc, x: acc + x))
+
+        results = scheduler.start(create=create)
+        assert results.messages == [on_error(220, ex)]
+        assert xs.subscriptions == [subscribe(200, 220)]
+
+    def test_aggregate_by_key_error(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_error(220, ex),
+        )
+
+        def create():
+            return xs.pipe(ops.aggregate_by_key(lambda x: x, 0, lambda acc, x: acc + x))
+
+        results = scheduler.start(create=create)
+        assert results.messages == [on_error(220, ex)]
+
+    def test_aggregate_by_key_tick_racing_completion(self):
+        scheduler = HistoricalScheduler()
+        xs: Subject[str] = Subject()
+        entered = threading.Event()
+        release = threading.Event()
+        log: list[object] = []
+
+        def on_next(delta: object) -> None:
+            entered.set()
+            release.wait(1)
+            log.append(delta)
+
+        xs.pipe(
+            ops.aggregate_by_key(
+                lambda x: x,
+                0,
+                lambda acc, x: acc + 1,
+                emit="on_interval",
+                interval=1.0,
+                scheduler=scheduler,
+            )
+        ).subscribe(on_next, on_completed=lambda: log.append("completed"))
+        xs.on_next("a")
+
+        tick = threading.Thread(target=scheduler.advance_by, args=(1.0,))
+        tick.start()
+        assert entered.wait(1)
+        completion = threading.Thread(target=xs.on_completed)
+        completion.start()
+        completion.join(0.1)
+        release.set()
+        tick.join()
+        completion.join()
+
+        assert log == [{"a": 1}, "completed"]
+        scheduler.advance_by(1.0)
+        assert log == [{"a": 1}, "completed"]
+
+    def test_aggregate_by_key_invalid_emit(self):
+        with self.assertRaises(ValueError):
+            reactivex.empty().pipe(
+                ops.aggregate_by_key(lambda x: x, 0, lambda acc, x: acc, "never")
+            )
+
+        with self.assertRaises(ValueError):
+            reactivex.empty().pipe(
+                ops.aggregate_by_key(lambda x: x, 0, lambda acc, x: acc, "on_interval")
+            )
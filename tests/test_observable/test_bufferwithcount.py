@@ -1,6 +1,7 @@
 import unittest
 from typing import NoReturn
 
+import reactivex
 from reactivex import operators as ops
 from reactivex.testing import ReactiveTest, TestScheduler
 
@@ -215,3 +216,122 @@ class TestBufferWithCount(unittest.TestCase):
         assert sequence_equal(results[0].value.value, [2, 3]) and results[0].time == 220
         assert sequence_equal(results[1].value.value, [5]) and results[1].time == 250
         assert results[2].value.kind == "C" and results[2].time == 250
+
+    def test_buffer_count_buffers_are_independent(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_completed(250),
+        )
+
+        def create():
+            return xs.pipe(ops.buffer_with_count(2))
+
+        results = scheduler.start(create).messages
+        assert results[0].value.value == [1, 2]
+        assert results[1].value.value == [3, 4]
+        assert results[0].value.value is not results[1].value.value
+
+    def test_buffer_count_invalid_arguments(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_completed(250))
+
+        with self.assertRaises(ValueError):
+            xs.pipe(ops.buffer_with_count(0))
+
+        with self.assertRaises(ValueError):
+            xs.pipe(ops.buffer_with_count(2, 0))
+
+    def test_buffer_count_view_skip_less(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1),
+            on_next(210, 2),
+            on_next(220, 3),
+            on_next(230, 4),
+            on_next(240, 5),
+            on_completed(250),
+        )
+
+        def create():
+            return xs.pipe(ops.buffer_with_count(3, 1, view=True))
+
+        results = scheduler.start(create).messages
+        assert [(r.time, r.value.value.copy()) for r in results[:-1]] == [
+            (230, [2, 3, 4]),
+            (240, [3, 4, 5]),
+            (250, [4, 5]),
+            (250, [5]),
+        ]
+        assert results[-1].value.kind == "C" and results[-1].time == 250
+
+    def test_buffer_count_view_skip_more(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1),
+            on_next(210, 2),
+            on_next(220, 3),
+            on_next(230, 4),
+            on_next(240, 5),
+            on_completed(250),
+        )
+
+        def create():
+            return xs.pipe(ops.buffer_with_count(2, 3, view=True))
+
+        results = scheduler.start(create).messages
+        assert [(r.time, list(r.value.value)) for r in results[:-1]] == [
+            (220, [2, 3]),
+            (250, [5]),
+        ]
+
+    def test_buffer_count_view_matches_lists(self):
+        for count, skip in [(1, 1), (3, 1), (5, 2), (4, 4), (2, 5), (7, 3)]:
+            lists = []
+            views = []
+            reactivex.from_(range(100)).pipe(
+                ops.buffer_with_count(count, skip)
+            ).subscribe(lists.append)
+            reactivex.from_(range(100)).pipe(
+                ops.buffer_with_count(count, skip, view=True)
+            ).subscribe(views.append)
+
+            assert [v.copy() for v in views] == lists
+            assert views == lists
+
+    def test_buffer_count_view_sequence(self):
+        views = []
+        reactivex.from_(range(10)).pipe(
+            ops.buffer_with_count(4, 1, view=True)
+        ).subscribe(views.append)
+
+        view = views[2]
+        assert isinstance(view, ops.BufferView)
+        assert len(view) == 4
+        assert view[0] == 2
+        assert view[-1] == 5
+        assert list(view[1:3]) == [3, 4]
+        assert 4 in view
+        assert view.index(5) == 3
+        with self.assertRaises(IndexError):
+            view[4]
+        with self.assertRaises(TypeError):
+            hash(view)
+
+    def test_buffer_count_view_equality(self):
+        views = []
+        reactivex.from_("abcdef").pipe(
+            ops.buffer_with_count(2, 1, view=True)
+        ).subscribe(views.append)
+
+        view = views[3]
+        assert view == ["d", "e"]
+        assert ["d", "e"] == view
+        assert view == views[3][:]
+        assert view != ("d", "e")
+        assert view != "de"
+        assert list(view) == ["d", "e"]
+        assert list(view[1:]) == ["e"]
@@ -0,0 +1,262 @@
+import threading
+import unittest
+
+from reactivex import operators as ops
+from reactivex.scheduler import HistoricalScheduler
+from reactivex.subject import Subject
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+def key(x):
+    return x[0]
+
+
+class TestDebounceByKey(unittest.TestCase):
+    def test_debounce_by_key(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_next(220, "b1"),
+            on_next(230, "a2"),
+            on_next(250, "b2"),
+            on_next(300, "a3"),
+            on_completed(400),
+        )
+
+        def create():
+            return xs.pipe(ops.debounce_by_key(key, 30))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(260, "a2"),
+            on_next(280, "b2"),
+            on_next(330, "a3"),
+            on_completed(400),
+        ]
+        assert xs.subscriptions == [subscribe(200, 400)]
+
+    def test_debounce_by_key_flushes_on_completed(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_next(220, "b1"),
+            on_completed(230),
+        )
+
+        def create():
+            return xs.pipe(ops.debounce_by_key(key, 100))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(230, "a1"),
+            on_next(230, "b1"),
+            on_completed(230),
+        ]
+
+    def test_debounce_by_key_max_keys(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_next(220, "b1"),
+            on_next(230, "c1"),
+            on_completed(400),
+        )
+
+        def create():
+            return xs.pipe(ops.debounce_by_key(key, 50, max_keys=2))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(230, "a1"),
+            on_next(270, "b1"),
+            on_next(280, "c1"),
+            on_completed(400),
+        ]
+
+    def test_debounce_by_key_error(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_error(220, ex),
+        )
+
+        def create():
+            return xs.pipe(ops.debounce_by_key(key, 50))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_error(220, ex)]
+
+    def test_debounce_by_key_single_timer(self):
+        scheduler = TestScheduler()
+        timers = [0]
+        schedule_relative = scheduler.schedule_relative
+
+        def counting_schedule_relative(duetime, action, state=None):
+            timers[0] += 1
+            return schedule_relative(duetime, action, state)
+
+        scheduler.schedule_relative = counting_schedule_relative
+        xs = scheduler.create_hot_observable(
+            *[on_next(201 + i, (i % 10, i)) for i in range(100)], on_completed(500)
+        )
+
+        def create():
+            return xs.pipe(ops.debounce_by_key(key, 20), ops.map(lambda x: x[1]))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            *[on_next(311 + i, 90 + i) for i in range(10)],
+            on_completed(500),
+        ]
+        assert timers[0] <= 20
+
+
+class TestThrottleFirstByKey(unittest.TestCase):
+    def test_throttle_first_by_key(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_next(220, "b1"),
+            on_next(230, "a2"),
+            on_next(250, "b2"),
+            on_next(260, "a3"),
+            on_completed(300),
+        )
+
+        def create():
+            return xs.pipe(ops.throttle_first_by_key(key, 30))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, "a1"),
+            on_next(220, "b1"),
+            on_next(250, "b2"),
+            on_next(260, "a3"),
+            on_completed(300),
+        ]
+
+    def test_throttle_first_by_key_max_keys(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_next(220, "b1"),
+            on_next(230, "a2"),
+            on_completed(300),
+        )
+
+        def create():
+            return xs.pipe(ops.throttle_first_by_key(key, 100, max_keys=1))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, "a1"),
+            on_next(220, "b1"),
+            on_next(230, "a2"),
+            on_completed(300),
+        ]
+
+    def test_throttle_first_by_key_key_mapper_throws(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_next(220, None),
+            on_completed(300),
+        )
+
+        def mapper(x):
+            if x is None:
+                raise Exception(ex)
+            return x[0]
+
+        def create():
+            return xs.pipe(ops.throttle_first_by_key(mapper, 100))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(210, "a1"), on_error(220, ex)]
+
+
+class TestSampleByKey(unittest.TestCase):
+    def test_sample_by_key(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_next(220, "b1"),
+            on_next(230, "a2"),
+            on_next(260, "b2"),
+            on_next(320, "a3"),
+            on_completed(330),
+        )
+
+        def create():
+            return xs.pipe(ops.sample_by_key(key, 50))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(250, "b1"),
+            on_next(250, "a2"),
+            on_next(300, "b2"),
+            on_next(330, "a3"),
+            on_completed(330),
+        ]
+
+    def test_sample_by_key_tick_racing_completion(self):
+        scheduler = HistoricalScheduler()
+        xs: Subject[str] = Subject()
+        entered = threading.Event()
+        release = threading.Event()
+        log: list[str] = []
+
+        def on_next(value: str) -> None:
+            if value == "a1":
+                entered.set()
+                release.wait(1)
+            log.append(value)
+
+        xs.pipe(ops.sample_by_key(key, 1.0, scheduler=scheduler)).subscribe(
+            on_next, on_completed=lambda: log.append("completed")
+        )
+        xs.on_next("a1")
+        xs.on_next("b1")
+
+        tick = threading.Thread(target=scheduler.advance_by, args=(1.0,))
+        tick.start()
+        assert entered.wait(1)
+        completion = threading.Thread(target=xs.on_completed)
+        completion.start()
+        completion.join(0.1)
+        release.set()
+        tick.join()
+        completion.join()
+
+        assert log == ["a1", "b1", "completed"]
+
+    def test_sample_by_key_max_keys(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a1"),
+            on_next(220, "b1"),
+            on_next(230, "a2"),
+            on_next(240, "c1"),
+            on_completed(300),
+        )
+
+        def create():
+            return xs.pipe(ops.sample_by_key(key, 50, max_keys=2))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(240, "b1"),
+            on_next(250, "a2"),
+            on_next(250, "c1"),
+            on_completed(300),
+        ]
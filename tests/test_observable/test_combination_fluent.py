@@ -219,3 +219,25 @@ class TestGroupJoinMethodChaining:
         pipe_result.subscribe(on_next=lambda x: subscribe_to_group(x, pipe_count))
 
         assert fluent_count == pipe_count
+
+
+class TestCombineLatestKeyedMethodChaining:
+    """Tests for combine_latest_keyed() method."""
+
+    def test_combine_latest_keyed_equivalence(self) -> None:
+        """Verify combine_latest_keyed fluent and functional styles are equivalent."""
+        source: Observable[tuple[str, Observable[int] | None]] = rx.of(
+            ("a", rx.of(1)), ("b", rx.of(2))
+        )
+
+        fluent_result = source.combine_latest_keyed()
+        pipe_result = source.pipe(ops.combine_latest_keyed())
+
+        fluent_values: list[dict[str, int]] = []
+        pipe_values: list[dict[str, int]] = []
+
+        fluent_result.subscribe(on_next=lambda x: fluent_values.append(dict(x)))
+        pipe_result.subscribe(on_next=lambda x: pipe_values.append(dict(x)))
+
+        assert fluent_values == pipe_values
+        assert fluent_values[-1] == {"a": 1, "b": 2}
@@ -0,0 +1,204 @@
+import unittest
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestCombineLatestKeyed(unittest.TestCase):
+    def test_combine_latest_keyed_snapshot(self):
+        scheduler = TestScheduler()
+        a = scheduler.create_hot_observable(
+            on_next(220, 1), on_next(240, 2), on_completed(300)
+        )
+        b = scheduler.create_hot_observable(on_next(230, 10), on_completed(300))
+        xs = scheduler.create_hot_observable(
+            on_next(210, ("a", a)),
+            on_next(215, ("b", b)),
+            on_next(250, ("a", None)),
+            on_completed(260),
+        )
+
+        def create():
+            # Snapshots are not ordered, so they are sorted for the
+            # recorded messages, which compare by representation
+            return xs.pipe(
+                ops.combine_latest_keyed(), ops.map(lambda s: dict(sorted(s.items())))
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(230, {"a": 1, "b": 10}),
+            on_next(240, {"a": 2, "b": 10}),
+            on_next(250, {"b": 10}),
+            on_completed(300),
+        ]
+        assert a.subscriptions == [subscribe(210, 250)]
+        assert b.subscriptions == [subscribe(215, 300)]
+
+    def test_combine_latest_keyed_snapshot_is_immutable(self):
+        subject = reactivex.subject.Subject()
+        snapshots = []
+        subject.pipe(ops.combine_latest_keyed()).subscribe(snapshots.append)
+        subject.on_next(("a", reactivex.of(1, 2)))
+
+        assert [dict(s) for s in snapshots] == [{"a": 1}, {"a": 2}]
+        with self.assertRaises(TypeError):
+            snapshots[0]["a"] = 3
+
+    def test_combine_latest_keyed_snapshots_are_independent(self):
+        subject = reactivex.subject.Subject()
+        snapshots = []
+        lookups = []
+
+        def on_next(snapshot):
+            snapshots.append(snapshot)
+            lookups.append({k: snapshot[k] for k in range(7) if k in snapshot})
+
+        subject.pipe(ops.combine_latest_keyed()).subscribe(on_next)
+        for key in range(100):
+            subject.on_next((key % 7, reactivex.of(key)))
+        subject.on_next((3, None))
+
+        assert [dict(s) for s in snapshots] == lookups
+        assert lookups[-1] == {k % 7: k for k in range(93, 100) if k != 94}
+
+    def test_combine_latest_keyed_snapshots_match_dicts(self):
+        class Colliding:
+            def __init__(self, value):
+                self.value = value
+
+            def __hash__(self):
+                return self.value % 3
+
+            def __eq__(self, other):
+                return isinstance(other, Colliding) and other.value == self.value
+
+        keys = [*range(-500, 1500), *(Colliding(i) for i in range(10))]
+        subject = reactivex.subject.Subject()
+        snapshots = []
+        subject.pipe(ops.combine_latest_keyed()).subscribe(snapshots.append)
+
+        expected = {}
+        models = []
+        for i, key in enumerate(keys):
+            subject.on_next((key, reactivex.of(i)))
+            expected[key] = i
+            models.append(dict(expected))
+        for key in keys[::3]:
+            subject.on_next((key, None))
+            del expected[key]
+            models.append(dict(expected))
+
+        for snapshot, model in list(zip(snapshots, models))[::97]:
+            assert len(snapshot) == len(model)
+            assert dict(snapshot) == model
+            assert all(snapshot[key] == model[key] for key in model)
+        assert dict(snapshots[-1]) == expected
+        for key in [*keys[-10:], 1500]:
+            assert (key in snapshots[-1]) == (key in expected)
+
+    def test_combine_latest_keyed_delta(self):
+        scheduler = TestScheduler()
+        a = scheduler.create_hot_observable(
+            on_next(220, 1), on_next(240, 2), on_completed(300)
+        )
+        b = scheduler.create_hot_observable(on_next(230, 10), on_completed(300))
+        xs = scheduler.create_hot_observable(
+            on_next(210, ("a", a)),
+            on_next(215, ("b", b)),
+            on_next(250, ("a", None)),
+            on_completed(260),
+        )
+
+        def create():
+            return xs.pipe(ops.combine_latest_keyed(emit="delta"))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(230, {"a": 1, "b": 10}),
+            on_next(240, {"a": 2}),
+            on_next(250, {"a": ops.REMOVED}),
+            on_completed(300),
+        ]
+
+    def test_combine_latest_keyed_removed_sentinel(self):
+        subject = reactivex.subject.Subject()
+        deltas = []
+        subject.pipe(ops.combine_latest_keyed(emit="delta")).subscribe(deltas.append)
+        subject.on_next(("a", reactivex.of(None)))
+        subject.on_next(("a", None))
+
+        assert deltas == [{"a": None}, {"a": ops.REMOVED}]
+        assert deltas[1]["a"] is ops.REMOVED
+        assert repr(ops.REMOVED) == "REMOVED"
+        assert "REMOVED" in ops.__all__
+
+    def test_combine_latest_keyed_remove_missing_key_emits(self):
+        scheduler = TestScheduler()
+        a = scheduler.create_hot_observable(on_next(220, 1))
+        xs = scheduler.create_hot_observable(
+            on_next(210, ("a", a)),
+            on_next(215, ("b", reactivex.never())),
+            on_next(230, ("b", None)),
+        )
+
+        def create():
+            return xs.pipe(ops.combine_latest_keyed(), ops.map(dict))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(230, {"a": 1})]
+
+    def test_combine_latest_keyed_replace_key(self):
+        scheduler = TestScheduler()
+        a1 = scheduler.create_hot_observable(on_next(220, 1), on_next(240, 2))
+        a2 = scheduler.create_hot_observable(on_next(250, 3))
+        xs = scheduler.create_hot_observable(
+            on_next(210, ("a", a1)),
+            on_next(230, ("a", a2)),
+        )
+
+        def create():
+            return xs.pipe(ops.combine_latest_keyed(emit="delta"))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(220, {"a": 1}),
+            on_next(230, {"a": ops.REMOVED}),
+            on_next(250, {"a": 3}),
+        ]
+        assert a1.subscriptions == [subscribe(210, 230)]
+
+    def test_combine_latest_keyed_inner_error(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        a = scheduler.create_hot_observable(on_next(220, 1), on_error(230, ex))
+        xs = scheduler.create_hot_observable(on_next(210, ("a", a)))
+
+        def create():
+            return xs.pipe(ops.combine_latest_keyed(), ops.map(dict))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(220, {"a": 1}), on_error(230, ex)]
+        assert xs.subscriptions == [subscribe(200, 230)]
+
+    def test_combine_latest_keyed_many_keys(self):
+        subject = reactivex.subject.Subject()
+        deltas = []
+        subject.pipe(ops.combine_latest_keyed(emit="delta")).subscribe(deltas.append)
+        for i in range(1000):
+            subject.on_next((i, reactivex.of(i)))
+
+        assert deltas == [{i: i} for i in range(1000)]
+
+    def test_combine_latest_keyed_invalid_emit(self):
+        with self.assertRaises(ValueError):
+            reactivex.never().pipe(ops.combine_latest_keyed(emit="bogus"))  # type: ignore
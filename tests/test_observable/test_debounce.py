@@ -443,3 +443,25 @@ class TestDebounce(unittest.TestCase):
             on_completed(550),
         ]
         assert xs.subscriptions == [subscribe(200, 550)]
+
+    def test_debounce_reuses_timer(self):
+        scheduler = TestScheduler()
+        timers = [0]
+        schedule_relative = scheduler.schedule_relative
+
+        def counting_schedule_relative(duetime, action, state=None):
+            timers[0] += 1
+            return schedule_relative(duetime, action, state)
+
+        scheduler.schedule_relative = counting_schedule_relative
+        xs = scheduler.create_hot_observable(
+            *[on_next(201 + i, i) for i in range(100)], on_completed(500)
+        )
+
+        def create():
+            return xs.pipe(_.debounce(20))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [on_next(320, 99), on_completed(500)]
+        assert timers[0] <= 10
@@ -288,3 +288,31 @@ class TestDelay(unittest.TestCase):
 
         assert results.messages == []
         assert xs.subscriptions == [subscribe(200, 1000)]
+
+    def test_delay_reuses_timer(self):
+        scheduler = TestScheduler()
+        timers = [0]
+        schedule_relative = scheduler.schedule_relative
+
+        def counting_schedule_relative(duetime, action, state=None):
+            timers[0] += 1
+            return schedule_relative(duetime, action, state)
+
+        scheduler.schedule_relative = counting_schedule_relative
+        xs = scheduler.create_hot_observable(
+            *[on_next(210, i) for i in range(50)],
+            *[on_next(220, i) for i in range(50, 100)],
+            on_completed(300),
+        )
+
+        def create():
+            return xs.pipe(delay(50))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [
+            *[on_next(260, i) for i in range(50)],
+            *[on_next(270, i) for i in range(50, 100)],
+            on_completed(350),
+        ]
+        assert timers[0] == 3
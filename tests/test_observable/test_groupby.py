@@ -1,7 +1,9 @@
+import threading
 import unittest
 
 import reactivex
 from reactivex import operators as ops
+from reactivex.subject import Subject
 from reactivex.testing import ReactiveTest, TestScheduler
 
 on_next = ReactiveTest.on_next
@@ -677,6 +679,110 @@ class TestGroupBy(unittest.TestCase):
             on_completed(1000),
         ]
 
+    def test_group_by_max_groups_evicts_least_recently_used(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a"),
+            on_next(220, "b"),
+            on_next(230, "a"),
+            on_next(240, "c"),
+            on_next(250, "b"),
+            on_completed(300),
+        )
+        counters = ops.GroupByCounters()
+        results = {}
+
+        def factory():
+            def on_group(group):
+                results.setdefault(group.key, []).append(scheduler.create_observer())
+                group.subscribe(results[group.key][-1], scheduler=scheduler)
+                return group.key
+
+            return xs.pipe(
+                ops.group_by(lambda x: x, max_groups=2, counters=counters),
+                ops.map(on_group),
+            )
+
+        res = scheduler.start(factory)
+        assert res.messages == [
+            on_next(210, "a"),
+            on_next(220, "b"),
+            on_next(240, "c"),
+            on_next(250, "b"),
+            on_completed(300),
+        ]
+        assert results["a"][0].messages == [
+            on_next(210, "a"),
+            on_next(230, "a"),
+            on_completed(250),
+        ]
+        assert [r.messages for r in results["b"]] == [
+            [on_next(220, "b"), on_completed(240)],
+            [on_next(250, "b"), on_completed(300)],
+        ]
+        assert results["c"][0].messages == [on_next(240, "c"), on_completed(300)]
+        assert counters.evicted == 2
+        assert counters.active == 0
+
+    def test_group_by_idle_timeout(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a"),
+            on_next(220, "b"),
+            on_next(250, "a"),
+            on_next(400, "b"),
+            on_completed(500),
+        )
+        counters = ops.GroupByCounters()
+        results = {}
+
+        def factory():
+            def on_group(group):
+                results.setdefault(group.key, []).append(scheduler.create_observer())
+                group.subscribe(results[group.key][-1], scheduler=scheduler)
+                return group.key
+
+            return xs.pipe(
+                ops.group_by(lambda x: x, idle_timeout=100, counters=counters),
+                ops.map(on_group),
+            )
+
+        res = scheduler.start(factory)
+        assert res.messages == [
+            on_next(210, "a"),
+            on_next(220, "b"),
+            on_next(400, "b"),
+            on_completed(500),
+        ]
+        assert results["a"][0].messages == [
+            on_next(210, "a"),
+            on_next(250, "a"),
+            on_completed(350),
+        ]
+        assert [r.messages for r in results["b"]] == [
+            [on_next(220, "b"), on_completed(320)],
+            [on_next(400, "b"), on_completed(500)],
+        ]
+        assert counters.evicted == 2
+        assert counters.active == 0
+
+    def test_group_by_idle_timeout_emits_groups_outside_lock(self):
+        # The group handler blocks until the idle timer has completed the
+        # group, which deadlocks if the group is emitted under the lock.
+        xs = Subject()
+        completed = threading.Event()
+
+        def on_group(group):
+            group.subscribe(on_completed=completed.set)
+            assert completed.wait(5)
+
+        xs.group_by(lambda x: x, idle_timeout=0.01).subscribe(on_group)
+        xs.on_next("a")
+
+    def test_group_by_max_groups_invalid(self):
+        with self.assertRaises(ValueError):
+            ops.group_by(lambda x: x, max_groups=0)(reactivex.empty())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,198 @@
+import asyncio
+import threading
+import time
+import unittest
+from typing import Any
+from unittest import mock
+
+import reactivex
+from reactivex import metrics
+from reactivex import operators as ops
+from reactivex.internal import latency
+from reactivex.metrics import Histogram
+from reactivex.scheduler import EventLoopScheduler
+from reactivex.scheduler.eventloop import AsyncIOScheduler
+from reactivex.subject import Subject
+from reactivex.testing import TestScheduler
+
+
+def run_until_done(xs: reactivex.Observable[Any], timeout: float = 5.0) -> list[Any]:
+    values: list[Any] = []
+    done = threading.Event()
+    xs.subscribe(values.append, lambda e: done.set(), done.set)
+    assert done.wait(timeout)
+    return values
+
+
+class TestLatency(unittest.TestCase):
+    def tearDown(self) -> None:
+        assert latency.active == 0
+        assert latency.current.stamp is None
+
+    def test_latency_synchronous(self) -> None:
+        histogram = Histogram()
+        xs = reactivex.of(1, 2, 3).pipe(
+            ops.stamp_latency(),
+            ops.map(lambda x: x * 10),
+            ops.measure_latency(histogram),
+        )
+
+        assert run_until_done(xs) == [10, 20, 30]
+        assert histogram.count == 3
+
+    def test_latency_unstamped_not_recorded(self) -> None:
+        histogram = Histogram()
+        xs = reactivex.of(1, 2, 3).pipe(ops.measure_latency(histogram))
+
+        assert run_until_done(xs) == [1, 2, 3]
+        assert histogram.count == 0
+
+    def test_latency_dispose_releases(self) -> None:
+        subject: Subject[int] = Subject()
+        subscription = subject.pipe(ops.stamp_latency()).subscribe()
+        assert latency.active == 1
+
+        subscription.dispose()
+        assert latency.active == 0
+
+    def test_latency_across_observe_on(self) -> None:
+        histogram = Histogram()
+        scheduler = EventLoopScheduler()
+        try:
+            xs = reactivex.of(1, 2).pipe(
+                ops.stamp_latency(),
+                ops.observe_on(scheduler),
+                ops.do_action(lambda _: time.sleep(0.02)),
+                ops.measure_latency(histogram),
+            )
+            assert run_until_done(xs) == [1, 2]
+        finally:
+            scheduler.dispose()
+
+        assert histogram.count == 2
+        assert histogram.max >= 0.02
+
+    def test_latency_across_delay(self) -> None:
+        histogram = Histogram()
+        xs = reactivex.of(1, 2, 3).pipe(
+            ops.stamp_latency(),
+            ops.delay(0.05),
+            ops.measure_latency(histogram),
+        )
+
+        assert run_until_done(xs) == [1, 2, 3]
+        assert histogram.count == 3
+        assert histogram.sum >= 3 * 0.05
+
+    def test_latency_across_buffer_with_time(self) -> None:
+        histogram = Histogram()
+        subject: Subject[int] = Subject()
+        xs = subject.pipe(
+            ops.stamp_latency(),
+            ops.buffer_with_time(0.05),
+            ops.take(1),
+            ops.measure_latency(histogram),
+        )
+        done = threading.Event()
+        values: list[list[int]] = []
+        xs.subscribe(values.append, on_completed=done.set)
+
+        subject.on_next(1)
+        subject.on_next(2)
+        assert done.wait(5.0)
+
+        assert values == [[1, 2]]
+        assert histogram.count == 1
+        assert histogram.max >= 0.04
+        subject.on_completed()
+
+    def test_latency_across_buffer_with_time_or_count(self) -> None:
+        histogram = Histogram()
+        xs = reactivex.of(1, 2, 3).pipe(
+            ops.stamp_latency(),
+            ops.buffer_with_time_or_count(5.0, 2),
+            ops.measure_latency(histogram),
+        )
+
+        assert run_until_done(xs) == [[1, 2], [3]]
+        assert histogram.count == 2
+
+    def test_latency_not_carried_until_enabled(self) -> None:
+        enabled = latency.enabled
+        latency.enabled = False
+        try:
+            with mock.patch.object(
+                latency, "emit", side_effect=AssertionError("stamp carried")
+            ):
+                scheduler = TestScheduler()
+                values: list[Any] = []
+                reactivex.merge(
+                    reactivex.of(1, 2).pipe(ops.delay(1.0, scheduler)),
+                    reactivex.of(3).pipe(ops.buffer_with_time(2.0, 1.0, scheduler)),
+                    reactivex.of(4).pipe(
+                        ops.buffer_with_time_or_count(1.0, 2, scheduler)
+                    ),
+                ).subscribe(values.append)
+                scheduler.advance_by(5.0)
+
+            assert values == [[3], [4], 1, 2]
+        finally:
+            latency.enabled = enabled
+
+    def test_latency_across_merge(self) -> None:
+        histogram = Histogram()
+        subjects: list[Subject[int]] = [Subject() for _ in range(4)]
+        xs = reactivex.merge(
+            *(subject.pipe(ops.stamp_latency()) for subject in subjects)
+        ).pipe(ops.measure_latency(histogram))
+        values: list[int] = []
+        xs.subscribe(values.append)
+
+        def produce(subject: Subject[int]) -> None:
+            for i in range(1000):
+                subject.on_next(i)
+            subject.on_completed()
+
+        threads = [threading.Thread(target=produce, args=(s,)) for s in subjects]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(values) == 4000
+        assert histogram.count == 4000
+
+    def test_latency_across_asyncio(self) -> None:
+        histogram = Histogram()
+        loop = asyncio.new_event_loop()
+
+        async def go() -> list[int]:
+            future: asyncio.Future[list[int]] = loop.create_future()
+            xs = reactivex.of(1, 2, 3).pipe(
+                ops.stamp_latency(),
+                ops.observe_on(AsyncIOScheduler(loop)),
+                ops.measure_latency(histogram),
+                ops.to_list(),
+            )
+            xs.subscribe(future.set_result)
+            return await future
+
+        try:
+            assert loop.run_until_complete(go()) == [1, 2, 3]
+        finally:
+            loop.close()
+        assert histogram.count == 3
+
+    def test_latency_label_in_registry(self) -> None:
+        registry = metrics.registry
+        registry.reset()
+        xs = reactivex.of(1, 2).pipe(
+            ops.stamp_latency(), ops.measure_latency(label="orders")
+        )
+        run_until_done(xs)
+
+        (entry,) = registry.snapshot()["latency"]
+        assert entry["label"] == "orders"
+        assert entry["count"] == 2
+        assert 'rx_latency_seconds_count{label="orders"} 2' in registry.to_prometheus()
+        registry.reset()
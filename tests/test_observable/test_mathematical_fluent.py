@@ -8,6 +8,7 @@ pipe-based functional syntax.
 import reactivex as rx
 from reactivex import Observable
 from reactivex import operators as ops
+from reactivex.testing import ReactiveTest, TestScheduler
 
 
 class TestCountMethodChaining:
@@ -181,3 +182,92 @@ class TestComplexMathematicalChaining:
         result.subscribe(on_next=values.append)
 
         assert values == [8.0]
+
+
+class TestAggregateByKeyMethodChaining:
+    """Tests for aggregate_by_key() method."""
+
+    def test_aggregate_by_key_equivalence(self) -> None:
+        """Verify aggregate_by_key fluent and functional styles are equivalent."""
+        source: Observable[int] = rx.of(1, 2, 3, 4, 5)
+
+        fluent_result = source.aggregate_by_key(
+            lambda x: x % 2, 0, lambda acc, x: acc + x
+        )
+        pipe_result = source.pipe(
+            ops.aggregate_by_key(lambda x: x % 2, 0, lambda acc, x: acc + x)
+        )
+
+        fluent_values: list[dict[int, int]] = []
+        pipe_values: list[dict[int, int]] = []
+
+        fluent_result.subscribe(on_next=fluent_values.append)
+        pipe_result.subscribe(on_next=pipe_values.append)
+
+        assert fluent_values == pipe_values == [{1: 9, 0: 6}]
+
+    def test_aggregate_by_key_scheduler(self) -> None:
+        """Verify aggregate_by_key forwards the interval scheduler."""
+        scheduler = TestScheduler()
+        source = scheduler.create_hot_observable(
+            ReactiveTest.on_next(210, 1),
+            ReactiveTest.on_next(260, 2),
+            ReactiveTest.on_completed(270),
+        )
+
+        results = scheduler.start(
+            lambda: source.aggregate_by_key(
+                lambda x: x % 2,
+                0,
+                lambda acc, x: acc + x,
+                "on_interval",
+                50,
+                scheduler=scheduler,
+            )
+        )
+
+        assert results.messages == [
+            ReactiveTest.on_next(250, {1: 1}),
+            ReactiveTest.on_next(270, {0: 2}),
+            ReactiveTest.on_completed(270),
+        ]
+
+
+class TestRollingMethodChaining:
+    """Tests for rolling() method."""
+
+    def test_rolling_equivalence(self) -> None:
+        """Verify rolling fluent and functional styles are equivalent."""
+        source: Observable[int] = rx.of(1, 2, 3, 4, 5)
+
+        fluent_result = source.rolling("sum", count=2)
+        pipe_result = source.pipe(ops.rolling("sum", count=2))
+
+        fluent_values: list[int] = []
+        pipe_values: list[int] = []
+
+        fluent_result.subscribe(on_next=fluent_values.append)
+        pipe_result.subscribe(on_next=pipe_values.append)
+
+        assert fluent_values == pipe_values == [1, 3, 5, 7, 9]
+
+    def test_rolling_scheduler(self) -> None:
+        """Verify rolling forwards the time window scheduler."""
+        scheduler = TestScheduler()
+        source = scheduler.create_hot_observable(
+            ReactiveTest.on_next(210, 1),
+            ReactiveTest.on_next(220, 2),
+            ReactiveTest.on_next(250, 3),
+            ReactiveTest.on_completed(260),
+        )
+
+        results = scheduler.start(
+            lambda: source.rolling("sum", timespan=20, scheduler=scheduler)
+        )
+
+        assert results.messages == [
+            ReactiveTest.on_next(210, 1),
+            ReactiveTest.on_next(220, 3),
+            ReactiveTest.on_next(250, 3),
+            ReactiveTest.on_completed(260),
+        ]
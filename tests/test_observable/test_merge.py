@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 import reactivex
@@ -865,3 +866,25 @@ class TestMerge(unittest.TestCase):
             on_completed(360),
         ]
         assert xs.subscriptions == [subscribe(200, 360)]
+
+    def test_merge_concurrent_producers(self):
+        threads = 8
+        count = 1000
+        subjects = [reactivex.subject.Subject() for _ in range(threads)]
+        values = []
+        completed = threading.Event()
+        reactivex.merge(*subjects).subscribe(values.append, on_completed=completed.set)
+
+        def produce(n):
+            for i in range(count):
+                subjects[n].on_next(n * count + i)
+            subjects[n].on_completed()
+
+        workers = [threading.Thread(target=produce, args=(n,)) for n in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert completed.is_set()
+        assert sorted(values) == list(range(threads * count))
@@ -0,0 +1,158 @@
+import unittest
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException, QueueOverflowError
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestRateLimit(unittest.TestCase):
+    def test_rate_limit_burst_then_spaced(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1),
+            on_next(210, 2),
+            on_next(211, 3),
+            on_next(212, 4),
+            on_next(213, 5),
+            on_completed(215),
+        )
+
+        def create():
+            return xs.pipe(ops.rate_limit(0.25, burst=2))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, 2),
+            on_next(211, 3),
+            on_next(214, 4),
+            on_next(218, 5),
+            on_completed(218),
+        ]
+        assert xs.subscriptions == [subscribe(200, 215)]
+
+    def test_rate_limit_refills_while_idle(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(211, 2),
+            on_next(300, 3),
+            on_next(301, 4),
+            on_completed(400),
+        )
+
+        def create():
+            return xs.pipe(ops.rate_limit(0.25, burst=2))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, 1),
+            on_next(211, 2),
+            on_next(300, 3),
+            on_next(301, 4),
+            on_completed(400),
+        ]
+
+    def test_rate_limit_overflow_error(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(211, 2),
+            on_next(212, 3),
+            on_completed(250),
+        )
+
+        def create():
+            return xs.pipe(ops.rate_limit(0.25, max_queue=1))
+
+        results = scheduler.start(create)
+        assert results.messages[0] == on_next(210, 1)
+        assert results.messages[1].time == 212
+        assert isinstance(results.messages[1].value.exception, QueueOverflowError)
+        assert len(results.messages) == 2
+        assert xs.subscriptions == [subscribe(200, 212)]
+
+    def test_rate_limit_overflow_drop_newest(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(211, 2),
+            on_next(212, 3),
+            on_completed(250),
+        )
+
+        def create():
+            return xs.pipe(ops.rate_limit(0.25, max_queue=1, overflow="drop_newest"))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, 1),
+            on_next(214, 2),
+            on_completed(250),
+        ]
+
+    def test_rate_limit_overflow_drop_oldest(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(211, 2),
+            on_next(212, 3),
+            on_completed(250),
+        )
+
+        def create():
+            return xs.pipe(ops.rate_limit(0.25, max_queue=1, overflow="drop_oldest"))
+
+        results = scheduler.start(create)
+        assert results.messages == [
+            on_next(210, 1),
+            on_next(214, 3),
+            on_completed(250),
+        ]
+
+    def test_rate_limit_error_discards_queue(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(211, 2),
+            on_error(212, ex),
+        )
+
+        def create():
+            return xs.pipe(ops.rate_limit(0.25))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(210, 1), on_error(212, ex)]
+
+    def test_rate_limit_dispose(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(211, 2),
+            on_next(212, 3),
+        )
+
+        def create():
+            return xs.pipe(ops.rate_limit(0.25))
+
+        results = scheduler.start(create, disposed=215)
+        assert results.messages == [on_next(210, 1), on_next(214, 2)]
+
+    def test_rate_limit_invalid_arguments(self):
+        with self.assertRaises(ArgumentOutOfRangeException):
+            reactivex.empty().pipe(ops.rate_limit(0))
+        with self.assertRaises(ArgumentOutOfRangeException):
+            reactivex.empty().pipe(ops.rate_limit(1.0, burst=0))
+        with self.assertRaises(ArgumentOutOfRangeException):
+            reactivex.empty().pipe(ops.rate_limit(1.0, max_queue=-1))
+        with self.assertRaises(ValueError):
+            reactivex.empty().pipe(ops.rate_limit(1.0, overflow="bogus"))  # type: ignore
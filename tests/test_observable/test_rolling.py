@@ -0,0 +1,141 @@
+import random
+import statistics
+import unittest
+
+import reactivex
+from reactivex import operators as ops
+from reactivex.internal.exceptions import ArgumentOutOfRangeException
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestRolling(unittest.TestCase):
+    def test_rolling_sum_count(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1),
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_next(250, 5),
+            on_completed(260),
+        )
+
+        def create():
+            return xs.pipe(ops.rolling("sum", count=3))
+
+        results = scheduler.start(create=create)
+        assert results.messages == [
+            on_next(210, 1),
+            on_next(220, 3),
+            on_next(230, 6),
+            on_next(240, 9),
+            on_next(250, 12),
+            on_completed(260),
+        ]
+        assert xs.subscriptions == [subscribe(200, 260)]
+
+    def test_rolling_max_timespan(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 5),
+            on_next(220, 1),
+            on_next(230, 3),
+            on_next(250, 2),
+            on_next(300, 1),
+            on_completed(310),
+        )
+
+        def create():
+            return xs.pipe(ops.rolling("max", timespan=30))
+
+        results = scheduler.start(create=create)
+        assert results.messages == [
+            on_next(210, 5),
+            on_next(220, 5),
+            on_next(230, 5),
+            on_next(250, 3),
+            on_next(300, 1),
+            on_completed(310),
+        ]
+
+    def test_rolling_error(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_error(220, ex),
+        )
+
+        def create():
+            return xs.pipe(ops.rolling("mean", count=2))
+
+        results = scheduler.start(create=create)
+        assert results.messages == [on_next(210, 1), on_error(220, ex)]
+
+    def test_rolling_combine_throws(self):
+        ex = "ex"
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_completed(230),
+        )
+
+        def combine(a, b):
+            raise Exception(ex)
+
+        def create():
+            return xs.pipe(ops.rolling(combine, count=2))
+
+        results = scheduler.start(create=create)
+        assert results.messages == [on_next(210, 1), on_error(220, ex)]
+
+    def test_rolling_matches_naive(self):
+        rnd = random.Random(42)
+        values = [rnd.randint(-100, 100) for _ in range(500)]
+        count = 7
+        windows = [values[max(0, i - count + 1) : i + 1] for i in range(len(values))]
+        expected = {
+            "sum": [sum(w) for w in windows],
+            "mean": [statistics.mean(w) for w in windows],
+            "min": [min(w) for w in windows],
+            "max": [max(w) for w in windows],
+            "var": [statistics.pvariance(w) for w in windows],
+        }
+
+        for agg, expect in expected.items():
+            res = []
+            reactivex.from_(values).pipe(ops.rolling(agg, count=count)).subscribe(
+                res.append
+            )
+            for actual, wanted in zip(res, expect, strict=True):
+                self.assertAlmostEqual(actual, wanted, places=6, msg=agg)
+
+        res = []
+        reactivex.from_(values).pipe(
+            ops.map(lambda x: (x,)),
+            ops.rolling(lambda a, b: a + b, count=count),
+        ).subscribe(res.append)
+        assert res == [tuple(w) for w in windows]
+
+    def test_rolling_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            reactivex.empty().pipe(ops.rolling("sum"))
+
+        with self.assertRaises(ValueError):
+            reactivex.empty().pipe(ops.rolling("sum", count=3, timespan=1.0))
+
+        with self.assertRaises(ArgumentOutOfRangeException):
+            reactivex.empty().pipe(ops.rolling("sum", count=0))
+
+        with self.assertRaises(ValueError):
+            reactivex.empty().pipe(ops.rolling("median", count=3))
@@ -0,0 +1,187 @@
+import unittest
+from typing import Any
+
+import reactivex
+from reactivex import Observable, abc
+from reactivex import operators as ops
+from reactivex.observable import ScalarObservable
+from reactivex.scheduler import ImmediateScheduler
+from reactivex.subject import Subject
+from reactivex.testing import ReactiveTest, TestScheduler
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+
+
+def scalar(*values: Any, error: Exception | None = None) -> Observable[Any]:
+    """A scalar observable that fails the test if it is subscribed to."""
+
+    def subscribe(
+        observer: abc.ObserverBase[Any], scheduler: abc.SchedulerBase | None = None
+    ) -> abc.DisposableBase:
+        raise AssertionError("scalar observable was subscribed to")
+
+    return ScalarObservable(subscribe, values, error)
+
+
+class TestScalarObservable(unittest.TestCase):
+    def test_factories(self) -> None:
+        assert isinstance(reactivex.return_value(1), ScalarObservable)
+        assert isinstance(reactivex.just(1), ScalarObservable)
+        assert isinstance(reactivex.empty(), ScalarObservable)
+        assert isinstance(reactivex.throw(ValueError()), ScalarObservable)
+        assert isinstance(reactivex.of(1, 2, 3), ScalarObservable)
+
+        immediate = ImmediateScheduler()
+        assert not isinstance(reactivex.return_value(1, immediate), ScalarObservable)
+        assert not isinstance(reactivex.empty(immediate), ScalarObservable)
+        assert not isinstance(reactivex.of(*range(100)), ScalarObservable)
+        assert not isinstance(reactivex.from_iterable([1]), ScalarObservable)
+
+    def test_subscribe_unchanged(self) -> None:
+        scheduler = TestScheduler()
+        results = scheduler.start(lambda: reactivex.of(1, 2))
+        assert results.messages == [on_next(200, 1), on_next(200, 2), on_completed(200)]
+
+    def test_flat_map(self) -> None:
+        inner = {1: scalar(10), 2: scalar(), 3: scalar(30, 31)}
+
+        results: list[int] = []
+        reactivex.from_iterable([1, 2, 3]).pipe(
+            ops.flat_map(inner.__getitem__)
+        ).subscribe(results.append)
+        assert results == [10, 30, 31]
+
+    def test_merge_all_error(self) -> None:
+        error = ValueError("ex")
+        subject: Subject[Observable[int]] = Subject()
+        errors: list[Exception] = []
+        subject.pipe(ops.merge_all()).subscribe(on_error=errors.append)
+
+        subject.on_next(scalar(error=error))
+        assert errors == [error]
+
+    def test_merge_max_concurrent(self) -> None:
+        subject: Subject[Observable[int]] = Subject()
+        inner: Subject[int] = Subject()
+        results: list[int] = []
+        completed: list[bool] = []
+        subject.pipe(ops.merge(max_concurrent=1)).subscribe(
+            results.append, on_completed=lambda: completed.append(True)
+        )
+
+        subject.on_next(scalar(1))
+        subject.on_next(inner)
+        subject.on_next(scalar(2, 3))
+        subject.on_next(scalar(4))
+        subject.on_completed()
+        inner.on_next(5)
+        assert results == [1, 5]
+        assert not completed
+
+        inner.on_completed()
+        assert results == [1, 5, 2, 3, 4]
+        assert completed == [True]
+
+    def test_concat(self) -> None:
+        xs: Subject[int] = Subject()
+        results: list[int] = []
+        completed: list[bool] = []
+        reactivex.concat(scalar(1), xs, scalar(), scalar(3, 4)).subscribe(
+            results.append, on_completed=lambda: completed.append(True)
+        )
+
+        assert results == [1]
+        xs.on_next(2)
+        xs.on_completed()
+        assert results == [1, 2, 3, 4]
+        assert completed == [True]
+
+    def test_concat_error(self) -> None:
+        error = ValueError("ex")
+        results: list[int] = []
+        errors: list[Exception] = []
+        reactivex.concat(scalar(1), scalar(error=error), scalar(2)).subscribe(
+            results.append, errors.append
+        )
+
+        assert results == [1]
+        assert errors == [error]
+
+    def test_repeat_disposable(self) -> None:
+        xs = reactivex.of(1, 2).pipe(ops.repeat(), ops.take(5), ops.to_list())
+        assert xs.run() == [1, 2, 1, 2, 1]
+
+    def test_merge_ordering(self) -> None:
+        # Scalar inner sequences are emitted before the scheduled values
+        # of sequences subscribed earlier in the same trampoline run
+        results: list[int] = []
+        reactivex.of(1, 2).pipe(
+            ops.flat_map(
+                lambda x: reactivex.merge(
+                    reactivex.just(x), reactivex.from_iterable([100 + x, 200 + x])
+                )
+            )
+        ).subscribe(results.append)
+        assert results == [1, 2, 101, 201, 102, 202]
+
+        results.clear()
+        reactivex.merge(
+            reactivex.concat(reactivex.just(1), reactivex.just(2)),
+            reactivex.from_iterable([3, 4]),
+        ).subscribe(results.append)
+        assert results == [1, 3, 4, 2]
+
+    def test_switch_latest_subscribes(self) -> None:
+        xs = reactivex.of(1, 2, 3).pipe(
+            ops.map(reactivex.just), ops.switch_latest(), ops.to_list()
+        )
+        assert xs.run() == [3]
+
+    def test_zip(self) -> None:
+        xs: Subject[int] = Subject()
+        results: list[tuple[int, str]] = []
+        completed: list[bool] = []
+        reactivex.zip(xs, scalar("a", "b")).subscribe(
+            results.append, on_completed=lambda: completed.append(True)
+        )
+
+        xs.on_next(1)
+        xs.on_next(2)
+        assert results == [(1, "a"), (2, "b")]
+        assert completed == [True]
+
+    def test_zip_error(self) -> None:
+        error = ValueError("ex")
+        errors: list[Exception] = []
+        reactivex.zip(Subject(), scalar(error=error)).subscribe(on_error=errors.append)
+
+        assert errors == [error]
+
+    def test_subscribe_scheduler_is_used(self) -> None:
+        schedulers: list[abc.SchedulerBase | None] = []
+
+        def subscribe(
+            observer: abc.ObserverBase[int],
+            scheduler: abc.SchedulerBase | None = None,
+        ) -> abc.DisposableBase:
+            schedulers.append(scheduler)
+            return reactivex.just(1).subscribe(observer, scheduler=scheduler)
+
+        ys = ScalarObservable(subscribe, (1,))
+
+        def create() -> Observable[Any]:
+            xs = reactivex.from_iterable([0])
+            return reactivex.zip(
+                xs.pipe(ops.flat_map(lambda _: ys)),
+                xs.pipe(ops.concat_map(lambda _: ys)),
+                xs.pipe(ops.map(lambda _: ys), ops.switch_latest()),
+                reactivex.concat(ys),
+                ys,
+            )
+
+        scheduler = TestScheduler()
+        results = scheduler.start(create)
+        assert results.messages == [on_next(200, (1, 1, 1, 1, 1)), on_completed(200)]
+        assert schedulers == [scheduler] * 5
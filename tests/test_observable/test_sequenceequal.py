@@ -1,6 +1,8 @@
 import unittest
 
+import reactivex
 from reactivex import operators as ops
+from reactivex.scheduler import ImmediateScheduler
 from reactivex.testing import ReactiveTest, TestScheduler
 
 on_next = ReactiveTest.on_next
@@ -562,3 +564,10 @@ class TestSequenceEqual(unittest.TestCase):
 
         assert res.messages == [on_error(310, ex)]
         assert xs.subscriptions == [subscribe(200, 310)]
+
+    def test_sequence_equal_large_backlog(self):
+        xs = reactivex.from_iterable(range(200_000), ImmediateScheduler())
+        ys = reactivex.from_iterable(range(200_000), ImmediateScheduler())
+        values = []
+        xs.pipe(ops.sequence_equal(ys)).subscribe(values.append)
+        assert values == [True]
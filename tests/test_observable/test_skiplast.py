@@ -1,6 +1,8 @@
 import unittest
 
+import reactivex
 from reactivex import operators as ops
+from reactivex.scheduler import ImmediateScheduler
 from reactivex.testing import ReactiveTest, TestScheduler
 
 on_next = ReactiveTest.on_next
@@ -294,3 +296,10 @@ class TestSkipLast(unittest.TestCase):
             on_next(590, 6),
         ]
         assert xs.subscriptions == [subscribe(200, 1000)]
+
+    def test_skip_last_large_count(self):
+        values = []
+        reactivex.from_iterable(range(200_000), ImmediateScheduler()).pipe(
+            ops.skip_last(100_000)
+        ).subscribe(values.append)
+        assert values == list(range(100_000))
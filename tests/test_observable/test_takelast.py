@@ -1,6 +1,8 @@
 import unittest
 
+import reactivex
 from reactivex import operators as ops
+from reactivex.scheduler import ImmediateScheduler
 from reactivex.testing import ReactiveTest, TestScheduler
 
 on_next = ReactiveTest.on_next
@@ -223,3 +225,10 @@ class TestTakeLast(unittest.TestCase):
 
         assert results.messages == []
         assert xs.subscriptions == [subscribe(200, 1000)]
+
+    def test_take_last_large_count(self):
+        values = []
+        reactivex.from_iterable(range(200_000), ImmediateScheduler()).pipe(
+            ops.take_last(100_000)
+        ).subscribe(values.append)
+        assert values == list(range(100_000, 200_000))
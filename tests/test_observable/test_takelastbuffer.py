@@ -1,6 +1,8 @@
 import unittest
 
+import reactivex
 from reactivex import operators as ops
+from reactivex.scheduler import ImmediateScheduler
 from reactivex.testing import ReactiveTest, TestScheduler
 
 on_next = ReactiveTest.on_next
@@ -184,6 +186,13 @@ class TestTakeLastBuffer(unittest.TestCase):
         assert [on_next(650, predicate), on_completed(650)] == res.messages
         assert xs.subscriptions == [subscribe(200, 650)]
 
+    def test_take_last_buffer_large_count(self):
+        values = []
+        reactivex.from_iterable(range(200_000), ImmediateScheduler()).pipe(
+            ops.take_last_buffer(100_000)
+        ).subscribe(values.append)
+        assert values == [list(range(100_000, 200_000))]
+
 
 # def test_Take_last_buffer_Three_Error():
 #     var ex, res, scheduler, xs
@@ -77,3 +77,46 @@ class TestThrottleWithTimeoutMethodChaining:
 
         # throttle_with_timeout is an alias for debounce
         assert fluent_values == pipe_values
+
+
+class TestThrottleFirstByKeyMethodChaining:
+    """Tests for throttle_first_by_key() method."""
+
+    def test_throttle_first_by_key_equivalence(self) -> None:
+        """Verify throttle_first_by_key fluent and functional styles are equivalent."""
+        scheduler = ImmediateScheduler()
+        source: Observable[int] = rx.of(1, 2, 3, 4, 5)
+
+        fluent_result: Observable[int] = source.throttle_first_by_key(
+            lambda x: x % 2, 100, scheduler=scheduler
+        )
+        pipe_result: Observable[int] = source.pipe(
+            ops.throttle_first_by_key(lambda x: x % 2, 100, scheduler=scheduler)
+        )
+
+        fluent_values: list[int] = []
+        pipe_values: list[int] = []
+
+        fluent_result.subscribe(on_next=fluent_values.append)
+        pipe_result.subscribe(on_next=pipe_values.append)
+
+        assert fluent_values == pipe_values == [1, 2]
+
+
+class TestRateLimitMethodChaining:
+    """Tests for rate_limit() method."""
+
+    def test_rate_limit_equivalence(self) -> None:
+        """Verify rate_limit fluent and functional styles are equivalent."""
+        source: Observable[int] = rx.of(1, 2, 3)
+
+        fluent_result: Observable[int] = source.rate_limit(1.0, burst=3)
+        pipe_result: Observable[int] = source.pipe(ops.rate_limit(1.0, burst=3))
+
+        fluent_values: list[int] = []
+        pipe_values: list[int] = []
+
+        fluent_result.subscribe(on_next=fluent_values.append)
+        pipe_result.subscribe(on_next=pipe_values.append)
+
+        assert fluent_values == pipe_values == [1, 2, 3]
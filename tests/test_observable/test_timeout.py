@@ -320,3 +320,28 @@ class TestTimeout(unittest.TestCase):
         assert results.messages == [on_next(310, 1), on_next(350, 2)]
         assert xs.subscriptions == [subscribe(200, 400)]
         assert ys.subscriptions == [subscribe(400, 1000)]
+
+    def test_timeout_reuses_timer(self):
+        scheduler = TestScheduler()
+        timers = [0]
+        schedule_relative = scheduler.schedule_relative
+
+        def counting_schedule_relative(duetime, action, state=None):
+            timers[0] += 1
+            return schedule_relative(duetime, action, state)
+
+        scheduler.schedule_relative = counting_schedule_relative
+        xs = scheduler.create_hot_observable(
+            *[on_next(201 + i, i) for i in range(100)], on_completed(340)
+        )
+
+        def create():
+            return xs.pipe(ops.timeout(50))
+
+        results = scheduler.start(create)
+
+        assert len(results.messages) == 101
+        assert results.messages[-1] == on_completed(340)
+        # The timer is re-armed once per timeout period during the burst,
+        # instead of once per element.
+        assert timers[0] <= 5
@@ -9,6 +9,7 @@ from typing import Any
 import reactivex as rx
 from reactivex import Observable
 from reactivex import operators as ops
+from reactivex.metrics import Histogram
 from reactivex.scheduler import TimeoutScheduler
 
 
@@ -459,6 +460,29 @@ class TestAsObservableOperator:
         assert result is not source
 
 
+class TestLatencyOperators:
+    """Tests for the stamp_latency() and measure_latency() methods."""
+
+    def test_latency_equivalence(self) -> None:
+        """Verify latency fluent and functional styles are equivalent."""
+        fluent_histogram = Histogram()
+        pipe_histogram = Histogram()
+        source: Observable[int] = rx.of(1, 2, 3)
+
+        fluent_result = source.stamp_latency().measure_latency(fluent_histogram)
+        pipe_result = source.pipe(
+            ops.stamp_latency(), ops.measure_latency(pipe_histogram)
+        )
+
+        fluent_values: list[int] = []
+        pipe_values: list[int] = []
+        fluent_result.subscribe(on_next=fluent_values.append)
+        pipe_result.subscribe(on_next=pipe_values.append)
+
+        assert fluent_values == pipe_values == [1, 2, 3]
+        assert fluent_histogram.count == pipe_histogram.count == 3
+
+
 class TestComplexUtilityChaining:
     """Tests for complex chaining with utility operators."""
 
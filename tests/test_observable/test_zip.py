@@ -2,6 +2,7 @@ import unittest
 
 import reactivex
 from reactivex import operators as ops
+from reactivex.internal import ArgumentOutOfRangeException, QueueOverflowError
 from reactivex.testing import ReactiveTest, TestScheduler
 
 on_next = ReactiveTest.on_next
@@ -485,3 +486,94 @@ class TestZip(unittest.TestCase):
             on_next(240, 7),
         ]
         assert n1.subscriptions == [subscribe(200, 1000)]
+
+    def test_zip_many_sources(self):
+        sources = [reactivex.of(i, i + 1, i + 2) for i in range(300)]
+        values = []
+        reactivex.zip(*sources).subscribe(values.append)
+
+        assert values == [
+            tuple(range(300)),
+            tuple(range(1, 301)),
+            tuple(range(2, 302)),
+        ]
+
+    def test_zip_max_backlog_error(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_completed(300),
+        )
+        ys = scheduler.create_hot_observable(on_next(240, "a"), on_completed(300))
+
+        def create():
+            return xs.pipe(ops.zip(ys, max_backlog=2))
+
+        results = scheduler.start(create)
+
+        assert len(results.messages) == 1
+        assert results.messages[0].time == 230
+        assert isinstance(results.messages[0].value.exception, QueueOverflowError)
+        assert xs.subscriptions == [subscribe(200, 230)]
+        assert ys.subscriptions == [subscribe(200, 230)]
+
+    def test_zip_max_backlog_drop_newest(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_completed(300),
+        )
+        ys = scheduler.create_hot_observable(
+            on_next(240, "a"),
+            on_next(250, "b"),
+            on_next(260, "c"),
+            on_completed(300),
+        )
+
+        def create():
+            return xs.pipe(ops.zip(ys, max_backlog=2, overflow="drop_newest"))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [
+            on_next(240, (1, "a")),
+            on_next(250, (2, "b")),
+            on_completed(300),
+        ]
+
+    def test_zip_max_backlog_drop_oldest(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_completed(300),
+        )
+        ys = scheduler.create_hot_observable(
+            on_next(240, "a"),
+            on_next(250, "b"),
+            on_next(260, "c"),
+            on_completed(300),
+        )
+
+        def create():
+            return xs.pipe(ops.zip(ys, max_backlog=2, overflow="drop_oldest"))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [
+            on_next(240, (2, "a")),
+            on_next(250, (3, "b")),
+            on_completed(300),
+        ]
+
+    def test_zip_invalid_arguments(self):
+        with self.assertRaises(ArgumentOutOfRangeException):
+            reactivex.zip(reactivex.never(), max_backlog=0)
+
+        with self.assertRaises(ValueError):
+            reactivex.zip(reactivex.never(), overflow="bogus")  # type: ignore